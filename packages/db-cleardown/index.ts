@@ -24,8 +24,9 @@ const cleardownDatabase = async () => {
         "serviceJourneyPatternLinks",
         "serviceJourneyPatterns",
         "services",
+        "serviceTracks",
         "stops",
-        "tracks",
+        "trackGeometries",
         "vehicleJourneys",
     ];
 
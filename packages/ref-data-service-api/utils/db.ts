@@ -4,6 +4,7 @@ import { PermitStatus } from "@create-disruptions-data/shared-ts/roadwork.zod";
 import { logger } from "@create-disruptions-data/shared-ts/utils/logger";
 import dayjs from "dayjs";
 import { Kysely, sql } from "kysely";
+import { decodePolyline } from "./polyline";
 
 // Type definition
 export type StopsQueryInput = {
@@ -493,14 +494,19 @@ export const getServiceStops = async (
     const service = getMostRelevantService(services);
 
     if (input.useTracks) {
-        const tracks = await dbClient
-            .selectFrom("tracks")
-            .select(["operatorServiceId as serviceId", "longitude", "latitude"])
-            .where("operatorServiceId", "=", service.id)
-            .execute();
+        const serviceTrack = await dbClient
+            .selectFrom("serviceTracks")
+            .innerJoin("trackGeometries", "trackGeometries.geometryHash", "serviceTracks.geometryHash")
+            .select(["serviceTracks.operatorServiceId", "trackGeometries.polyline"])
+            .where("serviceTracks.operatorServiceId", "=", service.id)
+            .executeTakeFirst();
 
-        if (tracks && tracks.length > 0) {
-            return tracks;
+        if (serviceTrack && serviceTrack.polyline.length > 0) {
+            return decodePolyline(serviceTrack.polyline).map(([longitude, latitude]) => ({
+                serviceId: serviceTrack.operatorServiceId,
+                longitude: longitude.toString(),
+                latitude: latitude.toString(),
+            }));
         }
     }
 
@@ -0,0 +1,23 @@
+import { describe, expect, it } from "vitest";
+import { decodePolyline } from "./polyline";
+
+describe("decodePolyline", () => {
+    it("decodes the reference polyline at five decimal places", () => {
+        expect(decodePolyline("_p~iF~ps|U_ulLnnqC_mqNvxq`@", 5)).toEqual([
+            [-120.2, 38.5],
+            [-120.95, 40.7],
+            [-126.453, 43.252],
+        ]);
+    });
+
+    it("decodes a track written by the TXC uploader", () => {
+        expect(decodePolyline("mvwpeBv}luC{GmI")).toEqual([
+            [-2.464748, 53.768567],
+            [-2.464581, 53.768709],
+        ]);
+    });
+
+    it("returns no points for an empty polyline", () => {
+        expect(decodePolyline("")).toEqual([]);
+    });
+});
@@ -0,0 +1,38 @@
+// Matches POLYLINE_PRECISION in packages/txc-uploader/track_polyline.py
+export const POLYLINE_PRECISION = 6;
+
+/**
+ * Decode a Google encoded polyline of latitude, longitude pairs, as written
+ * to track_geometries by the TXC uploader, into [longitude, latitude] points.
+ */
+export const decodePolyline = (polyline: string, precision = POLYLINE_PRECISION): [number, number][] => {
+    const factor = 10 ** precision;
+    const values: number[] = [];
+    let value = 0;
+    let shift = 0;
+
+    for (let index = 0; index < polyline.length; index++) {
+        const chunk = polyline.charCodeAt(index) - 63;
+        // Multiplying rather than shifting keeps values above 2^31 exact
+        value += (chunk & 0x1f) * 2 ** shift;
+        shift += 5;
+
+        if (chunk < 0x20) {
+            values.push(value % 2 === 1 ? -(value + 1) / 2 : value / 2);
+            value = 0;
+            shift = 0;
+        }
+    }
+
+    const points: [number, number][] = [];
+    let latitude = 0;
+    let longitude = 0;
+
+    for (let index = 0; index + 1 < values.length; index += 2) {
+        latitude += values[index];
+        longitude += values[index + 1];
+        points.push([longitude / factor, latitude / factor]);
+    }
+
+    return points;
+};
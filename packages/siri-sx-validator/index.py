@@ -1,11 +1,14 @@
+import io
 import logging
 import os
-import uuid
+from concurrent.futures import ThreadPoolExecutor
 from urllib.error import URLError
 from urllib.parse import unquote_plus
 
 import boto3
 import xmlschema
+from aws_lambda_powertools import Metrics
+from aws_lambda_powertools.metrics import MetricUnit
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
@@ -18,17 +21,38 @@ xsd_path = os.path.dirname(os.path.realpath(__file__)) + siri_path
 
 
 s3_client = boto3.client("s3")
-cloudwatch_resource = boto3.resource("cloudwatch")
 
 metric_namespace = os.getenv("METRIC_NAMESPACE")
 
+# Buffered and written as embedded metric format when main returns
+metrics = Metrics(namespace=metric_namespace)
+
+# Objects are fetched as concurrent ranged GETs of this size
+download_part_size = 8 * 1024 * 1024
+download_max_concurrency = 8
+
 
 def put_cloudwatch_metric(metric_name, metric_value):
-    metric = cloudwatch_resource.Metric(metric_namespace, metric_name)
-    metric.put_data(
-        Namespace=metric_namespace,
-        MetricData=[{"MetricName": metric_name, "Value": metric_value}],
-    )
+    metrics.add_metric(name=metric_name, unit=MetricUnit.NoUnit, value=metric_value)
+
+
+def fetch_range(bucket, key, start, end):
+    response = s3_client.get_object(Bucket=bucket, Key=key, Range=f"bytes={start}-{end}")
+    return response["Body"].read()
+
+
+def read_s3_object(bucket, key):
+    size = s3_client.head_object(Bucket=bucket, Key=key)["ContentLength"]
+    starts = range(0, size, download_part_size)
+
+    with ThreadPoolExecutor(max_workers=download_max_concurrency) as executor:
+        parts = executor.map(
+            lambda start: fetch_range(
+                bucket, key, start, min(start + download_part_size, size) - 1
+            ),
+            starts,
+        )
+        return b"".join(parts)
 
 
 def read_xsd(schema_path):
@@ -54,14 +78,14 @@ def read_xsd(schema_path):
     return siri_schema
 
 
-def validate_xml(download_path, schema_path):
+def validate_xml(source, schema_path):
     try:
         siri_schema = read_xsd(schema_path)
         if siri_schema is None:
             raise ValueError
         else:
             # Validate the XML data against the XSD
-            siri_schema.validate(download_path)
+            siri_schema.validate(source)
 
     except xmlschema.XMLSchemaChildrenValidationError as sub_element_errors:
         logger.error("Error in Sub elements of the XML.")
@@ -88,21 +112,21 @@ def validate_xml(download_path, schema_path):
         raise
 
 
+@metrics.log_metrics
 def main(event, context):
     for record in event["Records"]:
         source_bucket = record["s3"]["bucket"]["name"]
         key = unquote_plus(record["s3"]["object"]["key"])
-        tmpkey = key.replace("/", "")
-        download_path = f"/tmp/{uuid.uuid4()}{tmpkey}"
-        s3_client.download_file(source_bucket, key, download_path)
+        # The file is small enough to validate and re-upload from memory
+        body = read_s3_object(source_bucket, key)
 
         try:
             logger.info("Starting validation...")
-            validate_xml(download_path, xsd_path)
+            validate_xml(io.BytesIO(body), xsd_path)
 
             logger.info("Siri SX XML is valid, uploading to S3...")
-            s3_client.upload_file(
-                download_path,
+            s3_client.upload_fileobj(
+                io.BytesIO(body),
                 os.getenv("SIRI_SX_BUCKET_NAME"),
                 "SIRI-SX.xml",
                 ExtraArgs={
@@ -120,7 +144,3 @@ def main(event, context):
             )
 
             put_cloudwatch_metric(os.getenv("VALIDATION_FAILURE_METRIC"), 1)
-
-        finally:
-            if os.path.isfile(download_path):
-                os.remove(download_path)
@@ -21,7 +21,8 @@ const tables: TableKey[] = [
     { table: "serviceAdminAreaCodes", newTable: "serviceAdminAreaCodesNew" },
     { table: "localities", newTable: "localitiesNew", needsCheck: true },
     { table: "vehicleJourneys", newTable: "vehicleJourneysNew" },
-    { table: "tracks", newTable: "tracksNew" },
+    { table: "serviceTracks", newTable: "serviceTracksNew" },
+    { table: "trackGeometries", newTable: "trackGeometriesNew" },
     { table: "nptgAdminAreas", newTable: "nptgAdminAreasNew", needsCheck: true },
 ];
 
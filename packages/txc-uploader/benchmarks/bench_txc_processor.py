@@ -0,0 +1,208 @@
+"""pytest-benchmark suite for the stages of txc_processor on synthetic TXC files.
+
+Each benchmark runs once per file size in TXC_BENCHMARK_VEHICLE_JOURNEYS, a
+comma separated list of vehicle journey counts. The database is replaced by
+benchmarks.fake_database, so write_to_database measures only the Python
+side of a write. Peak traced memory of one extra run is stored with every
+result as extra_info["peak_traced_mb"].
+
+The file is not collected by the unit test run. Run from
+packages/txc-uploader and save the results as a baseline with:
+
+    TXC_BENCHMARK_VEHICLE_JOURNEYS=1000,100000,500000 \\
+        python -m pytest benchmarks/bench_txc_processor.py --benchmark-autosave
+
+Saved runs are kept under .benchmarks/ with the commit they were taken at.
+Compare the last two, time and memory, with:
+
+    python -m benchmarks.compare_baselines
+"""
+
+import logging
+import os
+import tracemalloc
+
+import pytest
+from aws_lambda_powertools import Metrics
+
+from benchmarks.fake_database import FakeConnection
+from benchmarks.operating_profile_benchmark import bank_holidays
+from benchmarks.synthetic_txc import generate_synthetic_txc_file
+from txc_document import TxcDocument
+from txc_lxml import extract_txc
+from txc_parser import parse_txc, parse_txc_for_streaming
+from txc_processor import (
+    METRIC_NAMESPACE,
+    format_vehicle_journeys,
+    get_lines_for_service,
+    noc_cache,
+    track_geometry_cache,
+    write_to_database,
+)
+
+VEHICLE_JOURNEY_COUNTS = [
+    int(count)
+    for count in os.getenv("TXC_BENCHMARK_VEHICLE_JOURNEYS", "1000,10000").split(",")
+]
+
+ROUNDS = int(os.getenv("TXC_BENCHMARK_ROUNDS", "3"))
+
+FILE_SHAPE = {
+    "operators": 2,
+    "services_per_operator": 10,
+    "lines_per_service": 2,
+    "journey_patterns_per_service": 4,
+    "sections_per_journey_pattern": 3,
+    "links_per_section": 5,
+    "track_points_per_link": 10,
+}
+
+NOC_CODES = [f"SYN{operator}" for operator in range(FILE_SHAPE["operators"])]
+
+logger = logging.getLogger("txc_benchmark")
+logger.disabled = True
+
+
+def measure_peak_traced_mb(function, args) -> float:
+    tracemalloc.start()
+    try:
+        function(*args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return round(peak / 1024 / 1024, 2)
+
+
+def run_benchmark(benchmark, function, setup):
+    """Time function over ROUNDS fresh sets of arguments from setup and
+    record the peak memory of one more run alongside the timings."""
+    benchmark.extra_info["peak_traced_mb"] = measure_peak_traced_mb(function, setup())
+
+    return benchmark.pedantic(
+        function, setup=lambda: (setup(), {}), rounds=ROUNDS, iterations=1
+    )
+
+
+@pytest.fixture(scope="session")
+def synthetic_files(tmp_path_factory):
+    return {}
+
+
+@pytest.fixture(params=VEHICLE_JOURNEY_COUNTS, ids=lambda count: f"{count}vj")
+def txc_file(request, synthetic_files, tmp_path_factory):
+    vehicle_journeys = request.param
+
+    if vehicle_journeys not in synthetic_files:
+        synthetic_files[vehicle_journeys] = generate_synthetic_txc_file(
+            tmp_path_factory.mktemp("txc") / f"synthetic_{vehicle_journeys}.xml",
+            vehicle_journeys=vehicle_journeys,
+            **FILE_SHAPE,
+        )
+
+    return synthetic_files[vehicle_journeys]
+
+
+@pytest.fixture
+def parsed_txc(txc_file):
+    return parse_txc(txc_file)
+
+
+@pytest.fixture
+def metrics():
+    metrics = Metrics(namespace=METRIC_NAMESPACE)
+    yield metrics
+    metrics.clear_metrics()
+
+
+@pytest.mark.parametrize("parser", [parse_txc, extract_txc], ids=["xmltodict", "lxml"])
+def test_parse(benchmark, txc_file, parser):
+    run_benchmark(benchmark, parser, lambda: (txc_file,))
+
+
+def test_parse_for_streaming(benchmark, txc_file):
+    run_benchmark(benchmark, parse_txc_for_streaming, lambda: (txc_file,))
+
+
+def format_all_vehicle_journeys(document: TxcDocument):
+    for service in document.services:
+        for line in get_lines_for_service(service):
+            format_vehicle_journeys(
+                document.vehicle_journeys,
+                line["@id"],
+                bank_holidays,
+                service,
+                document.vehicle_journeys_by_line,
+            )
+
+
+def test_format_vehicle_journeys(benchmark, parsed_txc):
+    run_benchmark(
+        benchmark, format_all_vehicle_journeys, lambda: (TxcDocument(parsed_txc),)
+    )
+
+
+def collect_all_journey_patterns(document: TxcDocument):
+    for service in document.services:
+        document.collect_journey_patterns(service)
+
+
+def test_collect_journey_patterns(benchmark, parsed_txc):
+    # A fresh document each round, as journey patterns are kept per document
+    run_benchmark(
+        benchmark, collect_all_journey_patterns, lambda: (TxcDocument(parsed_txc),)
+    )
+
+
+def collect_all_track_data(document: TxcDocument):
+    for route_ref in document.routes_by_id:
+        route_section_refs = document.get_route_section_refs(route_ref)
+        link_refs = [
+            link_ref
+            for route_section_ref in route_section_refs
+            for link_ref in document.route_links_by_section_id.get(route_section_ref, {})
+        ]
+        document.collect_track_data(route_section_refs, link_refs)
+
+
+def test_collect_track_data(benchmark, parsed_txc):
+    run_benchmark(benchmark, collect_all_track_data, lambda: (TxcDocument(parsed_txc),))
+
+
+def write_parsed(data, metrics, db_connection, vehicle_journey_stream=None):
+    assert write_to_database(
+        data,
+        None,
+        "bods",
+        "bench/bods/synthetic.xml",
+        db_connection,
+        logger,
+        metrics,
+        bank_holidays,
+        vehicle_journey_stream,
+    )
+
+
+def test_write_to_database(benchmark, parsed_txc, metrics):
+    noc_cache.clear()
+
+    def setup():
+        # Every round writes its geometries, as the first file of a load does
+        track_geometry_cache.clear()
+
+        return parsed_txc, metrics, FakeConnection(NOC_CODES)
+
+    run_benchmark(benchmark, write_parsed, setup)
+
+
+def test_write_to_database_streaming(benchmark, txc_file, metrics):
+    noc_cache.clear()
+
+    def setup():
+        track_geometry_cache.clear()
+        # The stream is re-read during the write, as it is in production
+        data, vehicle_journey_stream = parse_txc_for_streaming(txc_file)
+
+        return data, metrics, FakeConnection(NOC_CODES), vehicle_journey_stream
+
+    run_benchmark(benchmark, write_parsed, setup)
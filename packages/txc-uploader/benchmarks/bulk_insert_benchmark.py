@@ -0,0 +1,77 @@
+"""Measure rows per second for executemany, multi-row INSERT and COPY.
+
+Needs a reachable Postgres; the default DSN matches dev/docker-compose.yaml.
+Rows are written to temporary tables so the database is left untouched.
+Run from packages/txc-uploader:
+
+    python -m benchmarks.bulk_insert_benchmark --rows 20000
+"""
+
+import argparse
+import datetime
+import os
+import time
+
+import psycopg2
+from bulk_writer import copy_rows, insert_rows
+from txc_processor import (
+    JOURNEY_PATTERN_LINK_COLUMNS,
+    VEHICLE_JOURNEY_COLUMNS,
+)
+
+DEFAULT_DSN = "host=localhost port=25432 dbname=disruptions user=postgres password=password"
+
+tables = {
+    "vehicle_journeys": (
+        VEHICLE_JOURNEY_COLUMNS,
+        "operator_service_id integer, vehicle_journey_code text, service_ref text, line_ref text, journey_pattern_ref text, departure_time text, journey_code text, operational_for_today boolean, operating_calendar bigint, operating_calendar_start_date date",
+        lambda i: (1, f"VJ{i}", "SVC", "L1", "JP1", "07:35:00", None, True, 0b11111, datetime.date(2025, 5, 8)),
+    ),
+    "journey_pattern_links": (
+        JOURNEY_PATTERN_LINK_COLUMNS,
+        "journey_pattern_id integer, from_atco_code text, from_timing_status text, from_sequence_number text, to_atco_code text, to_timing_status text, to_sequence_number text, runtime text, order_in_sequence integer",
+        lambda i: (1, f"0600MA{i:04d}", "PTP", str(i), f"0600MA{i + 1:04d}", "OTH", str(i + 1), "PT1M", i),
+    ),
+}
+
+
+def execute_many(cursor, table, columns, rows):
+    placeholders = ", ".join(["%s"] * len(columns))
+    cursor.executemany(
+        f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})", rows
+    )
+
+
+writers = {
+    "executemany": execute_many,
+    "multi_row_insert": insert_rows,
+    "copy": copy_rows,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--dsn", default=os.getenv("BENCHMARK_DSN", DEFAULT_DSN))
+    parser.add_argument("--rows", type=int, default=20000)
+    args = parser.parse_args()
+
+    with psycopg2.connect(args.dsn) as connection, connection.cursor() as cursor:
+        print(f"{'table':<24}{'writer':>18}{'rows/s':>14}")
+        for table, (columns, definition, make_row) in tables.items():
+            rows = [make_row(i) for i in range(args.rows)]
+            for writer_name, writer in writers.items():
+                temp_table = f"bench_{table}"
+                cursor.execute(f"CREATE TEMP TABLE {temp_table} ({definition})")
+
+                start = time.perf_counter()
+                writer(cursor, temp_table, columns, rows)
+                connection.commit()
+                elapsed = time.perf_counter() - start
+
+                cursor.execute(f"DROP TABLE {temp_table}")
+                connection.commit()
+                print(f"{table:<24}{writer_name:>18}{args.rows / elapsed:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
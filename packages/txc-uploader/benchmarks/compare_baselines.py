@@ -0,0 +1,75 @@
+"""Compare the mean time and peak traced memory of two saved benchmark runs.
+
+Runs are the JSON files written by bench_txc_processor.py with
+--benchmark-autosave or --benchmark-save. With no files given, the two most
+recent runs in the storage directory are compared. Run from
+packages/txc-uploader:
+
+    python -m benchmarks.compare_baselines [BASELINE.json CURRENT.json]
+"""
+
+import argparse
+import glob
+import json
+import os
+
+
+def find_runs(storage: str) -> list:
+    return sorted(
+        glob.glob(os.path.join(storage, "*", "*.json")), key=os.path.getmtime
+    )
+
+
+def load_run(path: str) -> dict:
+    with open(path) as file:
+        run = json.load(file)
+
+    return {
+        "commit": run.get("commit_info", {}).get("id", "unknown")[:10],
+        "benchmarks": {
+            benchmark["name"]: {
+                "mean_ms": benchmark["stats"]["mean"] * 1000,
+                "peak_traced_mb": benchmark["extra_info"].get("peak_traced_mb"),
+            }
+            for benchmark in run["benchmarks"]
+        },
+    }
+
+
+def format_change(before, after) -> str:
+    if before is None or after is None or not before:
+        return ""
+
+    return f"{(after - before) / before * 100:+.1f}%"
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("runs", nargs="*", metavar="RUN")
+    parser.add_argument("--storage", default=".benchmarks")
+    args = parser.parse_args()
+
+    paths = args.runs or find_runs(args.storage)[-2:]
+    if len(paths) != 2:
+        parser.error(f"Two runs are needed to compare, found {len(paths)}")
+
+    baseline, current = (load_run(path) for path in paths)
+    print(f"Baseline {baseline['commit']}, current {current['commit']}")
+    print(
+        f"{'benchmark':<48}{'mean ms':>12}{'change':>9}{'peak MB':>10}{'change':>9}"
+    )
+
+    for name, result in current["benchmarks"].items():
+        before = baseline["benchmarks"].get(name, {})
+        print(
+            f"{name:<48}{result['mean_ms']:>12.2f}"
+            f"{format_change(before.get('mean_ms'), result['mean_ms']):>9}"
+            f"{result['peak_traced_mb'] or 0:>10.2f}"
+            f"{format_change(before.get('peak_traced_mb'), result['peak_traced_mb']):>9}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,277 @@
+"""Implementations replaced by later optimisations, kept as benchmark baselines."""
+
+import datetime
+import xml.etree.ElementTree as eT
+
+import xmltodict
+from operating_profile import bank_holiday_txc_mapping
+from txc_document import make_list
+from txc_parser import TXC_NAMESPACES
+
+
+def parse_element_tree_round_trip(file_path):
+    tree = eT.parse(file_path)
+    xml_string = eT.tostring(tree.getroot(), encoding="utf-8", method="xml")
+    return xmltodict.parse(
+        xml_string, process_namespaces=True, namespaces=TXC_NAMESPACES
+    )
+
+
+def is_date_within_ranges(date, date_ranges):
+    if date_ranges is not None:
+        date_ranges = make_list(date_ranges)
+    for date_range in date_ranges:
+        today = datetime.date.today().strftime("%Y-%m-%d")
+        start_date = datetime.datetime.strptime(
+            date_range.get("startDate", today), "%Y-%m-%d"
+        ).date()
+        end_date = datetime.datetime.strptime(
+            date_range.get("endDate", today), "%Y-%m-%d"
+        ).date()
+        if start_date <= date <= end_date:
+            return True
+    return False
+
+
+
+def calculate_days_of_operation(days_of_week):
+    formatted_days_of_week = {}
+
+    if not days_of_week:
+        return formatted_days_of_week
+
+    if any(
+        key in days_of_week
+        for key in [
+            "Monday",
+            "MondayToFriday",
+            "MondayToSaturday",
+            "MondayToSunday",
+            "NotTuesday",
+            "NotWednesday",
+            "NotThursday",
+            "NotFriday",
+            "NotSaturday",
+            "NotSunday",
+        ]
+    ):
+        formatted_days_of_week["Monday"] = None
+
+    if any(
+        key in days_of_week
+        for key in [
+            "Tuesday",
+            "MondayToFriday",
+            "MondayToSaturday",
+            "MondayToSunday",
+            "NotMonday",
+            "NotWednesday",
+            "NotThursday",
+            "NotFriday",
+            "NotSaturday",
+            "NotSunday",
+        ]
+    ):
+        formatted_days_of_week["Tuesday"] = None
+
+    if any(
+        key in days_of_week
+        for key in [
+            "Wednesday",
+            "MondayToFriday",
+            "MondayToSaturday",
+            "MondayToSunday",
+            "NotMonday",
+            "NotTuesday",
+            "NotThursday",
+            "NotFriday",
+            "NotSaturday",
+            "NotSunday",
+        ]
+    ):
+        formatted_days_of_week["Wednesday"] = None
+
+    if any(
+        key in days_of_week
+        for key in [
+            "Thursday",
+            "MondayToFriday",
+            "MondayToSaturday",
+            "MondayToSunday",
+            "NotMonday",
+            "NotTuesday",
+            "NotWednesday",
+            "NotFriday",
+            "NotSaturday",
+            "NotSunday",
+        ]
+    ):
+        formatted_days_of_week["Thursday"] = None
+
+    if any(
+        key in days_of_week
+        for key in [
+            "Friday",
+            "MondayToFriday",
+            "MondayToSaturday",
+            "MondayToSunday",
+            "NotMonday",
+            "NotTuesday",
+            "NotWednesday",
+            "NotThursday",
+            "NotSaturday",
+            "NotSunday",
+        ]
+    ):
+        formatted_days_of_week["Friday"] = None
+
+    if any(
+        key in days_of_week
+        for key in [
+            "Saturday",
+            "MondayToSaturday",
+            "MondayToSunday",
+            "Weekend",
+            "NotMonday",
+            "NotTuesday",
+            "NotWednesday",
+            "NotThursday",
+            "NotFriday",
+            "NotSunday",
+        ]
+    ):
+        formatted_days_of_week["Saturday"] = None
+
+    if any(
+        key in days_of_week
+        for key in [
+            "Sunday",
+            "MondayToSunday",
+            "Weekend",
+            "NotMonday",
+            "NotTuesday",
+            "NotWednesday",
+            "NotThursday",
+            "NotFriday",
+            "NotSaturday",
+        ]
+    ):
+        formatted_days_of_week["Sunday"] = None
+
+    return formatted_days_of_week
+
+
+# Check if a vehicle service is operational_for_today
+def is_service_operational(
+    vehicle_journey,
+    bank_holidays,
+    service_operating_profile,
+    service_operating_period,
+    today=None,
+):
+    if today is None:
+        today = datetime.date.today()
+
+    # Check the OperatingPeriod of the service
+    service_start_date = datetime.datetime.strptime(
+        service_operating_period["StartDate"], "%Y-%m-%d"
+    ).date()
+    service_end_date = (
+        datetime.datetime.strptime(
+            service_operating_period["EndDate"], "%Y-%m-%d"
+        ).date()
+        if "EndDate" in service_operating_period
+        else None
+    )
+    if (service_end_date and service_end_date < today) or (service_start_date > today):
+        return False
+
+    # Fallback default operating profile
+    default_operating_profile = {
+        "RegularDayType": {
+            "DaysOfWeek": {
+                "Monday": "",
+                "Tuesday": "",
+                "Wednesday": "",
+                "Thursday": "",
+                "Friday": "",
+                "Saturday": "",
+                "Sunday": "",
+            }
+        }
+    }
+
+    # Use the vehicle journey's operating profile or fallback to the service's operating profile or default
+    operating_profile = (
+        vehicle_journey.get("OperatingProfile")
+        or service_operating_profile
+        or default_operating_profile
+    )
+
+    # Check if today is a special non-operation day
+    special_days_operation = operating_profile.get("SpecialDaysOperation", {})
+
+    special_days_non_operation = (
+        special_days_operation.get("DaysOfNonOperation", [])
+        if special_days_operation
+        else []
+    )
+
+    if is_date_within_ranges(today, special_days_non_operation):
+        return False
+
+    # Check if today is a special operation day
+    days_of_special_operation = (
+        special_days_operation.get("DaysOfOperation", [])
+        if special_days_operation
+        else []
+    )
+
+    if is_date_within_ranges(today, days_of_special_operation):
+        return True
+
+    # Check if today is a bank holiday, if so check whether the service is operational
+    todays_bank_holidays = [
+        holiday
+        for holiday in bank_holidays
+        if holiday["date"] == today.strftime("%Y-%m-%d")
+    ]
+
+    if todays_bank_holidays:
+        bank_holiday_operation = operating_profile.get("BankHolidayOperation", [])
+
+        days_of_bank_holiday_operation = (
+            (bank_holiday_operation.get("DaysOfOperation", []) or [])
+            if bank_holiday_operation
+            else []
+        )
+        bank_holiday_non_operation = (
+            (bank_holiday_operation.get("DaysOfNonOperation", []) or [])
+            if bank_holiday_operation
+            else []
+        )
+
+        if "AllBankHolidays" in bank_holiday_operation:
+            return True
+
+        if "AllBankHolidays" in bank_holiday_non_operation:
+            return False
+
+        for holiday in todays_bank_holidays:
+            txc_holiday_name = bank_holiday_txc_mapping.get(holiday["title"], None)
+            if txc_holiday_name:
+                if txc_holiday_name in days_of_bank_holiday_operation:
+                    return True
+                if txc_holiday_name in bank_holiday_non_operation:
+                    return False
+
+    # Check if today is a regular operating day
+    days_of_week = calculate_days_of_operation(
+        operating_profile.get("RegularDayType", {}).get("DaysOfWeek", {})
+    )
+
+    if today.strftime("%A") not in days_of_week:
+        return False
+
+    return True
+
@@ -0,0 +1,71 @@
+"""Measure operating profile evaluations per second, legacy against compiled.
+
+Run from packages/txc-uploader:
+
+    python -m benchmarks.operating_profile_benchmark --vehicle-journeys 50000
+"""
+
+import argparse
+import datetime
+import io
+import time
+
+from benchmarks import legacy
+from benchmarks.synthetic_txc import write_synthetic_txc
+from operating_profile import is_service_operational, operating_profile_cache_stats
+from txc_document import TxcDocument
+from txc_parser import parse_txc
+
+bank_holidays = [
+    {"title": "Christmas Day", "date": "2025-12-25"},
+    {"title": "Boxing Day", "date": "2025-12-26"},
+    {"title": "New Year’s Day", "date": "2026-01-01"},
+    {"title": "Good Friday", "date": "2026-04-03"},
+    {"title": "Easter Monday", "date": "2026-04-06"},
+    {"title": "Early May bank holiday", "date": "2026-05-04"},
+    {"title": "Spring bank holiday", "date": "2026-05-25"},
+    {"title": "Summer bank holiday", "date": "2026-08-31"},
+]
+
+
+def evaluate_all(evaluator, document, today):
+    service = document.services[0]
+    operating_profile = service.get("OperatingProfile")
+    operating_period = service["OperatingPeriod"]
+
+    start = time.perf_counter()
+    for vehicle_journey in document.vehicle_journeys:
+        evaluator(
+            vehicle_journey, bank_holidays, operating_profile, operating_period, today
+        )
+
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--vehicle-journeys", type=int, default=50000)
+    args = parser.parse_args()
+
+    txc = io.StringIO()
+    write_synthetic_txc(txc, vehicle_journeys=args.vehicle_journeys)
+    document = TxcDocument(parse_txc(txc.getvalue().encode("utf-8")))
+    today = datetime.date(2026, 5, 25)
+
+    for name, evaluator in [
+        ("legacy", legacy.is_service_operational),
+        ("compiled", is_service_operational),
+    ]:
+        elapsed = evaluate_all(evaluator, document, today)
+        print(
+            f"{name:<10}{len(document.vehicle_journeys) / elapsed:>14,.0f} evaluations/s"
+        )
+
+    print(
+        f"compiled profile cache: {operating_profile_cache_stats['hits']} hits, "
+        f"{operating_profile_cache_stats['misses']} misses"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""Compare the ElementTree round trip parse, the single-pass parser, the
+streaming parser used for large files and the lxml extraction engine.
+
+Each measurement runs in a fresh interpreter so that peak RSS reflects only
+the parse being measured. Run from packages/txc-uploader:
+
+    python -m benchmarks.parse_benchmark --vehicle-journeys 100000
+"""
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.legacy import parse_element_tree_round_trip
+from benchmarks.synthetic_txc import generate_synthetic_txc_file
+from txc_lxml import extract_txc
+from txc_parser import parse_txc, parse_txc_for_streaming
+
+package_dir = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+fixtures_dir = f"{package_dir}/tests/helpers/test_data"
+
+
+def parse_streaming(file_path):
+    _, vehicle_journey_stream = parse_txc_for_streaming(file_path)
+    vehicle_journey_stream.for_each(lambda vehicle_journey: None)
+
+
+parsers = {
+    "element_tree_round_trip": parse_element_tree_round_trip,
+    "single_pass": parse_txc,
+    "streaming": parse_streaming,
+    "lxml_extract": extract_txc,
+}
+
+
+def max_rss_mb():
+    # ru_maxrss is reported in kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_single(parser_name, file_path):
+    baseline_rss = max_rss_mb()
+    start = time.perf_counter()
+    parsers[parser_name](file_path)
+    elapsed = time.perf_counter() - start
+
+    print(
+        json.dumps(
+            {
+                "seconds": elapsed,
+                "peak_rss_mb": max_rss_mb(),
+                "rss_growth_mb": max_rss_mb() - baseline_rss,
+            }
+        )
+    )
+
+
+def measure(parser_name, file_path):
+    output = subprocess.run(
+        [sys.executable, "-m", "benchmarks.parse_benchmark", "--run", parser_name, file_path],
+        cwd=package_dir,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+
+    return json.loads(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--run", nargs=2, metavar=("PARSER", "FILE"))
+    parser.add_argument("--vehicle-journeys", type=int, default=50000)
+    args = parser.parse_args()
+
+    if args.run:
+        run_single(*args.run)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        files = [
+            f"{fixtures_dir}/{name}"
+            for name in sorted(os.listdir(fixtures_dir))
+            if name.endswith(".xml")
+        ]
+        files.append(
+            generate_synthetic_txc_file(
+                f"{tmp_dir}/synthetic.xml",
+                services_per_operator=20,
+                vehicle_journeys=args.vehicle_journeys,
+            )
+        )
+
+        print(f"{'file':<28}{'size MB':>9}{'parser':>26}{'seconds':>10}{'peak RSS MB':>13}")
+        for file_path in files:
+            size_mb = os.path.getsize(file_path) / 1024 / 1024
+            for parser_name in parsers:
+                result = measure(parser_name, file_path)
+                print(
+                    f"{os.path.basename(file_path):<28}{size_mb:>9.2f}{parser_name:>26}"
+                    f"{result['seconds']:>10.3f}{result['peak_rss_mb']:>13.1f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""Run one local TXC file through index.main with S3 and SSM mocked by moto.
+
+The database is real, so point the --db options at a Postgres holding the
+_new tables. --profile sets the same "profile" event field as a production
+run, and the .pstats and allocation report are copied to --profile-dir.
+Run from packages/txc-uploader:
+
+    python -m benchmarks.run_txc_file path/to/file.xml --profile
+
+Then inspect the profile with:
+
+    python -m pstats profiles/<file>.pstats
+"""
+
+import argparse
+import json
+import os
+
+import boto3
+from moto import mock_aws
+
+REGION = "eu-west-2"
+TXC_BUCKET = "local-txc-data"
+BANK_HOLIDAYS_BUCKET = "local-bank-holidays"
+PROFILE_BUCKET = "local-txc-profiles"
+
+DATABASE_PARAMS = {
+    "DATABASE_NAME_PARAM": "db_name",
+    "DATABASE_HOST_PARAM": "db_host",
+    "DATABASE_USERNAME_PARAM": "db_username",
+    "DATABASE_PORT_PARAM": "db_port",
+    "DATABASE_PASSWORD_PARAM": "db_password",
+}
+
+
+def create_bucket(s3, bucket):
+    s3.create_bucket(
+        Bucket=bucket, CreateBucketConfiguration={"LocationConstraint": REGION}
+    )
+
+
+def put_database_params(args):
+    ssm = boto3.client("ssm", region_name=REGION)
+
+    for env_name, arg_name in DATABASE_PARAMS.items():
+        name = f"/local/txc-uploader/{arg_name}"
+        ssm.put_parameter(
+            Name=name, Value=str(getattr(args, arg_name)), Type="SecureString"
+        )
+        os.environ[env_name] = name
+
+
+def download_profiles(s3, profile_dir):
+    os.makedirs(profile_dir, exist_ok=True)
+    paths = []
+
+    for item in s3.list_objects_v2(Bucket=PROFILE_BUCKET).get("Contents", []):
+        path = os.path.join(profile_dir, item["Key"].replace("/", "_"))
+        s3.download_file(PROFILE_BUCKET, item["Key"], path)
+        paths.append(path)
+
+    return paths
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("file_path")
+    parser.add_argument(
+        "--key-prefix",
+        default="local/bods",
+        help="Prefix of the S3 key, whose second part is the data source",
+    )
+    parser.add_argument("--bank-holidays", help="Path to a bank-holidays.json")
+    parser.add_argument("--profile", action="store_true")
+    parser.add_argument("--profile-dir", default="profiles")
+    parser.add_argument("--db-host", dest="db_host", default="localhost")
+    parser.add_argument("--db-port", dest="db_port", default="25432")
+    parser.add_argument("--db-name", dest="db_name", default="disruptions")
+    parser.add_argument("--db-username", dest="db_username", default="postgres")
+    parser.add_argument("--db-password", dest="db_password", default="password")
+    args = parser.parse_args()
+
+    for name in ("AWS_ACCESS_KEY_ID", "AWS_SECRET_ACCESS_KEY"):
+        os.environ.setdefault(name, "testing")
+    os.environ["AWS_DEFAULT_REGION"] = REGION
+    os.environ["BANK_HOLIDAYS_BUCKET_NAME"] = BANK_HOLIDAYS_BUCKET
+
+    with mock_aws():
+        s3 = boto3.client("s3", region_name=REGION)
+        for bucket in (TXC_BUCKET, BANK_HOLIDAYS_BUCKET, PROFILE_BUCKET):
+            create_bucket(s3, bucket)
+
+        bank_holidays = "[]"
+        if args.bank_holidays:
+            with open(args.bank_holidays) as file:
+                bank_holidays = json.dumps(json.load(file))
+        s3.put_object(
+            Bucket=BANK_HOLIDAYS_BUCKET, Key="bank-holidays.json", Body=bank_holidays
+        )
+
+        key = f"{args.key_prefix.strip('/')}/{os.path.basename(args.file_path)}"
+        s3.upload_file(args.file_path, TXC_BUCKET, key)
+        put_database_params(args)
+
+        # Imported once AWS is mocked, as index creates its clients on import
+        import index
+
+        event = {
+            "Records": [
+                {"s3": {"bucket": {"name": TXC_BUCKET}, "object": {"key": key}}}
+            ]
+        }
+        if args.profile:
+            event["profile"] = True
+            event["profileS3Uri"] = f"s3://{PROFILE_BUCKET}/profiles"
+
+        try:
+            index.main(event, None)
+        finally:
+            for path in download_profiles(s3, args.profile_dir):
+                print(f"Wrote {path}")
+
+
+if __name__ == "__main__":
+    main()
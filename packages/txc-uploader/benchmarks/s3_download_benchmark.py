@@ -0,0 +1,95 @@
+"""Compare download-then-parse with parsing straight from ranged S3 GETs.
+
+S3 is stood in for by moto, with a fixed delay added to every request to
+approximate the time to first byte of a real bucket. Run from
+packages/txc-uploader:
+
+    python -m benchmarks.s3_download_benchmark --latency-ms 20
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import boto3
+from moto import mock_aws
+
+from benchmarks.synthetic_txc import generate_synthetic_txc_file
+from s3_reader import open_s3_object
+from txc_parser import parse_txc
+
+BUCKET = "benchmark-bucket"
+
+# Approximate file sizes of 1, 8 and 32 MB
+size_buckets = {
+    "1MB": 1_500,
+    "8MB": 13_000,
+    "32MB": 52_000,
+}
+
+
+def download_then_parse(s3, key, size, tmp_dir):
+    file_path = f"{tmp_dir}/download.xml"
+    s3.download_file(BUCKET, key, file_path)
+    parse_txc(file_path)
+    os.remove(file_path)
+
+
+def ranged_stream(s3, key, size, tmp_dir):
+    with open_s3_object(s3, BUCKET, key, size) as source:
+        parse_txc(source)
+
+
+strategies = {
+    "download_then_parse": download_then_parse,
+    "ranged_stream": ranged_stream,
+}
+
+
+def add_latency(s3, latency_seconds):
+    def delay(**kwargs):
+        time.sleep(latency_seconds)
+
+    s3.meta.events.register_first("before-send.s3.*", delay)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--latency-ms", type=float, default=20)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with mock_aws(), tempfile.TemporaryDirectory() as tmp_dir:
+        s3 = boto3.client("s3", region_name="eu-west-2")
+        s3.create_bucket(
+            Bucket=BUCKET,
+            CreateBucketConfiguration={"LocationConstraint": "eu-west-2"},
+        )
+        add_latency(s3, args.latency_ms / 1000)
+
+        print(f"{'bucket':<8}{'size MB':>9}{'strategy':>22}{'seconds':>10}")
+        for bucket_name, vehicle_journeys in size_buckets.items():
+            file_path = generate_synthetic_txc_file(
+                f"{tmp_dir}/{bucket_name}.xml",
+                services_per_operator=5,
+                vehicle_journeys=vehicle_journeys,
+            )
+            size = os.path.getsize(file_path)
+            s3.upload_file(file_path, BUCKET, bucket_name)
+
+            for strategy_name, strategy in strategies.items():
+                timings = []
+                for _ in range(args.repeat):
+                    start = time.perf_counter()
+                    strategy(s3, bucket_name, size, tmp_dir)
+                    timings.append(time.perf_counter() - start)
+
+                print(
+                    f"{bucket_name:<8}{size / 1024 / 1024:>9.1f}{strategy_name:>22}"
+                    f"{min(timings):>10.3f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
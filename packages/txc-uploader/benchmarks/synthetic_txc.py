@@ -0,0 +1,221 @@
+import argparse
+import random
+from xml.sax.saxutils import escape
+
+TXC_HEADER = (
+    '<?xml version="1.0" encoding="utf-8"?>\n'
+    '<TransXChange xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" '
+    'xmlns="http://www.transxchange.org.uk/" '
+    'xsi:schemaLocation="http://www.transxchange.org.uk/ http://www.transxchange.org.uk/schema/2.4/TransXChange_general.xsd" '
+    'CreationDateTime="2025-01-01T00:00:00" ModificationDateTime="2025-01-01T00:00:00" '
+    'Modification="new" RevisionNumber="0" FileName="synthetic.xml" SchemaVersion="2.4">\n'
+)
+
+DAYS_OF_WEEK = ["MondayToFriday", "Saturday", "Sunday", "MondayToSaturday", "Weekend"]
+
+
+def write_element(file, indent, name, value):
+    file.write(f"{'  ' * indent}<{name}>{escape(str(value))}</{name}>\n")
+
+
+def write_synthetic_txc(
+    file,
+    operators=1,
+    services_per_operator=1,
+    lines_per_service=1,
+    journey_patterns_per_service=4,
+    sections_per_journey_pattern=3,
+    links_per_section=5,
+    track_points_per_link=10,
+    vehicle_journeys=1000,
+    seed=0,
+):
+    """Write a deterministic TXC document to a text-mode file object.
+
+    Every service gets its own journey patterns, sections, route and
+    route links with tracks; vehicle journeys are spread evenly across the
+    lines and journey patterns of every service.
+    """
+    rng = random.Random(seed)
+    services = []
+
+    for operator_index in range(operators):
+        for service_index in range(services_per_operator):
+            service_number = operator_index * services_per_operator + service_index
+            services.append(
+                {
+                    "operator_ref": f"O{operator_index}",
+                    "service_code": f"SYN_{service_number}",
+                    "lines": [
+                        f"L{service_number}_{line_index}"
+                        for line_index in range(lines_per_service)
+                    ],
+                    "journey_patterns": [
+                        f"JP{service_number}_{journey_pattern_index}"
+                        for journey_pattern_index in range(journey_patterns_per_service)
+                    ],
+                    "number": service_number,
+                }
+            )
+
+    file.write(TXC_HEADER)
+
+    file.write("  <RouteSections>\n")
+    for service in services:
+        for journey_pattern_index in range(journey_patterns_per_service):
+            for section_index in range(sections_per_journey_pattern):
+                section_id = f"RS{service['number']}_{journey_pattern_index}_{section_index}"
+                file.write(f'    <RouteSection id="{section_id}">\n')
+                for link_index in range(links_per_section):
+                    file.write(f'      <RouteLink id="{section_id}_{link_index}">\n')
+                    file.write("        <Track>\n          <Mapping>\n")
+                    longitude = -2.5 + rng.random()
+                    latitude = 53.0 + rng.random()
+                    for _ in range(track_points_per_link):
+                        longitude += rng.uniform(-0.0005, 0.0005)
+                        latitude += rng.uniform(-0.0005, 0.0005)
+                        file.write("            <Location>\n")
+                        write_element(file, 7, "Longitude", f"{longitude:.9f}")
+                        write_element(file, 7, "Latitude", f"{latitude:.9f}")
+                        file.write("            </Location>\n")
+                    file.write("          </Mapping>\n        </Track>\n")
+                    file.write("      </RouteLink>\n")
+                file.write("    </RouteSection>\n")
+    file.write("  </RouteSections>\n")
+
+    file.write("  <Routes>\n")
+    for service in services:
+        for journey_pattern_index in range(journey_patterns_per_service):
+            file.write(f'    <Route id="RT{service["number"]}_{journey_pattern_index}">\n')
+            for section_index in range(sections_per_journey_pattern):
+                write_element(
+                    file,
+                    3,
+                    "RouteSectionRef",
+                    f"RS{service['number']}_{journey_pattern_index}_{section_index}",
+                )
+            file.write("    </Route>\n")
+    file.write("  </Routes>\n")
+
+    file.write("  <JourneyPatternSections>\n")
+    for service in services:
+        for journey_pattern_index in range(journey_patterns_per_service):
+            for section_index in range(sections_per_journey_pattern):
+                section_suffix = f"{service['number']}_{journey_pattern_index}_{section_index}"
+                file.write(f'    <JourneyPatternSection id="JPS{section_suffix}">\n')
+                for link_index in range(links_per_section):
+                    sequence_number = section_index * links_per_section + link_index
+                    file.write(f'      <JourneyPatternTimingLink id="JPTL{section_suffix}_{link_index}">\n')
+                    file.write(f'        <From SequenceNumber="{sequence_number + 1}">\n')
+                    write_element(file, 5, "StopPointRef", f"0600SYN{rng.randrange(5000):04d}")
+                    write_element(file, 5, "TimingStatus", "PTP" if link_index == 0 else "OTH")
+                    file.write("        </From>\n")
+                    file.write(f'        <To SequenceNumber="{sequence_number + 2}">\n')
+                    write_element(file, 5, "StopPointRef", f"0600SYN{rng.randrange(5000):04d}")
+                    write_element(file, 5, "TimingStatus", "OTH")
+                    file.write("        </To>\n")
+                    write_element(file, 4, "RouteLinkRef", f"RS{section_suffix}_{link_index}")
+                    write_element(file, 4, "RunTime", f"PT{rng.randrange(1, 5)}M")
+                    file.write("      </JourneyPatternTimingLink>\n")
+                file.write("    </JourneyPatternSection>\n")
+    file.write("  </JourneyPatternSections>\n")
+
+    file.write("  <Operators>\n")
+    for operator_index in range(operators):
+        file.write(f'    <Operator id="O{operator_index}">\n')
+        write_element(file, 3, "NationalOperatorCode", f"SYN{operator_index}")
+        write_element(file, 3, "OperatorShortName", f"Synthetic {operator_index}")
+        file.write("    </Operator>\n")
+    file.write("  </Operators>\n")
+
+    file.write("  <Services>\n")
+    for service in services:
+        file.write("    <Service>\n")
+        write_element(file, 3, "ServiceCode", service["service_code"])
+        file.write("      <Lines>\n")
+        for line_id in service["lines"]:
+            file.write(f'        <Line id="{line_id}">\n')
+            write_element(file, 5, "LineName", line_id)
+            file.write("        </Line>\n")
+        file.write("      </Lines>\n")
+        file.write("      <OperatingPeriod>\n")
+        write_element(file, 4, "StartDate", "2025-01-01")
+        write_element(file, 4, "EndDate", "2099-12-31")
+        file.write("      </OperatingPeriod>\n")
+        write_element(file, 3, "RegisteredOperatorRef", service["operator_ref"])
+        write_element(file, 3, "Mode", "bus")
+        write_element(file, 3, "Description", f"Synthetic service {service['number']}")
+        file.write("      <StandardService>\n")
+        write_element(file, 4, "Origin", "Origin")
+        write_element(file, 4, "Destination", "Destination")
+        for journey_pattern_index, journey_pattern_id in enumerate(
+            service["journey_patterns"]
+        ):
+            file.write(f'        <JourneyPattern id="{journey_pattern_id}">\n')
+            write_element(file, 5, "Direction", "outbound" if journey_pattern_index % 2 == 0 else "inbound")
+            write_element(file, 5, "RouteRef", f"RT{service['number']}_{journey_pattern_index}")
+            for section_index in range(sections_per_journey_pattern):
+                write_element(
+                    file,
+                    5,
+                    "JourneyPatternSectionRefs",
+                    f"JPS{service['number']}_{journey_pattern_index}_{section_index}",
+                )
+            file.write("        </JourneyPattern>\n")
+        file.write("      </StandardService>\n")
+        file.write("    </Service>\n")
+    file.write("  </Services>\n")
+
+    file.write("  <VehicleJourneys>\n")
+    for journey_index in range(vehicle_journeys):
+        service = services[journey_index % len(services)]
+        line_id = service["lines"][(journey_index // len(services)) % len(service["lines"])]
+        journey_pattern_id = service["journey_patterns"][
+            rng.randrange(len(service["journey_patterns"]))
+        ]
+        file.write("    <VehicleJourney>\n")
+        file.write("      <OperatingProfile>\n        <RegularDayType>\n          <DaysOfWeek>\n")
+        file.write(f"            <{DAYS_OF_WEEK[journey_index % len(DAYS_OF_WEEK)]} />\n")
+        file.write("          </DaysOfWeek>\n        </RegularDayType>\n")
+        file.write("        <BankHolidayOperation>\n          <DaysOfNonOperation>\n")
+        file.write("            <AllBankHolidays />\n")
+        file.write("          </DaysOfNonOperation>\n        </BankHolidayOperation>\n")
+        file.write("      </OperatingProfile>\n")
+        write_element(file, 3, "VehicleJourneyCode", f"VJ{journey_index}")
+        write_element(file, 3, "ServiceRef", service["service_code"])
+        write_element(file, 3, "LineRef", line_id)
+        write_element(file, 3, "JourneyPatternRef", journey_pattern_id)
+        write_element(
+            file,
+            3,
+            "DepartureTime",
+            f"{(journey_index // 60) % 24:02d}:{journey_index % 60:02d}:00",
+        )
+        file.write("    </VehicleJourney>\n")
+    file.write("  </VehicleJourneys>\n")
+
+    file.write("</TransXChange>\n")
+
+
+def generate_synthetic_txc_file(file_path, **kwargs):
+    with open(file_path, "w", encoding="utf-8") as file:
+        write_synthetic_txc(file, **kwargs)
+
+    return file_path
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate a synthetic TXC file")
+    parser.add_argument("output")
+    parser.add_argument("--operators", type=int, default=1)
+    parser.add_argument("--services-per-operator", type=int, default=1)
+    parser.add_argument("--lines-per-service", type=int, default=1)
+    parser.add_argument("--journey-patterns-per-service", type=int, default=4)
+    parser.add_argument("--sections-per-journey-pattern", type=int, default=3)
+    parser.add_argument("--links-per-section", type=int, default=5)
+    parser.add_argument("--track-points-per-link", type=int, default=10)
+    parser.add_argument("--vehicle-journeys", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = vars(parser.parse_args())
+
+    generate_synthetic_txc_file(args.pop("output"), **args)
@@ -0,0 +1,119 @@
+"""Compare storage size and read latency of tracks stored one row per point
+against one encoded polyline row per service.
+
+Needs a reachable Postgres; the default DSN matches dev/docker-compose.yaml.
+Tracks are written to temporary tables so the database is left untouched.
+Reads fetch one service's track by operator_service_id, decoding the
+polyline as a consumer would. Run from packages/txc-uploader:
+
+    python -m benchmarks.track_storage_benchmark --services 2000 --points 500
+"""
+
+import argparse
+import os
+import random
+import time
+
+import psycopg2
+from bulk_writer import copy_rows
+from track_polyline import decode_polyline, encode_polyline
+from txc_records import TrackPoint
+
+DEFAULT_DSN = "host=localhost port=25432 dbname=disruptions user=postgres password=password"
+
+
+def generate_track(rng: random.Random, points: int) -> list:
+    longitude = -2.5 + rng.random()
+    latitude = 53.0 + rng.random()
+    track = []
+
+    for _ in range(points):
+        longitude += rng.uniform(-0.0005, 0.0005)
+        latitude += rng.uniform(-0.0005, 0.0005)
+        track.append(TrackPoint(f"{longitude:.9f}", f"{latitude:.9f}"))
+
+    return track
+
+
+def read_points(cursor, service_id):
+    cursor.execute(
+        "SELECT longitude, latitude FROM bench_tracks WHERE operator_service_id = %s",
+        (service_id,),
+    )
+
+    return cursor.fetchall()
+
+
+def read_polyline(cursor, service_id):
+    cursor.execute(
+        "SELECT polyline FROM bench_service_tracks WHERE operator_service_id = %s",
+        (service_id,),
+    )
+
+    return decode_polyline(cursor.fetchone()[0])
+
+
+layouts = {
+    "row_per_point": (
+        "bench_tracks",
+        "operator_service_id integer, longitude text, latitude text",
+        ("operator_service_id", "longitude", "latitude"),
+        lambda service_id, track: [(service_id, *point) for point in track],
+        read_points,
+    ),
+    "polyline": (
+        "bench_service_tracks",
+        "operator_service_id integer, polyline text, point_count integer",
+        ("operator_service_id", "polyline", "point_count"),
+        lambda service_id, track: [(service_id, *encode_polyline(track))],
+        read_polyline,
+    ),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--dsn", default=os.getenv("BENCHMARK_DSN", DEFAULT_DSN))
+    parser.add_argument("--services", type=int, default=2000)
+    parser.add_argument("--points", type=int, default=500)
+    parser.add_argument("--reads", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    tracks = [generate_track(rng, args.points) for _ in range(args.services)]
+    read_ids = [rng.randrange(args.services) for _ in range(args.reads)]
+
+    with psycopg2.connect(args.dsn) as connection, connection.cursor() as cursor:
+        print(f"{'layout':<16}{'rows':>12}{'table MB':>11}{'write s':>10}{'read ms':>10}")
+        for name, (table, definition, columns, make_rows, read) in layouts.items():
+            cursor.execute(f"CREATE TEMP TABLE {table} ({definition})")
+
+            start = time.perf_counter()
+            rows = [
+                row
+                for service_id, track in enumerate(tracks)
+                for row in make_rows(service_id, track)
+            ]
+            copy_rows(cursor, table, columns, rows)
+            cursor.execute(f"CREATE INDEX ON {table} (operator_service_id)")
+            connection.commit()
+            write_seconds = time.perf_counter() - start
+
+            cursor.execute("SELECT pg_total_relation_size(%s)", (table,))
+            size_mb = cursor.fetchone()[0] / 1024 / 1024
+
+            start = time.perf_counter()
+            for service_id in read_ids:
+                read(cursor, service_id)
+            read_ms = (time.perf_counter() - start) / len(read_ids) * 1000
+
+            cursor.execute(f"DROP TABLE {table}")
+            connection.commit()
+            print(
+                f"{name:<16}{len(rows):>12,}{size_mb:>11.1f}{write_seconds:>10.2f}{read_ms:>10.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
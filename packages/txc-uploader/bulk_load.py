@@ -0,0 +1,385 @@
+"""Load TXC files from a local directory, zip archive or S3 prefix into a
+database with a pool of worker processes, without the Step Functions pipeline.
+
+Each file goes through the same parse and write path as the Lambda, keyed
+the way the retrievers and unzipper key it in S3, so that the data source
+and the TNDS region are read from <prefix>/<data source>/<region>/<file>.
+Files in a zip are keyed under the zip's name without .zip, so a directory
+of the TNDS region zips loads with --key-prefix local/tnds. Run from
+packages/txc-uploader:
+
+    python -m bulk_load ~/tnds --key-prefix local/tnds --workers 8 \\
+        --bank-holidays bank-holidays.json --summary tnds-load.jsonl
+
+Like the TXC step of the pipeline, files are written to the _new tables,
+so the steps around it are still needed:
+
+  before  run db-cleardown to recreate the _new tables, then the CSV and
+          NPTG uploaders to fill operators_new, stops_new and
+          localities_new, which files are resolved against
+  after   run table-renamer to swap the _new tables in for the live ones
+
+The load stops before starting if the _new tables are missing or
+operators_new is empty.
+"""
+
+import argparse
+import contextlib
+import json
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import NamedTuple, Optional
+
+import boto3
+import psycopg2
+from aws_lambda_powertools import Metrics
+
+from db_connection import ConnectionManager
+from stage_timer import StageTimer
+from txc_processor import (
+    METRIC_NAMESPACE,
+    add_data_source_dimension,
+    get_data_source_and_region_code,
+    write_txc_file_to_db,
+)
+
+# Matches the Postgres of dev/docker-compose.yaml
+DEFAULT_DSN = "host=localhost port=25432 dbname=disruptions user=postgres password=password"
+
+LOG_FORMAT = "%(processName)s %(levelname)s %(message)s"
+
+# Created by db-cleardown and read or written by the TXC step
+TXC_NEW_TABLES = (
+    "localities_new",
+    "operators_new",
+    "service_admin_area_codes_new",
+    "service_journey_pattern_links_new",
+    "service_journey_patterns_new",
+    "service_tracks_new",
+    "services_new",
+    "stops_new",
+    "track_geometries_new",
+    "vehicle_journeys_new",
+)
+
+logger = logging.getLogger("bulk_load")
+
+
+class TxcFile(NamedTuple):
+    """A TXC file to load, at path or at the chain of zip members inside
+    the archive at path. S3 objects have a path of s3://bucket/key."""
+
+    key: str
+    path: str
+    members: tuple
+    size: int
+
+
+def strip_extension(name: str) -> str:
+    return os.path.splitext(name)[0]
+
+
+def list_zip_files(archive: zipfile.ZipFile, path: str, members: tuple, key_base: str):
+    for info in sorted(archive.infolist(), key=lambda info: info.filename):
+        if info.is_dir():
+            continue
+
+        name = info.filename.lower()
+        if name.endswith(".xml"):
+            yield TxcFile(
+                f"{key_base}/{info.filename}", path, (*members, info.filename), info.file_size
+            )
+        elif name.endswith(".zip"):
+            with archive.open(info) as member, zipfile.ZipFile(member) as inner_archive:
+                yield from list_zip_files(
+                    inner_archive,
+                    path,
+                    (*members, info.filename),
+                    f"{key_base}/{strip_extension(info.filename)}",
+                )
+
+
+def list_local_files(path: str, key_prefix: str):
+    if zipfile.is_zipfile(path):
+        with zipfile.ZipFile(path) as archive:
+            yield from list_zip_files(
+                archive,
+                path,
+                (),
+                f"{key_prefix}/{strip_extension(os.path.basename(path))}",
+            )
+    elif path.lower().endswith(".xml"):
+        yield TxcFile(f"{key_prefix}/{os.path.basename(path)}", path, (), os.path.getsize(path))
+
+
+def list_s3_files(s3, s3_uri: str):
+    bucket, _, prefix = s3_uri[len("s3://") :].partition("/")
+
+    for page in s3.get_paginator("list_objects_v2").paginate(Bucket=bucket, Prefix=prefix):
+        for item in page.get("Contents", []):
+            if item["Key"].lower().endswith(".xml"):
+                yield TxcFile(item["Key"], f"s3://{bucket}/{item['Key']}", (), item["Size"])
+
+
+def find_txc_files(source: str, key_prefix: str, s3=None) -> list:
+    """List every TXC file under a directory, zip archive or s3:// prefix.
+
+    Zips are opened recursively, as the unzipper does. The largest files
+    come first so that they do not leave one worker running at the end.
+    """
+    key_prefix = key_prefix.strip("/")
+
+    if source.startswith("s3://"):
+        files = list(list_s3_files(s3 or boto3.client("s3"), source))
+    elif os.path.isdir(source):
+        files = []
+        for directory, directory_names, file_names in os.walk(source):
+            directory_names.sort()
+            relative_directory = os.path.relpath(directory, source)
+            directory_prefix = (
+                key_prefix
+                if relative_directory == "."
+                else f"{key_prefix}/{relative_directory.replace(os.sep, '/')}"
+            )
+            for file_name in sorted(file_names):
+                files.extend(
+                    list_local_files(os.path.join(directory, file_name), directory_prefix)
+                )
+    else:
+        files = list(list_local_files(source, key_prefix))
+
+    return sorted(files, key=lambda file: file.size, reverse=True)
+
+
+@contextlib.contextmanager
+def open_local_copy(txc_file: TxcFile, tmp_dir: str, s3, timer: StageTimer):
+    """Yield a path on local disk holding the TXC file, copying it out of its
+    zip or S3 first when needed. Copies are removed once the file is done."""
+    if not txc_file.members and not txc_file.path.startswith("s3://"):
+        yield txc_file.path
+        return
+
+    local_path = os.path.join(tmp_dir, os.path.basename(txc_file.key))
+
+    try:
+        with timer.span("Download"):
+            if txc_file.path.startswith("s3://"):
+                bucket, _, key = txc_file.path[len("s3://") :].partition("/")
+                s3.download_file(bucket, key, local_path)
+            else:
+                with contextlib.ExitStack() as stack:
+                    archive = stack.enter_context(zipfile.ZipFile(txc_file.path))
+                    for member in txc_file.members[:-1]:
+                        archive = stack.enter_context(
+                            zipfile.ZipFile(stack.enter_context(archive.open(member)))
+                        )
+                    with archive.open(txc_file.members[-1]) as source, open(
+                        local_path, "wb"
+                    ) as destination:
+                        shutil.copyfileobj(source, destination)
+        timer.count("Download", bytes=txc_file.size)
+
+        yield local_path
+    finally:
+        if os.path.exists(local_path):
+            os.remove(local_path)
+
+
+# Set once in each worker process by init_worker
+worker: dict = {}
+
+
+def init_worker(dsn: str, bank_holidays, log_level: int, tmp_dir: str):
+    logging.basicConfig(format=LOG_FORMAT)
+    logger.setLevel(log_level)
+
+    worker["connection_manager"] = ConnectionManager(lambda force_fetch: dsn)
+    worker["bank_holidays"] = bank_holidays
+    worker["metrics"] = Metrics(namespace=METRIC_NAMESPACE)
+    worker["s3"] = boto3.client("s3")
+    worker["tmp_dir"] = tempfile.mkdtemp(dir=tmp_dir)
+
+
+def load_file(txc_file: TxcFile) -> dict:
+    """Write one file on the worker's own connection and describe the outcome."""
+    connection_manager = worker["connection_manager"]
+    metrics = worker["metrics"]
+    timer = StageTimer()
+    result = {"key": txc_file.key, "bytes": txc_file.size, "status": "failed"}
+    data_source, _ = get_data_source_and_region_code(txc_file.key)
+    # Cleared with the metrics after every file
+    add_data_source_dimension(metrics, data_source)
+
+    try:
+        with open_local_copy(txc_file, worker["tmp_dir"], worker["s3"], timer) as path:
+            written = write_txc_file_to_db(
+                path,
+                txc_file.size,
+                txc_file.key,
+                connection_manager.get_connection(),
+                logger,
+                metrics,
+                worker["bank_holidays"],
+                timer,
+            )
+        result["status"] = "written" if written else "skipped"
+    except Exception as e:
+        result["error"] = str(e)
+    finally:
+        connection_manager.release()
+
+        summary = timer.summary()
+        result["seconds"] = summary["total_seconds"]
+        result["stages"] = summary["stages"]
+        # The reasons a file was skipped are only recorded as metrics
+        result["metrics"] = sorted(metrics.metric_set)
+        metrics.clear_metrics()
+
+    return result
+
+
+class Progress:
+    """Print files done, failures and throughput as results arrive."""
+
+    def __init__(self, total_files: int, total_bytes: int, stream=sys.stderr):
+        self.total_files = total_files
+        self.total_bytes = total_bytes
+        self.stream = stream
+        self.started = time.perf_counter()
+        self.files = 0
+        self.bytes = 0
+        self.statuses = {"written": 0, "skipped": 0, "failed": 0}
+
+    def update(self, result: dict):
+        self.files += 1
+        self.bytes += result["bytes"]
+        self.statuses[result["status"]] += 1
+
+        elapsed = time.perf_counter() - self.started
+        self.stream.write(
+            f"\r{self.files}/{self.total_files} files"
+            f" ({self.bytes / max(self.total_bytes, 1):.0%} of bytes),"
+            f" {self.statuses['failed']} failed,"
+            f" {self.files / elapsed:.1f} files/s,"
+            f" {self.bytes / 1024 / 1024 / elapsed:.1f} MB/s"
+        )
+        self.stream.flush()
+
+    def finish(self) -> str:
+        self.stream.write("\n")
+
+        return (
+            f"Loaded {self.files} files in {time.perf_counter() - self.started:.1f}s:"
+            f" {self.statuses['written']} written, {self.statuses['skipped']} skipped,"
+            f" {self.statuses['failed']} failed"
+        )
+
+
+def check_new_tables(cursor) -> list:
+    """Describe what is missing for a load into the _new tables."""
+    cursor.execute(
+        "SELECT name FROM unnest(%s::text[]) AS name WHERE to_regclass(name) IS NULL",
+        (list(TXC_NEW_TABLES),),
+    )
+    problems = [f"{name} does not exist" for (name,) in cursor.fetchall()]
+
+    if "operators_new does not exist" not in problems:
+        cursor.execute("SELECT EXISTS (SELECT 1 FROM operators_new)")
+        if not cursor.fetchone()[0]:
+            problems.append("operators_new is empty, so every file would be skipped")
+
+    return problems
+
+
+def bulk_load(
+    files: list,
+    dsn: str,
+    bank_holidays,
+    workers: int,
+    summary_file,
+    log_level: int = logging.WARNING,
+) -> dict:
+    progress = Progress(len(files), sum(file.size for file in files))
+
+    with tempfile.TemporaryDirectory(prefix="bulk_load_") as tmp_dir, ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=init_worker,
+        initargs=(dsn, bank_holidays, log_level, tmp_dir),
+    ) as executor:
+        futures = [executor.submit(load_file, txc_file) for txc_file in files]
+
+        for future in as_completed(futures):
+            result = future.result()
+            summary_file.write(json.dumps(result) + "\n")
+            progress.update(result)
+
+    print(progress.finish())
+
+    return progress.statuses
+
+
+def load_bank_holidays(path: Optional[str]):
+    if path is None:
+        logger.warning("No --bank-holidays given, journeys are loaded as if there were none")
+        return []
+
+    with open(path) as file:
+        return json.load(file)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("source", help="Directory, zip archive or s3://bucket/prefix")
+    parser.add_argument(
+        "--key-prefix",
+        default="local/bods",
+        help="Prefix of local files' keys, whose second part is the data source",
+    )
+    parser.add_argument("--dsn", default=os.getenv("BULK_LOAD_DSN", DEFAULT_DSN))
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--bank-holidays", help="Path to a bank-holidays.json")
+    parser.add_argument("--summary", default="bulk-load-summary.jsonl")
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+
+    logging.basicConfig(format=LOG_FORMAT)
+
+    with contextlib.closing(psycopg2.connect(args.dsn)) as connection:
+        with connection.cursor() as cursor:
+            problems = check_new_tables(cursor)
+
+    if problems:
+        print("Run db-cleardown and the CSV and NPTG uploaders first:")
+        for problem in problems:
+            print(f"  {problem}")
+        sys.exit(2)
+
+    files = find_txc_files(args.source, args.key_prefix)
+    print(f"Found {len(files)} TXC files in '{args.source}'")
+
+    with open(args.summary, "w") as summary_file:
+        statuses = bulk_load(
+            files,
+            args.dsn,
+            load_bank_holidays(args.bank_holidays),
+            args.workers,
+            summary_file,
+            logging.INFO if args.verbose else logging.WARNING,
+        )
+    print(f"Per-file results written to '{args.summary}'")
+    print("Run table-renamer to swap the _new tables in for the live ones")
+
+    if statuses["failed"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
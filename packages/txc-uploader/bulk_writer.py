@@ -0,0 +1,85 @@
+import datetime
+import io
+from typing import Optional
+
+from psycopg2.extensions import cursor as Cursor
+
+# Below this many rows a single multi-row INSERT is cheaper than setting up a COPY
+COPY_THRESHOLD = 50
+
+COPY_ESCAPES = str.maketrans(
+    {
+        "\\": "\\\\",
+        "\t": "\\t",
+        "\n": "\\n",
+        "\r": "\\r",
+    }
+)
+
+
+def format_copy_value(value) -> str:
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+    return str(value).translate(COPY_ESCAPES)
+
+
+def write_copy_buffer(rows) -> io.StringIO:
+    buffer = io.StringIO()
+    for row in rows:
+        buffer.write("\t".join([format_copy_value(value) for value in row]))
+        buffer.write("\n")
+    buffer.seek(0)
+
+    return buffer
+
+
+def copy_rows(cursor: Cursor, table: str, columns: tuple, rows: list):
+    cursor.copy_expert(
+        f"COPY {table} ({', '.join(columns)}) FROM STDIN",
+        write_copy_buffer(rows),
+    )
+
+
+def insert_rows(
+    cursor: Cursor,
+    table: str,
+    columns: tuple,
+    rows: list,
+    returning: Optional[str] = None,
+    on_conflict: Optional[str] = None,
+):
+    row_placeholder = f"({', '.join(['%s'] * len(columns))})"
+    query = f"INSERT INTO {table} ({', '.join(columns)}) VALUES {', '.join([row_placeholder] * len(rows))}"
+
+    if on_conflict:
+        query += f" ON CONFLICT {on_conflict}"
+
+    if returning:
+        query += f" RETURNING {returning}"
+
+    cursor.execute(query, [value for row in rows for value in row])
+
+    if returning:
+        # Postgres does not guarantee RETURNING rows follow the VALUES order
+        # and leaves out any skipped by ON CONFLICT DO NOTHING, so callers
+        # return the columns they need to match rows up
+        return cursor.fetchall()
+
+
+def bulk_insert(cursor: Cursor, table: str, columns: tuple, rows: list):
+    """Write rows of a child table in a single round trip.
+
+    Large batches are streamed through COPY FROM STDIN from an in-memory
+    buffer, small ones are sent as one multi-row INSERT.
+    """
+    if not rows:
+        return
+
+    if len(rows) >= COPY_THRESHOLD:
+        copy_rows(cursor, table, columns, rows)
+    else:
+        insert_rows(cursor, table, columns, rows)
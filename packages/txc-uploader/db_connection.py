@@ -0,0 +1,138 @@
+import logging
+import time
+from typing import Callable, Optional
+
+import psycopg2
+from aws_lambda_powertools import Metrics
+from aws_lambda_powertools.metrics import MetricUnit
+from psycopg2.extensions import TRANSACTION_STATUS_IDLE, TRANSACTION_STATUS_UNKNOWN
+from psycopg2.extensions import connection as Connection
+
+logger = logging.getLogger()
+
+
+class ConnectionManager:
+    """Keep one database connection per warm Lambda container.
+
+    get_dsn is called with force_fetch=True after an authentication failure
+    so that rotated credentials are picked up on the retry. A kept
+    connection is probed with a query before every reuse, as the server may
+    have closed it however briefly it has been idle.
+    """
+
+    def __init__(
+        self,
+        get_dsn: Callable[[bool], str],
+        connect: Callable[[str], Connection] = psycopg2.connect,
+    ):
+        self.get_dsn = get_dsn
+        self.connect = connect
+        self.connection: Optional[Connection] = None
+        self.connections_opened = 0
+        self.connections_reused = 0
+        self.connect_seconds = 0.0
+        # Totals already added to metrics by put_metrics
+        self.reported = (0, 0, 0.0)
+
+    def is_healthy(self) -> bool:
+        connection = self.connection
+
+        if connection is None or connection.closed:
+            return False
+
+        if connection.get_transaction_status() == TRANSACTION_STATUS_UNKNOWN:
+            return False
+
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            connection.rollback()
+            return True
+        except psycopg2.Error:
+            return False
+
+    def open_connection(self) -> Connection:
+        start = time.perf_counter()
+
+        try:
+            connection = self.connect(self.get_dsn(False))
+        except psycopg2.OperationalError:
+            logger.warning("Database connection failed, retrying with fresh credentials")
+            connection = self.connect(self.get_dsn(True))
+        finally:
+            self.connect_seconds += time.perf_counter() - start
+
+        self.connections_opened += 1
+
+        return connection
+
+    def get_connection(self) -> Connection:
+        if self.is_healthy():
+            self.connections_reused += 1
+        else:
+            self.close()
+            self.connection = self.open_connection()
+
+        self.reset()
+
+        return self.connection  # type: ignore
+
+    def reset(self):
+        """Roll back anything left open so the next file starts clean."""
+        if self.connection is None or self.connection.closed:
+            return
+
+        if self.connection.get_transaction_status() != TRANSACTION_STATUS_IDLE:
+            self.connection.rollback()
+
+    def release(self):
+        try:
+            self.reset()
+        except psycopg2.Error:
+            self.close()
+
+    def close(self):
+        if self.connection is not None:
+            try:
+                self.connection.close()
+            except psycopg2.Error:
+                pass
+
+        self.connection = None
+
+    def metrics(self) -> dict:
+        requests = self.connections_opened + self.connections_reused
+
+        return {
+            "connections_opened": self.connections_opened,
+            "connections_reused": self.connections_reused,
+            "reuse_rate": self.connections_reused / requests if requests else 0.0,
+            "connect_seconds": round(self.connect_seconds, 4),
+        }
+
+    def put_metrics(self, metrics: Metrics):
+        """Add the connections requested since the last call to the
+        invocation's metrics. An invocation requests one connection, so the
+        average reuse rate over a run is the share of files that reused one."""
+        opened, reused, connect_seconds = self.reported
+        opened = self.connections_opened - opened
+        reused = self.connections_reused - reused
+        connect_seconds = self.connect_seconds - connect_seconds
+        self.reported = (
+            self.connections_opened,
+            self.connections_reused,
+            self.connect_seconds,
+        )
+
+        if not opened + reused:
+            return
+
+        metrics.add_metric(
+            name="ConnectionReuseRate",
+            unit=MetricUnit.Percent,
+            value=reused / (opened + reused) * 100,
+        )
+        metrics.add_metric(name="ConnectionsOpened", unit=MetricUnit.Count, value=opened)
+        metrics.add_metric(
+            name="ConnectTimeSeconds", unit=MetricUnit.Seconds, value=connect_seconds
+        )
@@ -0,0 +1,147 @@
+import contextlib
+import json
+import os
+import sys
+import time
+from typing import Optional
+
+import psycopg2
+from psycopg2.extensions import connection as Connection
+from psycopg2.extensions import cursor as Cursor
+
+import bulk_writer
+
+# Statements are named after the first caller outside these files
+HELPER_FILES = (__file__, bulk_writer.__file__)
+
+
+def get_db_profile_enabled() -> bool:
+    return os.getenv("TXC_DB_PROFILE", "false").lower() == "true"
+
+
+def get_explain_threshold_ms() -> Optional[float]:
+    threshold = os.getenv("TXC_DB_PROFILE_EXPLAIN_MS")
+
+    return float(threshold) if threshold else None
+
+
+def get_statement_template(frame) -> str:
+    while frame is not None and frame.f_code.co_filename in HELPER_FILES:
+        frame = frame.f_back
+
+    return frame.f_code.co_qualname if frame is not None else "unknown"
+
+
+class StatementProfile:
+    """Call counts, latency and rows of the statements sent for one file,
+    grouped by the function that sent them.
+
+    With an explain threshold set, the query plan of the first statement of
+    each group to take at least that long is kept alongside the counts.
+    """
+
+    def __init__(self, explain_threshold_ms: Optional[float] = None):
+        self.explain_threshold_ms = explain_threshold_ms
+        self.statements = {}
+        self.plans = {}
+
+    def record(self, template: str, seconds: float, rows: int):
+        statement = self.statements.setdefault(
+            template, {"calls": 0, "total_ms": 0.0, "max_ms": 0.0, "rows": 0}
+        )
+        statement["calls"] += 1
+        statement["total_ms"] += seconds * 1000
+        statement["max_ms"] = max(statement["max_ms"], seconds * 1000)
+        statement["rows"] += rows
+
+    def needs_plan(self, template: str, seconds: float) -> bool:
+        return (
+            self.explain_threshold_ms is not None
+            and seconds * 1000 >= self.explain_threshold_ms
+            and template not in self.plans
+        )
+
+    def summary(self) -> dict:
+        return {
+            "statements": {
+                template: {
+                    **statement,
+                    "total_ms": round(statement["total_ms"], 3),
+                    "max_ms": round(statement["max_ms"], 3),
+                }
+                for template, statement in sorted(
+                    self.statements.items(),
+                    key=lambda item: item[1]["total_ms"],
+                    reverse=True,
+                )
+            },
+            "plans": self.plans,
+        }
+
+
+class ProfilingCursor(Cursor):
+    """Cursor that records each statement it sends in a StatementProfile."""
+
+    profile: StatementProfile
+
+    def execute(self, query, vars=None):
+        return self.run(super().execute, query, vars, explain=True)
+
+    def executemany(self, query, vars_list):
+        return self.run(super().executemany, query, vars_list)
+
+    def copy_expert(self, sql, file, size=8192):
+        return self.run(super().copy_expert, sql, file, size)
+
+    def run(self, method, *args, explain=False):
+        template = get_statement_template(sys._getframe(2))
+        start = time.perf_counter()
+
+        result = method(*args)
+
+        seconds = time.perf_counter() - start
+        self.profile.record(template, seconds, max(self.rowcount, 0))
+
+        if explain and self.profile.needs_plan(template, seconds):
+            self.profile.plans[template] = self.explain(*args)
+
+        return result
+
+    def explain(self, query, vars) -> str:
+        """Run the statement again under EXPLAIN (ANALYZE, BUFFERS) and undo it.
+
+        The plan is taken inside a savepoint on a separate cursor, so neither
+        the transaction nor this cursor's results are changed. It describes a
+        second run, so caches are warm and inserts may now hit conflicts.
+        """
+        with self.connection.cursor() as cursor:
+            cursor.execute("SAVEPOINT statement_profile")
+            try:
+                cursor.execute(
+                    b"EXPLAIN (ANALYZE, BUFFERS) " + cursor.mogrify(query, vars)
+                )
+                return "\n".join(row[0] for row in cursor.fetchall())
+            except psycopg2.Error as e:
+                return f"EXPLAIN failed: {e}"
+            finally:
+                cursor.execute("ROLLBACK TO SAVEPOINT statement_profile")
+                cursor.execute("RELEASE SAVEPOINT statement_profile")
+
+
+@contextlib.contextmanager
+def open_cursor(db_connection: Connection, logger, key: str):
+    """Open the cursor used for a file, profiling its statements when
+    TXC_DB_PROFILE is true and logging the profile once the file is done."""
+    if not get_db_profile_enabled():
+        with db_connection.cursor() as cursor:
+            yield cursor
+        return
+
+    with db_connection.cursor(cursor_factory=ProfilingCursor) as cursor:
+        cursor.profile = StatementProfile(get_explain_threshold_ms())
+        try:
+            yield cursor
+        finally:
+            logger.info(
+                f"Database statement profile for TXC file: '{key}' - {json.dumps(cursor.profile.summary())}"
+            )
@@ -0,0 +1,159 @@
+import contextlib
+import cProfile
+import datetime
+import marshal
+import os
+import threading
+import tracemalloc
+from typing import Optional
+
+# Frames kept per allocation, enough to see which stage a site belongs to
+TRACEMALLOC_FRAMES = 10
+
+TOP_ALLOCATION_SITES = 50
+
+# A new snapshot replaces the kept one once traced memory has grown this much
+SNAPSHOT_GROWTH = 1.25
+
+SNAPSHOT_POLL_SECONDS = 0.25
+
+IGNORED_ALLOCATION_FILES = {
+    tracemalloc.__file__,
+    threading.__file__,
+    "<frozen importlib._bootstrap>",
+    "<frozen importlib._bootstrap_external>",
+}
+
+
+def get_profile_s3_uri(event: dict) -> Optional[str]:
+    """Return where to write the profile of this invocation, or None when
+    profiling is off.
+
+    Profiling is switched on by TXC_PROFILE=true or a "profile": true field
+    on the event. The destination is the event's "profileS3Uri" field or
+    TXC_PROFILE_S3_URI, as s3://bucket/prefix.
+    """
+    enabled = (
+        os.getenv("TXC_PROFILE", "false").lower() == "true"
+        or event.get("profile") is True
+    )
+
+    if not enabled:
+        return None
+
+    s3_uri = event.get("profileS3Uri") or os.getenv("TXC_PROFILE_S3_URI")
+
+    if not s3_uri or not s3_uri.startswith("s3://"):
+        raise ValueError(
+            "TXC_PROFILE_S3_URI or profileS3Uri must be set to an s3:// URI to profile a file"
+        )
+
+    return s3_uri
+
+
+def split_s3_uri(s3_uri: str) -> tuple:
+    bucket, _, prefix = s3_uri[len("s3://") :].partition("/")
+
+    return bucket, prefix.strip("/")
+
+
+class PeakSnapshot(threading.Thread):
+    """Keep a tracemalloc snapshot taken close to the peak of traced memory.
+
+    Most of a file's memory is freed by the time it has been written, so a
+    snapshot taken at the end would miss the allocations that matter.
+    Traced memory is polled in the background instead, and a new snapshot
+    is taken whenever it has grown by SNAPSHOT_GROWTH since the last one.
+    """
+
+    def __init__(self, poll_seconds: float = SNAPSHOT_POLL_SECONDS):
+        super().__init__(daemon=True)
+        self.poll_seconds = poll_seconds
+        self.stopped = threading.Event()
+        self.snapshot: Optional[tracemalloc.Snapshot] = None
+        self.snapshot_size = 0
+
+    def run(self):
+        while not self.stopped.wait(self.poll_seconds):
+            self.take_if_grown()
+
+    def take_if_grown(self):
+        current, _ = tracemalloc.get_traced_memory()
+
+        if current > 0 and current >= self.snapshot_size * SNAPSHOT_GROWTH:
+            self.snapshot = tracemalloc.take_snapshot()
+            self.snapshot_size = current
+
+    def stop(self):
+        self.stopped.set()
+        self.join()
+        self.take_if_grown()
+
+
+def format_allocations(peak_snapshot: PeakSnapshot, peak: int) -> str:
+    lines = [
+        f"Peak traced memory: {peak / 1024 / 1024:.1f} MiB",
+        f"Top {TOP_ALLOCATION_SITES} allocation sites with "
+        f"{peak_snapshot.snapshot_size / 1024 / 1024:.1f} MiB traced:",
+    ]
+
+    if peak_snapshot.snapshot is not None:
+        # Filtering traces is far slower than dropping the grouped sites
+        statistics = [
+            statistic
+            for statistic in peak_snapshot.snapshot.statistics("lineno")
+            if statistic.traceback[0].filename not in IGNORED_ALLOCATION_FILES
+        ]
+        for statistic in statistics[:TOP_ALLOCATION_SITES]:
+            lines.append(str(statistic))
+
+    return "\n".join(lines) + "\n"
+
+
+@contextlib.contextmanager
+def profile_file(s3, s3_uri: Optional[str], key: str, logger):
+    """Run the body under cProfile and tracemalloc and upload the results.
+
+    Writes <prefix>/<key>/<timestamp>.pstats, loadable with pstats.Stats,
+    and <prefix>/<key>/<timestamp>.allocations.txt. With no s3_uri the body
+    runs untouched.
+    """
+    if s3_uri is None:
+        yield
+        return
+
+    bucket, prefix = split_s3_uri(s3_uri)
+    timestamp = datetime.datetime.now(datetime.timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    output_key = "/".join(part for part in (prefix, key, timestamp) if part)
+
+    profiler = cProfile.Profile()
+    tracemalloc.start(TRACEMALLOC_FRAMES)
+    peak_snapshot = PeakSnapshot()
+    peak_snapshot.start()
+    profiler.enable()
+
+    try:
+        yield
+    finally:
+        profiler.disable()
+        peak_snapshot.stop()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        try:
+            profiler.create_stats()
+            s3.put_object(
+                Bucket=bucket,
+                Key=f"{output_key}.pstats",
+                Body=marshal.dumps(profiler.stats),
+            )
+            s3.put_object(
+                Bucket=bucket,
+                Key=f"{output_key}.allocations.txt",
+                Body=format_allocations(peak_snapshot, peak).encode("utf-8"),
+                ContentType="text/plain",
+            )
+            logger.info(f"Profile of '{key}' written to 's3://{bucket}/{output_key}'")
+        except Exception as e:
+            # A failed upload must not hide the outcome of the file itself
+            logger.error(f"Could not write profile of '{key}', error: {e}")
@@ -4,14 +4,24 @@ import os
 import boto3
 import json
 from botocore.exceptions import NoCredentialsError, PartialCredentialsError
-import psycopg2
+from aws_lambda_powertools import Metrics
 from aws_lambda_powertools.utilities import parameters
 from aws_lambda_powertools.utilities.data_classes import S3Event, event_source
 from aws_lambda_powertools.utilities.typing import LambdaContext
-from txc_processor import download_from_s3_and_write_to_db
+from db_connection import ConnectionManager
+from file_profiler import get_profile_s3_uri, profile_file
+from txc_processor import (
+    METRIC_NAMESPACE,
+    add_data_source_dimension,
+    download_from_s3_and_write_to_db,
+    get_data_source_and_region_code,
+)
 
 s3_client = boto3.client("s3")
-cloudwatch_client = boto3.client("cloudwatch")
+
+# Metrics are buffered and written as one embedded metric format log line
+# at the end of each invocation
+metrics = Metrics(namespace=METRIC_NAMESPACE)
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
@@ -38,12 +48,7 @@ def get_bank_holidays_json(bucket):
     return json.loads(body)
 
 
-@event_source(data_class=S3Event)
-def main(event: S3Event, context: LambdaContext):
-    bucket = event.bucket_name
-    key = event.object_key
-    file_path = "/tmp/" + key.split("/")[-1]
-
+def get_db_dsn(force_fetch: bool = False) -> str:
     db_name_param = os.environ["DATABASE_NAME_PARAM"]
     db_host_param = os.environ["DATABASE_HOST_PARAM"]
     db_username_param = os.environ["DATABASE_USERNAME_PARAM"]
@@ -60,27 +65,44 @@ def main(event: S3Event, context: LambdaContext):
             db_port_param: {},
             db_password_param: {},
         },
-        max_age=3600,
+        # A max_age of 0 bypasses the cache when credentials may have rotated
+        max_age=0 if force_fetch else 3600,
         decrypt=True,
     )
 
-    with psycopg2.connect(
-        f'host={"localhost" if is_local else db_params[db_host_param]} dbname={db_params[db_name_param]} user={db_params[db_username_param]} password={db_params[db_password_param]} port={"35432" if is_local else db_params[db_port_param]}'
-    ) as db_connection:
-        try:
-            bank_holidays_bucket_name = os.getenv("BANK_HOLIDAYS_BUCKET_NAME")
+    return f'host={"localhost" if is_local else db_params[db_host_param]} dbname={db_params[db_name_param]} user={db_params[db_username_param]} password={db_params[db_password_param]} port={"35432" if is_local else db_params[db_port_param]}'
+
+
+connection_manager = ConnectionManager(get_db_dsn)
+
+
+@metrics.log_metrics
+@event_source(data_class=S3Event)
+def main(event: S3Event, context: LambdaContext):
+    bucket = event.bucket_name
+    key = event.object_key
+    file_path = "/tmp/" + key.split("/")[-1]
 
-            if not bank_holidays_bucket_name:
-                raise Exception(
-                    "Missing env vars - BANK_HOLIDAYS_BUCKET_NAME must be set"
-                )
+    data_source, _ = get_data_source_and_region_code(key)
+    add_data_source_dimension(metrics, data_source)
 
-            logger.info("Retrieving bank holidays JSON")
-            bank_holidays_json = get_bank_holidays_json(bank_holidays_bucket_name)
+    db_connection = connection_manager.get_connection()
 
+    try:
+        bank_holidays_bucket_name = os.getenv("BANK_HOLIDAYS_BUCKET_NAME")
+
+        if not bank_holidays_bucket_name:
+            raise Exception("Missing env vars - BANK_HOLIDAYS_BUCKET_NAME must be set")
+
+        logger.info("Retrieving bank holidays JSON")
+        bank_holidays_json = get_bank_holidays_json(bank_holidays_bucket_name)
+
+        with profile_file(
+            s3_client, get_profile_s3_uri(event.raw_event), key, logger
+        ):
             download_from_s3_and_write_to_db(
                 s3_client,
-                cloudwatch_client,
+                metrics,
                 bucket,
                 key,
                 file_path,
@@ -88,14 +110,17 @@ def main(event: S3Event, context: LambdaContext):
                 logger,
                 bank_holidays_json,
             )
-        except Exception as e:
-            logger.error(
-                f"ERROR! Failed to write contents of 's3://{bucket}/{key}' to database, error: {e}"
-            )
-            raise e
-        finally:
-            if os.path.exists(file_path):
-                logger.info(f"Removing File: {file_path}")
-                os.remove(file_path)
-            else:
-                logger.warn(f"File does not exist: {file_path}")
+    except Exception as e:
+        logger.error(
+            f"ERROR! Failed to write contents of 's3://{bucket}/{key}' to database, error: {e}"
+        )
+        raise e
+    finally:
+        connection_manager.release()
+        logger.info(f"Database connection metrics: {connection_manager.metrics()}")
+        connection_manager.put_metrics(metrics)
+
+        # Only files too large to parse in memory are written to /tmp
+        if os.path.exists(file_path):
+            logger.info(f"Removing File: {file_path}")
+            os.remove(file_path)
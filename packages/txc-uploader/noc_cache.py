@@ -0,0 +1,53 @@
+import time
+from typing import Callable, Optional
+
+from psycopg2.extensions import cursor as Cursor
+
+# Operators are reloaded by the ref data pipeline between uploads, so a warm
+# container only needs to pick up a new table within a few minutes
+NOC_CACHE_TTL_SECONDS = 300
+
+
+class NocCache:
+    """NOC codes of every known operator, kept for the life of a warm Lambda
+    container.
+
+    The codes are loaded with one query and reloaded once they are older
+    than ttl_seconds, so services of unknown operators can be rejected
+    without sending an insert that would fail.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = NOC_CACHE_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.clock = clock
+        self.noc_codes: Optional[frozenset] = None
+        self.loaded_at = 0.0
+        self.loads = 0
+
+    def is_fresh(self) -> bool:
+        return (
+            self.noc_codes is not None
+            and self.clock() - self.loaded_at < self.ttl_seconds
+        )
+
+    def load(self, cursor: Cursor) -> frozenset:
+        cursor.execute("SELECT noc_code FROM operators_new")
+
+        self.noc_codes = frozenset(noc_code for (noc_code,) in cursor.fetchall())
+        self.loaded_at = self.clock()
+        self.loads += 1
+
+        return self.noc_codes
+
+    def get_noc_codes(self, cursor: Cursor) -> frozenset:
+        if self.is_fresh():
+            return self.noc_codes  # type: ignore
+
+        return self.load(cursor)
+
+    def clear(self):
+        self.noc_codes = None
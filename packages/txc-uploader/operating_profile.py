@@ -0,0 +1,332 @@
+import datetime
+import os
+from functools import lru_cache
+from typing import Optional
+
+from txc_document import make_list
+
+bank_holiday_txc_mapping = {
+    "New Year’s Day": "NewYearsDay",
+    "Good Friday": "GoodFriday",
+    "Easter Monday": "EasterMonday",
+    "Early May bank holiday": "MayDay",
+    "Spring bank holiday": "SpringBank",
+    "Summer bank holiday": "LateSummerBankHolidayNotScotland",
+    "Scotland Summer bank holiday": "AugustBankHolidayScotland",
+    "Christmas Day": "ChristmasDayHoliday",
+    "Boxing Day": "BoxingDayHoliday",
+    "2nd January": "Jan2ndScotland",
+    "St Andrew’s Day": "StAndrewsDayHoliday",
+}
+
+WEEKDAYS = [
+    "Monday",
+    "Tuesday",
+    "Wednesday",
+    "Thursday",
+    "Friday",
+    "Saturday",
+    "Sunday",
+]
+
+# One bit per weekday, bit 0 is Monday to match datetime.date.weekday()
+WEEKDAY_BITS = {day: 1 << index for index, day in enumerate(WEEKDAYS)}
+ALL_DAYS = 0b1111111
+
+DAYS_OF_WEEK_MASKS = {
+    **WEEKDAY_BITS,
+    "MondayToFriday": 0b0011111,
+    "MondayToSaturday": 0b0111111,
+    "MondayToSunday": ALL_DAYS,
+    "Weekend": 0b1100000,
+    **{f"Not{day}": ALL_DAYS & ~bit for day, bit in WEEKDAY_BITS.items()},
+}
+
+OPERATING_PROFILE_CACHE_SIZE = 4096
+
+# The calendar is stored in a signed 64 bit column, one bit per day from the
+# ingest date, so the horizon can cover at most 63 days including today
+MAX_OPERATING_CALENDAR_HORIZON_DAYS = 62
+
+
+def get_operating_calendar_horizon_days() -> int:
+    horizon_days = int(os.getenv("OPERATING_CALENDAR_HORIZON_DAYS", "60"))
+
+    if not 0 <= horizon_days <= MAX_OPERATING_CALENDAR_HORIZON_DAYS:
+        raise ValueError(
+            f"OPERATING_CALENDAR_HORIZON_DAYS must be between 0 and {MAX_OPERATING_CALENDAR_HORIZON_DAYS}"
+        )
+
+    return horizon_days
+
+
+def days_of_week_mask(days_of_week) -> int:
+    mask = 0
+
+    if not days_of_week:
+        return mask
+
+    for key in days_of_week:
+        mask |= DAYS_OF_WEEK_MASKS.get(key, 0)
+
+    return mask
+
+
+def calculate_days_of_operation(days_of_week):
+    mask = days_of_week_mask(days_of_week)
+
+    return {day: None for day, bit in WEEKDAY_BITS.items() if mask & bit}
+
+
+def parse_date(value: Optional[str]) -> Optional[datetime.date]:
+    return datetime.date.fromisoformat(value) if value else None
+
+
+def compile_date_ranges(days) -> tuple:
+    if not days:
+        return ()
+
+    date_ranges = []
+    for date_range in make_list(days.get("DateRange") or []):
+        if not date_range:
+            continue
+
+        # A missing bound leaves the range open on that side
+        start_date = parse_date(date_range.get("StartDate")) or datetime.date.min
+        end_date = parse_date(date_range.get("EndDate")) or datetime.date.max
+        date_ranges.append((start_date, end_date))
+
+    return tuple(date_ranges)
+
+
+def freeze(value):
+    if isinstance(value, dict):
+        return tuple((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+class CompiledOperatingProfile:
+    """An OperatingProfile reduced to the data needed to evaluate a date.
+
+    Holds a weekday bitmask, pre-parsed special day ranges and the sets of
+    TXC bank holiday names the profile runs or does not run on.
+    """
+
+    __slots__ = (
+        "days_of_week",
+        "special_days_of_operation",
+        "special_days_of_non_operation",
+        "bank_holiday_operation",
+        "bank_holiday_non_operation",
+    )
+
+    def __init__(self, operating_profile: dict):
+        regular_day_type = operating_profile.get("RegularDayType") or {}
+        special_days_operation = operating_profile.get("SpecialDaysOperation") or {}
+        bank_holiday_operation = operating_profile.get("BankHolidayOperation") or {}
+
+        self.days_of_week = days_of_week_mask(regular_day_type.get("DaysOfWeek"))
+        self.special_days_of_operation = compile_date_ranges(
+            special_days_operation.get("DaysOfOperation")
+        )
+        self.special_days_of_non_operation = compile_date_ranges(
+            special_days_operation.get("DaysOfNonOperation")
+        )
+        self.bank_holiday_operation = frozenset(
+            bank_holiday_operation.get("DaysOfOperation") or ()
+        )
+        self.bank_holiday_non_operation = frozenset(
+            bank_holiday_operation.get("DaysOfNonOperation") or ()
+        )
+
+    def is_operational(self, date: datetime.date, bank_holidays: dict) -> bool:
+        for start_date, end_date in self.special_days_of_non_operation:
+            if start_date <= date <= end_date:
+                return False
+
+        for start_date, end_date in self.special_days_of_operation:
+            if start_date <= date <= end_date:
+                return True
+
+        bank_holiday_names = bank_holidays.get(date)
+
+        if bank_holiday_names is not None:
+            if "AllBankHolidays" in self.bank_holiday_operation:
+                return True
+
+            if "AllBankHolidays" in self.bank_holiday_non_operation:
+                return False
+
+            for txc_holiday_name in bank_holiday_names:
+                if txc_holiday_name in self.bank_holiday_operation:
+                    return True
+                if txc_holiday_name in self.bank_holiday_non_operation:
+                    return False
+
+        return bool(self.days_of_week & (1 << date.weekday()))
+
+
+# Fallback default operating profile
+DEFAULT_OPERATING_PROFILE = CompiledOperatingProfile(
+    {"RegularDayType": {"DaysOfWeek": {day: "" for day in WEEKDAYS}}}
+)
+
+
+_compiled_operating_profiles: dict = {}
+operating_profile_cache_stats = {"hits": 0, "misses": 0}
+
+
+def get_compiled_operating_profile(operating_profile) -> CompiledOperatingProfile:
+    """Return the compiled form of a profile, shared by every equal profile.
+
+    Profiles are keyed on their structure rather than identity because each
+    vehicle journey carries its own copy of the same few profiles.
+    """
+    if not operating_profile:
+        return DEFAULT_OPERATING_PROFILE
+
+    key = freeze(operating_profile)
+    compiled_operating_profile = _compiled_operating_profiles.get(key)
+
+    if compiled_operating_profile is not None:
+        operating_profile_cache_stats["hits"] += 1
+        return compiled_operating_profile
+
+    operating_profile_cache_stats["misses"] += 1
+
+    if len(_compiled_operating_profiles) >= OPERATING_PROFILE_CACHE_SIZE:
+        _compiled_operating_profiles.clear()
+
+    compiled_operating_profile = CompiledOperatingProfile(operating_profile)
+    _compiled_operating_profiles[key] = compiled_operating_profile
+
+    return compiled_operating_profile
+
+
+@lru_cache(maxsize=OPERATING_PROFILE_CACHE_SIZE)
+def compile_operating_period(start_date: str, end_date: Optional[str]):
+    return parse_date(start_date), parse_date(end_date)
+
+
+_bank_holiday_calendar_cache: list = [None, {}]
+
+
+def get_bank_holiday_calendar(bank_holidays) -> dict:
+    """Map each bank holiday date to the TXC names of the holidays on it.
+
+    The calendar for the most recent bank holiday list is kept so that every
+    journey evaluated against the same list shares it.
+    """
+    if _bank_holiday_calendar_cache[0] is bank_holidays:
+        return _bank_holiday_calendar_cache[1]
+
+    calendar = {}
+    for holiday in bank_holidays or []:
+        calendar.setdefault(parse_date(holiday["date"]), []).append(
+            bank_holiday_txc_mapping.get(holiday["title"], None)
+        )
+
+    _bank_holiday_calendar_cache[:] = [bank_holidays, calendar]
+    _operating_calendars.clear()
+
+    return calendar
+
+
+def is_operational_on(
+    operating_profile: CompiledOperatingProfile,
+    operating_period: tuple,
+    date: datetime.date,
+    bank_holiday_calendar: dict,
+) -> bool:
+    # Check the OperatingPeriod of the service
+    service_start_date, service_end_date = operating_period
+    if (service_end_date and service_end_date < date) or (service_start_date > date):
+        return False
+
+    return operating_profile.is_operational(date, bank_holiday_calendar)
+
+
+def get_journey_operating_profile(vehicle_journey, service_operating_profile):
+    # Use the vehicle journey's operating profile or fallback to the service's operating profile or default
+    return get_compiled_operating_profile(
+        vehicle_journey.get("OperatingProfile") or service_operating_profile
+    )
+
+
+def get_operating_period(service_operating_period) -> tuple:
+    return compile_operating_period(
+        service_operating_period["StartDate"],
+        service_operating_period.get("EndDate"),
+    )
+
+
+# Check if a vehicle service is operational_for_today
+def is_service_operational(
+    vehicle_journey,
+    bank_holidays,
+    service_operating_profile,
+    service_operating_period,
+    today=None,
+):
+    if today is None:
+        today = datetime.date.today()
+
+    return is_operational_on(
+        get_journey_operating_profile(vehicle_journey, service_operating_profile),
+        get_operating_period(service_operating_period),
+        today,
+        get_bank_holiday_calendar(bank_holidays),
+    )
+
+
+_operating_calendars: dict = {}
+
+
+def get_operating_calendar(
+    vehicle_journey,
+    bank_holidays,
+    service_operating_profile,
+    service_operating_period,
+    start_date: datetime.date,
+    horizon_days: int,
+) -> int:
+    """Return a bitset of the days a journey runs, bit 0 being start_date.
+
+    Journeys sharing a compiled profile and service period share the
+    calendar, so each distinct combination is only evaluated once.
+    """
+    operating_profile = get_journey_operating_profile(
+        vehicle_journey, service_operating_profile
+    )
+    operating_period = get_operating_period(service_operating_period)
+    bank_holiday_calendar = get_bank_holiday_calendar(bank_holidays)
+
+    key = (operating_profile, operating_period, start_date, horizon_days)
+    operating_calendar = _operating_calendars.get(key)
+
+    if operating_calendar is None:
+        operating_calendar = 0
+        for offset in range(horizon_days + 1):
+            date = start_date + datetime.timedelta(days=offset)
+            if is_operational_on(
+                operating_profile, operating_period, date, bank_holiday_calendar
+            ):
+                operating_calendar |= 1 << offset
+
+        if len(_operating_calendars) >= OPERATING_PROFILE_CACHE_SIZE:
+            _operating_calendars.clear()
+        _operating_calendars[key] = operating_calendar
+
+    return operating_calendar
+
+
+def runs_on(
+    operating_calendar: int, start_date: datetime.date, date: datetime.date
+) -> bool:
+    offset = (date - start_date).days
+
+    return 0 <= offset <= MAX_OPERATING_CALENDAR_HORIZON_DAYS and bool(
+        operating_calendar >> offset & 1
+    )
@@ -0,0 +1,97 @@
+import collections
+import io
+from concurrent.futures import ThreadPoolExecutor
+
+DEFAULT_PART_SIZE = 8 * 1024 * 1024
+DEFAULT_MAX_CONCURRENCY = 8
+
+
+class S3RangeReader(io.RawIOBase):
+    """Read-only file object over an S3 object fetched with ranged GETs.
+
+    Up to max_concurrency ranges are requested ahead of the reader and handed
+    over in order, so a parser can consume the start of the object while
+    later ranges are still downloading. At most max_concurrency parts are
+    held in memory at once.
+    """
+
+    def __init__(
+        self,
+        s3,
+        bucket: str,
+        key: str,
+        size: int,
+        part_size: int = DEFAULT_PART_SIZE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ):
+        super().__init__()
+        self.s3 = s3
+        self.bucket = bucket
+        self.key = key
+        self.ranges = [
+            (start, min(start + part_size, size) - 1)
+            for start in range(0, size, part_size)
+        ]
+        self.max_concurrency = max_concurrency
+        self.executor = ThreadPoolExecutor(max_workers=max_concurrency)
+        self.pending = collections.deque()
+        self.next_range = 0
+        self.part = b""
+        self.position = 0
+
+        self.schedule()
+
+    def fetch(self, byte_range: tuple) -> bytes:
+        start, end = byte_range
+        response = self.s3.get_object(
+            Bucket=self.bucket, Key=self.key, Range=f"bytes={start}-{end}"
+        )
+
+        return response["Body"].read()
+
+    def schedule(self):
+        while len(self.pending) < self.max_concurrency and self.next_range < len(
+            self.ranges
+        ):
+            self.pending.append(
+                self.executor.submit(self.fetch, self.ranges[self.next_range])
+            )
+            self.next_range += 1
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while self.position >= len(self.part):
+            if not self.pending:
+                return 0
+
+            self.part = self.pending.popleft().result()
+            self.position = 0
+            self.schedule()
+
+        size = min(len(buffer), len(self.part) - self.position)
+        buffer[:size] = self.part[self.position : self.position + size]
+        self.position += size
+
+        return size
+
+    def close(self):
+        if not self.closed:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.pending.clear()
+
+        super().close()
+
+
+def open_s3_object(
+    s3,
+    bucket: str,
+    key: str,
+    size: int,
+    part_size: int = DEFAULT_PART_SIZE,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> io.BufferedReader:
+    return io.BufferedReader(
+        S3RangeReader(s3, bucket, key, size, part_size, max_concurrency)
+    )
@@ -0,0 +1,66 @@
+import contextlib
+import time
+from typing import Callable
+
+from aws_lambda_powertools import Metrics
+from aws_lambda_powertools.metrics import MetricUnit
+
+
+class StageTimer:
+    """Wall time, row counts and bytes of each stage of ingesting one file.
+
+    Spans of the same stage add up, so a stage timed once per line reports
+    its total for the file. Spans may nest, in which case the outer stage
+    includes the time of the stages inside it.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter):
+        self.clock = clock
+        self.started = clock()
+        self.stages = {}
+
+    def get_stage(self, name: str) -> dict:
+        return self.stages.setdefault(
+            name, {"seconds": 0.0, "spans": 0, "rows": 0, "bytes": 0}
+        )
+
+    @contextlib.contextmanager
+    def span(self, name: str):
+        stage = self.get_stage(name)
+        start = self.clock()
+
+        try:
+            yield
+        finally:
+            stage["seconds"] += self.clock() - start
+            stage["spans"] += 1
+
+    def count(self, name: str, rows: int = 0, bytes: int = 0):
+        stage = self.get_stage(name)
+        stage["rows"] += rows
+        stage["bytes"] += bytes
+
+    def summary(self) -> dict:
+        return {
+            "total_seconds": round(self.clock() - self.started, 4),
+            "stages": {
+                name: {**stage, "seconds": round(stage["seconds"], 4)}
+                for name, stage in self.stages.items()
+            },
+        }
+
+    def put_metrics(self, metrics: Metrics):
+        """Add the stages to the invocation's metrics, so the per-file record
+        is written with them and can be aggregated across a whole run."""
+        for name, stage in self.stages.items():
+            metrics.add_metric(
+                name=f"{name}Seconds", unit=MetricUnit.Seconds, value=stage["seconds"]
+            )
+            if stage["rows"]:
+                metrics.add_metric(
+                    name=f"{name}Rows", unit=MetricUnit.Count, value=stage["rows"]
+                )
+            if stage["bytes"]:
+                metrics.add_metric(
+                    name=f"{name}Bytes", unit=MetricUnit.Bytes, value=stage["bytes"]
+                )
@@ -0,0 +1,45 @@
+from psycopg2.extensions import cursor as Cursor
+
+
+class StopResolver:
+    """Admin area codes and locations for every stop referenced in a file.
+
+    All stops are fetched with one set-based query when the resolver is
+    loaded, so later lookups for each journey pattern are served from memory.
+    """
+
+    def __init__(self, rows):
+        self.admin_area_codes_by_stop = {}
+        self.locations_by_stop = {}
+
+        for atco_code, administrative_area_code, longitude, latitude in rows:
+            admin_area_codes = self.admin_area_codes_by_stop.setdefault(atco_code, set())
+            if administrative_area_code is not None:
+                admin_area_codes.add(administrative_area_code)
+            self.locations_by_stop.setdefault(atco_code, (longitude, latitude))
+
+    @classmethod
+    def load(cls, cursor: Cursor, stop_codes):
+        if not stop_codes:
+            return cls([])
+
+        query = """
+            SELECT stops.atco_code, localities.administrative_area_code, stops.longitude, stops.latitude
+            FROM stops_new AS stops
+            LEFT JOIN localities_new AS localities ON localities.nptg_locality_code = stops.nptg_locality_code
+            WHERE stops.atco_code = ANY(%s)
+        """
+
+        cursor.execute(query, [list(stop_codes)])
+
+        return cls(cursor.fetchall() or [])
+
+    def get_admin_area_codes(self, stop_codes) -> set:
+        admin_area_codes = set()
+        for stop_code in stop_codes:
+            admin_area_codes.update(self.admin_area_codes_by_stop.get(stop_code, ()))
+
+        return admin_area_codes
+
+    def get_stop_location(self, atco_code):
+        return self.locations_by_stop.get(atco_code)
@@ -2,7 +2,9 @@ import os
 
 import boto3
 import pytest
+from aws_lambda_powertools import Metrics
 from moto import mock_aws
+from txc_processor import METRIC_NAMESPACE
 
 
 @pytest.fixture(scope="function")
@@ -27,6 +29,8 @@ def ssm(aws_credentials):
 
 
 @pytest.fixture(scope="function")
-def cloudwatch(aws_credentials):
-    with mock_aws():
-        yield boto3.client("cloudwatch", region_name="eu-west-2")
+def metrics():
+    metrics = Metrics(namespace=METRIC_NAMESPACE)
+    yield metrics
+    # Powertools keeps the metric set at class level, shared by all instances
+    metrics.clear_metrics()
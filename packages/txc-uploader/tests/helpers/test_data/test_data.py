@@ -1,3 +1,7 @@
+import datetime
+
+from txc_records import JourneyPatternTimingLink, TrackPoint, VehicleJourney
+
 expected_list_of_journey_pattern_section_refs = [
     {
         "journey_pattern_info": {
@@ -52,242 +56,242 @@ expected_list_of_journey_patterns = [
     {
         "journey_pattern_sections": [
             [
-                {
-                    "from_atco_code": "0600MA6152",
-                    "from_timing_status": "PTP",
-                    "from_sequence_number": "1",
-                    "to_atco_code": "0600MA6001",
-                    "to_timing_status": "OTH",
-                    "run_time": "PT1M",
-                    "to_sequence_number": "2",
-                    "route_link_ref": None,
-                }
+                JourneyPatternTimingLink(
+                    from_atco_code="0600MA6152",
+                    from_timing_status="PTP",
+                    from_sequence_number="1",
+                    to_atco_code="0600MA6001",
+                    to_timing_status="OTH",
+                    to_sequence_number="2",
+                    run_time="PT1M",
+                    route_link_ref=None,
+                )
             ],
             [
-                {
-                    "from_atco_code": "0600MA0018",
-                    "from_timing_status": "OTH",
-                    "from_sequence_number": "6",
-                    "to_atco_code": "0600MA0020A",
-                    "to_timing_status": "OTH",
-                    "run_time": "PT2M",
-                    "to_sequence_number": "7",
-                    "route_link_ref": None,
-                },
-                {
-                    "from_atco_code": "0600MA0020A",
-                    "from_timing_status": "OTH",
-                    "from_sequence_number": "7",
-                    "to_atco_code": "0600MA6032",
-                    "to_timing_status": "OTH",
-                    "run_time": "PT1M",
-                    "to_sequence_number": "8",
-                    "route_link_ref": None,
-                },
-                {
-                    "from_atco_code": "0600MA6032",
-                    "from_timing_status": "OTH",
-                    "from_sequence_number": "8",
-                    "to_atco_code": "0600MA0023",
-                    "to_timing_status": "OTH",
-                    "run_time": "PT1M",
-                    "to_sequence_number": "9",
-                    "route_link_ref": None,
-                },
-                {
-                    "from_atco_code": "0600MA0023",
-                    "from_timing_status": "OTH",
-                    "from_sequence_number": "9",
-                    "to_atco_code": "0600MA0026A",
-                    "to_timing_status": "OTH",
-                    "run_time": "PT2M",
-                    "to_sequence_number": "10",
-                    "route_link_ref": None,
-                },
-                {
-                    "from_atco_code": "0600MA0026A",
-                    "from_timing_status": "OTH",
-                    "from_sequence_number": "10",
-                    "to_atco_code": "0600MA6030",
-                    "to_timing_status": "OTH",
-                    "run_time": "PT1M",
-                    "to_sequence_number": "11",
-                    "route_link_ref": None,
-                },
+                JourneyPatternTimingLink(
+                    from_atco_code="0600MA0018",
+                    from_timing_status="OTH",
+                    from_sequence_number="6",
+                    to_atco_code="0600MA0020A",
+                    to_timing_status="OTH",
+                    to_sequence_number="7",
+                    run_time="PT2M",
+                    route_link_ref=None,
+                ),
+                JourneyPatternTimingLink(
+                    from_atco_code="0600MA0020A",
+                    from_timing_status="OTH",
+                    from_sequence_number="7",
+                    to_atco_code="0600MA6032",
+                    to_timing_status="OTH",
+                    to_sequence_number="8",
+                    run_time="PT1M",
+                    route_link_ref=None,
+                ),
+                JourneyPatternTimingLink(
+                    from_atco_code="0600MA6032",
+                    from_timing_status="OTH",
+                    from_sequence_number="8",
+                    to_atco_code="0600MA0023",
+                    to_timing_status="OTH",
+                    to_sequence_number="9",
+                    run_time="PT1M",
+                    route_link_ref=None,
+                ),
+                JourneyPatternTimingLink(
+                    from_atco_code="0600MA0023",
+                    from_timing_status="OTH",
+                    from_sequence_number="9",
+                    to_atco_code="0600MA0026A",
+                    to_timing_status="OTH",
+                    to_sequence_number="10",
+                    run_time="PT2M",
+                    route_link_ref=None,
+                ),
+                JourneyPatternTimingLink(
+                    from_atco_code="0600MA0026A",
+                    from_timing_status="OTH",
+                    from_sequence_number="10",
+                    to_atco_code="0600MA6030",
+                    to_timing_status="OTH",
+                    to_sequence_number="11",
+                    run_time="PT1M",
+                    route_link_ref=None,
+                ),
             ],
             [
-                {
-                    "from_atco_code": "0600MA6152",
-                    "from_timing_status": "PTP",
-                    "from_sequence_number": "1",
-                    "to_atco_code": "0600MA6001",
-                    "to_timing_status": "OTH",
-                    "run_time": "PT1M",
-                    "to_sequence_number": "2",
-                    "route_link_ref": None,
-                },
-                {
-                    "from_atco_code": "0600MA6001",
-                    "from_timing_status": "OTH",
-                    "from_sequence_number": "2",
-                    "to_atco_code": "0600MA0050",
-                    "to_timing_status": "OTH",
-                    "run_time": "PT2M",
-                    "to_sequence_number": "3",
-                    "route_link_ref": None,
-                },
+                JourneyPatternTimingLink(
+                    from_atco_code="0600MA6152",
+                    from_timing_status="PTP",
+                    from_sequence_number="1",
+                    to_atco_code="0600MA6001",
+                    to_timing_status="OTH",
+                    to_sequence_number="2",
+                    run_time="PT1M",
+                    route_link_ref=None,
+                ),
+                JourneyPatternTimingLink(
+                    from_atco_code="0600MA6001",
+                    from_timing_status="OTH",
+                    from_sequence_number="2",
+                    to_atco_code="0600MA0050",
+                    to_timing_status="OTH",
+                    to_sequence_number="3",
+                    run_time="PT2M",
+                    route_link_ref=None,
+                ),
             ],
             [
-                {
-                    "from_atco_code": "0600MA6189",
-                    "from_timing_status": "OTH",
-                    "from_sequence_number": "12",
-                    "to_atco_code": "0600MA0028A",
-                    "to_timing_status": "OTH",
-                    "run_time": "PT1M",
-                    "to_sequence_number": "13",
-                    "route_link_ref": None,
-                },
-                {
-                    "from_atco_code": "0600MA0028A",
-                    "from_timing_status": "OTH",
-                    "from_sequence_number": "13",
-                    "to_atco_code": "0600MA0029",
-                    "to_timing_status": "OTH",
-                    "run_time": "PT1M",
-                    "to_sequence_number": "14",
-                    "route_link_ref": None,
-                },
-                {
-                    "from_atco_code": "0600MA0029",
-                    "from_timing_status": "OTH",
-                    "from_sequence_number": "14",
-                    "to_atco_code": "0600MA0030",
-                    "to_timing_status": "PTP",
-                    "run_time": "PT1M",
-                    "to_sequence_number": "15",
-                    "route_link_ref": None,
-                },
-                {
-                    "from_atco_code": "0600MA0030",
-                    "from_timing_status": "PTP",
-                    "from_sequence_number": "15",
-                    "to_atco_code": "0600MA0031",
-                    "to_timing_status": "OTH",
-                    "run_time": "PT1M",
-                    "to_sequence_number": "16",
-                    "route_link_ref": None,
-                },
-                {
-                    "from_atco_code": "0600MA0031",
-                    "from_timing_status": "OTH",
-                    "from_sequence_number": "16",
-                    "to_atco_code": "0600MA6031",
-                    "to_timing_status": "OTH",
-                    "run_time": "PT0M",
-                    "to_sequence_number": "17",
-                    "route_link_ref": None,
-                },
-                {
-                    "from_atco_code": "0600MA6031",
-                    "from_timing_status": "OTH",
-                    "from_sequence_number": "17",
-                    "to_atco_code": "0600MA0022",
-                    "to_timing_status": "OTH",
-                    "run_time": "PT2M",
-                    "to_sequence_number": "18",
-                    "route_link_ref": None,
-                },
-                {
-                    "from_atco_code": "0600MA0022",
-                    "from_timing_status": "OTH",
-                    "from_sequence_number": "18",
-                    "to_atco_code": "0600MA0021",
-                    "to_timing_status": "OTH",
-                    "run_time": "PT1M",
-                    "to_sequence_number": "19",
-                    "route_link_ref": None,
-                },
-                {
-                    "from_atco_code": "0600MA0021",
-                    "from_timing_status": "OTH",
-                    "from_sequence_number": "19",
-                    "to_atco_code": "0600MA0020",
-                    "to_timing_status": "OTH",
-                    "run_time": "PT1M",
-                    "to_sequence_number": "20",
-                    "route_link_ref": None,
-                },
-                {
-                    "from_atco_code": "0600MA0020",
-                    "from_timing_status": "OTH",
-                    "from_sequence_number": "20",
-                    "to_atco_code": "0600MA0019",
-                    "to_timing_status": "OTH",
-                    "run_time": "PT1M",
-                    "to_sequence_number": "21",
-                    "route_link_ref": None,
-                },
-                {
-                    "from_atco_code": "0600MA0019",
-                    "from_timing_status": "OTH",
-                    "from_sequence_number": "21",
-                    "to_atco_code": "0600MA6033",
-                    "to_timing_status": "OTH",
-                    "run_time": "PT1M",
-                    "to_sequence_number": "22",
-                    "route_link_ref": None,
-                },
-                {
-                    "from_atco_code": "0600MA6033",
-                    "from_timing_status": "OTH",
-                    "from_sequence_number": "22",
-                    "to_atco_code": "0600MA6002",
-                    "to_timing_status": "OTH",
-                    "run_time": "PT0M",
-                    "to_sequence_number": "23",
-                    "route_link_ref": None,
-                },
-                {
-                    "from_atco_code": "0600MA6002",
-                    "from_timing_status": "OTH",
-                    "from_sequence_number": "23",
-                    "to_atco_code": "0600MA0049",
-                    "to_timing_status": "OTH",
-                    "run_time": "PT1M",
-                    "to_sequence_number": "24",
-                    "route_link_ref": None,
-                },
-                {
-                    "from_atco_code": "0600MA0049",
-                    "from_timing_status": "OTH",
-                    "from_sequence_number": "24",
-                    "to_atco_code": "0600MA0096",
-                    "to_timing_status": "OTH",
-                    "run_time": "PT2M",
-                    "to_sequence_number": "25",
-                    "route_link_ref": None,
-                },
-                {
-                    "from_atco_code": "0600MA0096",
-                    "from_timing_status": "OTH",
-                    "from_sequence_number": "25",
-                    "to_atco_code": "0600MA6105",
-                    "to_timing_status": "OTH",
-                    "run_time": "PT1M",
-                    "to_sequence_number": "26",
-                    "route_link_ref": None,
-                },
-                {
-                    "from_atco_code": "0600MA6105",
-                    "from_timing_status": "OTH",
-                    "from_sequence_number": "26",
-                    "to_atco_code": "0600MA6152",
-                    "to_timing_status": "PTP",
-                    "run_time": "PT1M",
-                    "to_sequence_number": "27",
-                    "route_link_ref": None,
-                },
+                JourneyPatternTimingLink(
+                    from_atco_code="0600MA6189",
+                    from_timing_status="OTH",
+                    from_sequence_number="12",
+                    to_atco_code="0600MA0028A",
+                    to_timing_status="OTH",
+                    to_sequence_number="13",
+                    run_time="PT1M",
+                    route_link_ref=None,
+                ),
+                JourneyPatternTimingLink(
+                    from_atco_code="0600MA0028A",
+                    from_timing_status="OTH",
+                    from_sequence_number="13",
+                    to_atco_code="0600MA0029",
+                    to_timing_status="OTH",
+                    to_sequence_number="14",
+                    run_time="PT1M",
+                    route_link_ref=None,
+                ),
+                JourneyPatternTimingLink(
+                    from_atco_code="0600MA0029",
+                    from_timing_status="OTH",
+                    from_sequence_number="14",
+                    to_atco_code="0600MA0030",
+                    to_timing_status="PTP",
+                    to_sequence_number="15",
+                    run_time="PT1M",
+                    route_link_ref=None,
+                ),
+                JourneyPatternTimingLink(
+                    from_atco_code="0600MA0030",
+                    from_timing_status="PTP",
+                    from_sequence_number="15",
+                    to_atco_code="0600MA0031",
+                    to_timing_status="OTH",
+                    to_sequence_number="16",
+                    run_time="PT1M",
+                    route_link_ref=None,
+                ),
+                JourneyPatternTimingLink(
+                    from_atco_code="0600MA0031",
+                    from_timing_status="OTH",
+                    from_sequence_number="16",
+                    to_atco_code="0600MA6031",
+                    to_timing_status="OTH",
+                    to_sequence_number="17",
+                    run_time="PT0M",
+                    route_link_ref=None,
+                ),
+                JourneyPatternTimingLink(
+                    from_atco_code="0600MA6031",
+                    from_timing_status="OTH",
+                    from_sequence_number="17",
+                    to_atco_code="0600MA0022",
+                    to_timing_status="OTH",
+                    to_sequence_number="18",
+                    run_time="PT2M",
+                    route_link_ref=None,
+                ),
+                JourneyPatternTimingLink(
+                    from_atco_code="0600MA0022",
+                    from_timing_status="OTH",
+                    from_sequence_number="18",
+                    to_atco_code="0600MA0021",
+                    to_timing_status="OTH",
+                    to_sequence_number="19",
+                    run_time="PT1M",
+                    route_link_ref=None,
+                ),
+                JourneyPatternTimingLink(
+                    from_atco_code="0600MA0021",
+                    from_timing_status="OTH",
+                    from_sequence_number="19",
+                    to_atco_code="0600MA0020",
+                    to_timing_status="OTH",
+                    to_sequence_number="20",
+                    run_time="PT1M",
+                    route_link_ref=None,
+                ),
+                JourneyPatternTimingLink(
+                    from_atco_code="0600MA0020",
+                    from_timing_status="OTH",
+                    from_sequence_number="20",
+                    to_atco_code="0600MA0019",
+                    to_timing_status="OTH",
+                    to_sequence_number="21",
+                    run_time="PT1M",
+                    route_link_ref=None,
+                ),
+                JourneyPatternTimingLink(
+                    from_atco_code="0600MA0019",
+                    from_timing_status="OTH",
+                    from_sequence_number="21",
+                    to_atco_code="0600MA6033",
+                    to_timing_status="OTH",
+                    to_sequence_number="22",
+                    run_time="PT1M",
+                    route_link_ref=None,
+                ),
+                JourneyPatternTimingLink(
+                    from_atco_code="0600MA6033",
+                    from_timing_status="OTH",
+                    from_sequence_number="22",
+                    to_atco_code="0600MA6002",
+                    to_timing_status="OTH",
+                    to_sequence_number="23",
+                    run_time="PT0M",
+                    route_link_ref=None,
+                ),
+                JourneyPatternTimingLink(
+                    from_atco_code="0600MA6002",
+                    from_timing_status="OTH",
+                    from_sequence_number="23",
+                    to_atco_code="0600MA0049",
+                    to_timing_status="OTH",
+                    to_sequence_number="24",
+                    run_time="PT1M",
+                    route_link_ref=None,
+                ),
+                JourneyPatternTimingLink(
+                    from_atco_code="0600MA0049",
+                    from_timing_status="OTH",
+                    from_sequence_number="24",
+                    to_atco_code="0600MA0096",
+                    to_timing_status="OTH",
+                    to_sequence_number="25",
+                    run_time="PT2M",
+                    route_link_ref=None,
+                ),
+                JourneyPatternTimingLink(
+                    from_atco_code="0600MA0096",
+                    from_timing_status="OTH",
+                    from_sequence_number="25",
+                    to_atco_code="0600MA6105",
+                    to_timing_status="OTH",
+                    to_sequence_number="26",
+                    run_time="PT1M",
+                    route_link_ref=None,
+                ),
+                JourneyPatternTimingLink(
+                    from_atco_code="0600MA6105",
+                    from_timing_status="OTH",
+                    from_sequence_number="26",
+                    to_atco_code="0600MA6152",
+                    to_timing_status="PTP",
+                    to_sequence_number="27",
+                    run_time="PT1M",
+                    route_link_ref=None,
+                ),
             ],
         ],
         "journey_pattern_info": {
@@ -306,250 +310,250 @@ expected_list_of_journey_patterns = [
     {
         "journey_pattern_sections": [
             [
-                {
-                    "from_atco_code": "0600MA6152",
-                    "from_timing_status": "PTP",
-                    "from_sequence_number": "1",
-                    "to_atco_code": "0600MA6001",
-                    "to_timing_status": "OTH",
-                    "run_time": "PT1M",
-                    "to_sequence_number": "2",
-                    "route_link_ref": None,
-                },
-                {
-                    "from_atco_code": "0600MA6001",
-                    "from_timing_status": "OTH",
-                    "from_sequence_number": "2",
-                    "to_atco_code": "0600MA0050",
-                    "to_timing_status": "OTH",
-                    "run_time": "PT2M",
-                    "to_sequence_number": "3",
-                    "route_link_ref": None,
-                },
+                JourneyPatternTimingLink(
+                    from_atco_code="0600MA6152",
+                    from_timing_status="PTP",
+                    from_sequence_number="1",
+                    to_atco_code="0600MA6001",
+                    to_timing_status="OTH",
+                    to_sequence_number="2",
+                    run_time="PT1M",
+                    route_link_ref=None,
+                ),
+                JourneyPatternTimingLink(
+                    from_atco_code="0600MA6001",
+                    from_timing_status="OTH",
+                    from_sequence_number="2",
+                    to_atco_code="0600MA0050",
+                    to_timing_status="OTH",
+                    to_sequence_number="3",
+                    run_time="PT2M",
+                    route_link_ref=None,
+                ),
             ],
             [
-                {
-                    "from_atco_code": "0600MA0050",
-                    "from_timing_status": "OTH",
-                    "from_sequence_number": "3",
-                    "to_atco_code": "0600MA0046",
-                    "to_timing_status": "OTH",
-                    "run_time": "PT1M",
-                    "to_sequence_number": "4",
-                    "route_link_ref": None,
-                },
-                {
-                    "from_atco_code": "0600MA0046",
-                    "from_timing_status": "OTH",
-                    "from_sequence_number": "4",
-                    "to_atco_code": "0600MA0017",
-                    "to_timing_status": "OTH",
-                    "run_time": "PT1M",
-                    "to_sequence_number": "5",
-                    "route_link_ref": None,
-                },
-                {
-                    "from_atco_code": "0600MA0017",
-                    "from_timing_status": "OTH",
-                    "from_sequence_number": "5",
-                    "to_atco_code": "0600MA0018",
-                    "to_timing_status": "OTH",
-                    "run_time": "PT1M",
-                    "to_sequence_number": "6",
-                    "route_link_ref": None,
-                },
-                {
-                    "from_atco_code": "0600MA0018",
-                    "from_timing_status": "OTH",
-                    "from_sequence_number": "6",
-                    "to_atco_code": "0600MA0020A",
-                    "to_timing_status": "OTH",
-                    "run_time": "PT1M",
-                    "to_sequence_number": "7",
-                    "route_link_ref": None,
-                },
-                {
-                    "from_atco_code": "0600MA0020A",
-                    "from_timing_status": "OTH",
-                    "from_sequence_number": "7",
-                    "to_atco_code": "0600MA6032",
-                    "to_timing_status": "OTH",
-                    "run_time": "PT1M",
-                    "to_sequence_number": "8",
-                    "route_link_ref": None,
-                },
-                {
-                    "from_atco_code": "0600MA6032",
-                    "from_timing_status": "OTH",
-                    "from_sequence_number": "8",
-                    "to_atco_code": "0600MA0023",
-                    "to_timing_status": "OTH",
-                    "run_time": "PT1M",
-                    "to_sequence_number": "9",
-                    "route_link_ref": None,
-                },
-                {
-                    "from_atco_code": "0600MA0023",
-                    "from_timing_status": "OTH",
-                    "from_sequence_number": "9",
-                    "to_atco_code": "0600MA0026A",
-                    "to_timing_status": "OTH",
-                    "run_time": "PT3M",
-                    "to_sequence_number": "10",
-                    "route_link_ref": None,
-                },
-                {
-                    "from_atco_code": "0600MA0026A",
-                    "from_timing_status": "OTH",
-                    "from_sequence_number": "10",
-                    "to_atco_code": "0600MA6030",
-                    "to_timing_status": "OTH",
-                    "run_time": "PT1M",
-                    "to_sequence_number": "11",
-                    "route_link_ref": None,
-                },
+                JourneyPatternTimingLink(
+                    from_atco_code="0600MA0050",
+                    from_timing_status="OTH",
+                    from_sequence_number="3",
+                    to_atco_code="0600MA0046",
+                    to_timing_status="OTH",
+                    to_sequence_number="4",
+                    run_time="PT1M",
+                    route_link_ref=None,
+                ),
+                JourneyPatternTimingLink(
+                    from_atco_code="0600MA0046",
+                    from_timing_status="OTH",
+                    from_sequence_number="4",
+                    to_atco_code="0600MA0017",
+                    to_timing_status="OTH",
+                    to_sequence_number="5",
+                    run_time="PT1M",
+                    route_link_ref=None,
+                ),
+                JourneyPatternTimingLink(
+                    from_atco_code="0600MA0017",
+                    from_timing_status="OTH",
+                    from_sequence_number="5",
+                    to_atco_code="0600MA0018",
+                    to_timing_status="OTH",
+                    to_sequence_number="6",
+                    run_time="PT1M",
+                    route_link_ref=None,
+                ),
+                JourneyPatternTimingLink(
+                    from_atco_code="0600MA0018",
+                    from_timing_status="OTH",
+                    from_sequence_number="6",
+                    to_atco_code="0600MA0020A",
+                    to_timing_status="OTH",
+                    to_sequence_number="7",
+                    run_time="PT1M",
+                    route_link_ref=None,
+                ),
+                JourneyPatternTimingLink(
+                    from_atco_code="0600MA0020A",
+                    from_timing_status="OTH",
+                    from_sequence_number="7",
+                    to_atco_code="0600MA6032",
+                    to_timing_status="OTH",
+                    to_sequence_number="8",
+                    run_time="PT1M",
+                    route_link_ref=None,
+                ),
+                JourneyPatternTimingLink(
+                    from_atco_code="0600MA6032",
+                    from_timing_status="OTH",
+                    from_sequence_number="8",
+                    to_atco_code="0600MA0023",
+                    to_timing_status="OTH",
+                    to_sequence_number="9",
+                    run_time="PT1M",
+                    route_link_ref=None,
+                ),
+                JourneyPatternTimingLink(
+                    from_atco_code="0600MA0023",
+                    from_timing_status="OTH",
+                    from_sequence_number="9",
+                    to_atco_code="0600MA0026A",
+                    to_timing_status="OTH",
+                    to_sequence_number="10",
+                    run_time="PT3M",
+                    route_link_ref=None,
+                ),
+                JourneyPatternTimingLink(
+                    from_atco_code="0600MA0026A",
+                    from_timing_status="OTH",
+                    from_sequence_number="10",
+                    to_atco_code="0600MA6030",
+                    to_timing_status="OTH",
+                    to_sequence_number="11",
+                    run_time="PT1M",
+                    route_link_ref=None,
+                ),
             ],
             [
-                {
-                    "from_atco_code": "0600MA0028A",
-                    "from_timing_status": "OTH",
-                    "from_sequence_number": "13",
-                    "to_atco_code": "0600MA0029",
-                    "to_timing_status": "OTH",
-                    "run_time": "PT1M",
-                    "to_sequence_number": "14",
-                    "route_link_ref": None,
-                },
-                {
-                    "from_atco_code": "0600MA0029",
-                    "from_timing_status": "OTH",
-                    "from_sequence_number": "14",
-                    "to_atco_code": "0600MA0030",
-                    "to_timing_status": "PTP",
-                    "run_time": "PT1M",
-                    "to_sequence_number": "15",
-                    "route_link_ref": None,
-                },
-                {
-                    "from_atco_code": "0600MA0030",
-                    "from_timing_status": "PTP",
-                    "from_sequence_number": "15",
-                    "to_atco_code": "0600MA0031",
-                    "to_timing_status": "OTH",
-                    "run_time": "PT1M",
-                    "to_sequence_number": "16",
-                    "route_link_ref": None,
-                },
-                {
-                    "from_atco_code": "0600MA0031",
-                    "from_timing_status": "OTH",
-                    "from_sequence_number": "16",
-                    "to_atco_code": "0600MA6031",
-                    "to_timing_status": "OTH",
-                    "run_time": "PT1M",
-                    "to_sequence_number": "17",
-                    "route_link_ref": None,
-                },
-                {
-                    "from_atco_code": "0600MA6031",
-                    "from_timing_status": "OTH",
-                    "from_sequence_number": "17",
-                    "to_atco_code": "0600MA0022",
-                    "to_timing_status": "OTH",
-                    "run_time": "PT2M",
-                    "to_sequence_number": "18",
-                    "route_link_ref": None,
-                },
-                {
-                    "from_atco_code": "0600MA0022",
-                    "from_timing_status": "OTH",
-                    "from_sequence_number": "18",
-                    "to_atco_code": "0600MA0021",
-                    "to_timing_status": "OTH",
-                    "run_time": "PT1M",
-                    "to_sequence_number": "19",
-                    "route_link_ref": None,
-                },
-                {
-                    "from_atco_code": "0600MA0021",
-                    "from_timing_status": "OTH",
-                    "from_sequence_number": "19",
-                    "to_atco_code": "0600MA0020",
-                    "to_timing_status": "OTH",
-                    "run_time": "PT1M",
-                    "to_sequence_number": "20",
-                    "route_link_ref": None,
-                },
-                {
-                    "from_atco_code": "0600MA0020",
-                    "from_timing_status": "OTH",
-                    "from_sequence_number": "20",
-                    "to_atco_code": "0600MA0019",
-                    "to_timing_status": "OTH",
-                    "run_time": "PT2M",
-                    "to_sequence_number": "21",
-                    "route_link_ref": None,
-                },
-                {
-                    "from_atco_code": "0600MA0019",
-                    "from_timing_status": "OTH",
-                    "from_sequence_number": "21",
-                    "to_atco_code": "0600MA6033",
-                    "to_timing_status": "OTH",
-                    "run_time": "PT0M",
-                    "to_sequence_number": "22",
-                    "route_link_ref": None,
-                },
-                {
-                    "from_atco_code": "0600MA6033",
-                    "from_timing_status": "OTH",
-                    "from_sequence_number": "22",
-                    "to_atco_code": "0600MA6002",
-                    "to_timing_status": "OTH",
-                    "run_time": "PT1M",
-                    "to_sequence_number": "23",
-                    "route_link_ref": None,
-                },
-                {
-                    "from_atco_code": "0600MA6002",
-                    "from_timing_status": "OTH",
-                    "from_sequence_number": "23",
-                    "to_atco_code": "0600MA0049",
-                    "to_timing_status": "OTH",
-                    "run_time": "PT2M",
-                    "to_sequence_number": "24",
-                    "route_link_ref": None,
-                },
-                {
-                    "from_atco_code": "0600MA0049",
-                    "from_timing_status": "OTH",
-                    "from_sequence_number": "24",
-                    "to_atco_code": "0600MA0096",
-                    "to_timing_status": "OTH",
-                    "run_time": "PT1M",
-                    "to_sequence_number": "25",
-                    "route_link_ref": None,
-                },
-                {
-                    "from_atco_code": "0600MA0096",
-                    "from_timing_status": "OTH",
-                    "from_sequence_number": "25",
-                    "to_atco_code": "0600MA6105",
-                    "to_timing_status": "OTH",
-                    "run_time": "PT2M",
-                    "to_sequence_number": "26",
-                    "route_link_ref": None,
-                },
-                {
-                    "from_atco_code": "0600MA6105",
-                    "from_timing_status": "OTH",
-                    "from_sequence_number": "26",
-                    "to_atco_code": "0600MA6152",
-                    "to_timing_status": "PTP",
-                    "run_time": "PT1M",
-                    "to_sequence_number": "27",
-                    "route_link_ref": None,
-                },
+                JourneyPatternTimingLink(
+                    from_atco_code="0600MA0028A",
+                    from_timing_status="OTH",
+                    from_sequence_number="13",
+                    to_atco_code="0600MA0029",
+                    to_timing_status="OTH",
+                    to_sequence_number="14",
+                    run_time="PT1M",
+                    route_link_ref=None,
+                ),
+                JourneyPatternTimingLink(
+                    from_atco_code="0600MA0029",
+                    from_timing_status="OTH",
+                    from_sequence_number="14",
+                    to_atco_code="0600MA0030",
+                    to_timing_status="PTP",
+                    to_sequence_number="15",
+                    run_time="PT1M",
+                    route_link_ref=None,
+                ),
+                JourneyPatternTimingLink(
+                    from_atco_code="0600MA0030",
+                    from_timing_status="PTP",
+                    from_sequence_number="15",
+                    to_atco_code="0600MA0031",
+                    to_timing_status="OTH",
+                    to_sequence_number="16",
+                    run_time="PT1M",
+                    route_link_ref=None,
+                ),
+                JourneyPatternTimingLink(
+                    from_atco_code="0600MA0031",
+                    from_timing_status="OTH",
+                    from_sequence_number="16",
+                    to_atco_code="0600MA6031",
+                    to_timing_status="OTH",
+                    to_sequence_number="17",
+                    run_time="PT1M",
+                    route_link_ref=None,
+                ),
+                JourneyPatternTimingLink(
+                    from_atco_code="0600MA6031",
+                    from_timing_status="OTH",
+                    from_sequence_number="17",
+                    to_atco_code="0600MA0022",
+                    to_timing_status="OTH",
+                    to_sequence_number="18",
+                    run_time="PT2M",
+                    route_link_ref=None,
+                ),
+                JourneyPatternTimingLink(
+                    from_atco_code="0600MA0022",
+                    from_timing_status="OTH",
+                    from_sequence_number="18",
+                    to_atco_code="0600MA0021",
+                    to_timing_status="OTH",
+                    to_sequence_number="19",
+                    run_time="PT1M",
+                    route_link_ref=None,
+                ),
+                JourneyPatternTimingLink(
+                    from_atco_code="0600MA0021",
+                    from_timing_status="OTH",
+                    from_sequence_number="19",
+                    to_atco_code="0600MA0020",
+                    to_timing_status="OTH",
+                    to_sequence_number="20",
+                    run_time="PT1M",
+                    route_link_ref=None,
+                ),
+                JourneyPatternTimingLink(
+                    from_atco_code="0600MA0020",
+                    from_timing_status="OTH",
+                    from_sequence_number="20",
+                    to_atco_code="0600MA0019",
+                    to_timing_status="OTH",
+                    to_sequence_number="21",
+                    run_time="PT2M",
+                    route_link_ref=None,
+                ),
+                JourneyPatternTimingLink(
+                    from_atco_code="0600MA0019",
+                    from_timing_status="OTH",
+                    from_sequence_number="21",
+                    to_atco_code="0600MA6033",
+                    to_timing_status="OTH",
+                    to_sequence_number="22",
+                    run_time="PT0M",
+                    route_link_ref=None,
+                ),
+                JourneyPatternTimingLink(
+                    from_atco_code="0600MA6033",
+                    from_timing_status="OTH",
+                    from_sequence_number="22",
+                    to_atco_code="0600MA6002",
+                    to_timing_status="OTH",
+                    to_sequence_number="23",
+                    run_time="PT1M",
+                    route_link_ref=None,
+                ),
+                JourneyPatternTimingLink(
+                    from_atco_code="0600MA6002",
+                    from_timing_status="OTH",
+                    from_sequence_number="23",
+                    to_atco_code="0600MA0049",
+                    to_timing_status="OTH",
+                    to_sequence_number="24",
+                    run_time="PT2M",
+                    route_link_ref=None,
+                ),
+                JourneyPatternTimingLink(
+                    from_atco_code="0600MA0049",
+                    from_timing_status="OTH",
+                    from_sequence_number="24",
+                    to_atco_code="0600MA0096",
+                    to_timing_status="OTH",
+                    to_sequence_number="25",
+                    run_time="PT1M",
+                    route_link_ref=None,
+                ),
+                JourneyPatternTimingLink(
+                    from_atco_code="0600MA0096",
+                    from_timing_status="OTH",
+                    from_sequence_number="25",
+                    to_atco_code="0600MA6105",
+                    to_timing_status="OTH",
+                    to_sequence_number="26",
+                    run_time="PT2M",
+                    route_link_ref=None,
+                ),
+                JourneyPatternTimingLink(
+                    from_atco_code="0600MA6105",
+                    from_timing_status="OTH",
+                    from_sequence_number="26",
+                    to_atco_code="0600MA6152",
+                    to_timing_status="PTP",
+                    to_sequence_number="27",
+                    run_time="PT1M",
+                    route_link_ref=None,
+                ),
             ],
         ],
         "journey_pattern_info": {
@@ -563,16 +567,16 @@ expected_list_of_journey_patterns = [
     {
         "journey_pattern_sections": [
             [
-                {
-                    "from_atco_code": "0600MA6001",
-                    "from_timing_status": "OTH",
-                    "from_sequence_number": "2",
-                    "to_atco_code": "0600MA0050",
-                    "to_timing_status": "OTH",
-                    "run_time": "PT2M",
-                    "to_sequence_number": "3",
-                    "route_link_ref": None,
-                }
+                JourneyPatternTimingLink(
+                    from_atco_code="0600MA6001",
+                    from_timing_status="OTH",
+                    from_sequence_number="2",
+                    to_atco_code="0600MA0050",
+                    to_timing_status="OTH",
+                    to_sequence_number="3",
+                    run_time="PT2M",
+                    route_link_ref=None,
+                )
             ]
         ],
         "journey_pattern_info": {
@@ -586,324 +590,324 @@ expected_list_of_journey_patterns = [
     {
         "journey_pattern_sections": [
             [
-                {
-                    "from_atco_code": "0600MA6152",
-                    "from_timing_status": "PTP",
-                    "from_sequence_number": "1",
-                    "to_atco_code": "0600MA6001",
-                    "to_timing_status": "OTH",
-                    "run_time": "PT1M",
-                    "to_sequence_number": "2",
-                    "route_link_ref": None,
-                },
-                {
-                    "from_atco_code": "0600MA6001",
-                    "from_timing_status": "OTH",
-                    "from_sequence_number": "2",
-                    "to_atco_code": "0600MA0050",
-                    "to_timing_status": "OTH",
-                    "run_time": "PT1M",
-                    "to_sequence_number": "3",
-                    "route_link_ref": None,
-                },
+                JourneyPatternTimingLink(
+                    from_atco_code="0600MA6152",
+                    from_timing_status="PTP",
+                    from_sequence_number="1",
+                    to_atco_code="0600MA6001",
+                    to_timing_status="OTH",
+                    to_sequence_number="2",
+                    run_time="PT1M",
+                    route_link_ref=None,
+                ),
+                JourneyPatternTimingLink(
+                    from_atco_code="0600MA6001",
+                    from_timing_status="OTH",
+                    from_sequence_number="2",
+                    to_atco_code="0600MA0050",
+                    to_timing_status="OTH",
+                    to_sequence_number="3",
+                    run_time="PT1M",
+                    route_link_ref=None,
+                ),
             ],
             [
-                {
-                    "from_atco_code": "0600MA0050",
-                    "from_timing_status": "OTH",
-                    "from_sequence_number": "3",
-                    "to_atco_code": "0600MA0046",
-                    "to_timing_status": "OTH",
-                    "run_time": "PT1M",
-                    "to_sequence_number": "4",
-                    "route_link_ref": None,
-                },
-                {
-                    "from_atco_code": "0600MA0046",
-                    "from_timing_status": "OTH",
-                    "from_sequence_number": "4",
-                    "to_atco_code": "0600MA0017",
-                    "to_timing_status": "OTH",
-                    "run_time": "PT1M",
-                    "to_sequence_number": "5",
-                    "route_link_ref": None,
-                },
-                {
-                    "from_atco_code": "0600MA0017",
-                    "from_timing_status": "OTH",
-                    "from_sequence_number": "5",
-                    "to_atco_code": "0600MA0018",
-                    "to_timing_status": "OTH",
-                    "run_time": "PT1M",
-                    "to_sequence_number": "6",
-                    "route_link_ref": None,
-                },
-                {
-                    "from_atco_code": "0600MA0018",
-                    "from_timing_status": "OTH",
-                    "from_sequence_number": "6",
-                    "to_atco_code": "0600MA0020A",
-                    "to_timing_status": "OTH",
-                    "run_time": "PT1M",
-                    "to_sequence_number": "7",
-                    "route_link_ref": None,
-                },
-                {
-                    "from_atco_code": "0600MA0020A",
-                    "from_timing_status": "OTH",
-                    "from_sequence_number": "7",
-                    "to_atco_code": "0600MA6032",
-                    "to_timing_status": "OTH",
-                    "run_time": "PT1M",
-                    "to_sequence_number": "8",
-                    "route_link_ref": None,
-                },
-                {
-                    "from_atco_code": "0600MA6032",
-                    "from_timing_status": "OTH",
-                    "from_sequence_number": "8",
-                    "to_atco_code": "0600MA0023",
-                    "to_timing_status": "OTH",
-                    "run_time": "PT1M",
-                    "to_sequence_number": "9",
-                    "route_link_ref": None,
-                },
-                {
-                    "from_atco_code": "0600MA0023",
-                    "from_timing_status": "OTH",
-                    "from_sequence_number": "9",
-                    "to_atco_code": "0600MA0026A",
-                    "to_timing_status": "OTH",
-                    "run_time": "PT3M",
-                    "to_sequence_number": "10",
-                    "route_link_ref": None,
-                },
-                {
-                    "from_atco_code": "0600MA0026A",
-                    "from_timing_status": "OTH",
-                    "from_sequence_number": "10",
-                    "to_atco_code": "0600MA6030",
-                    "to_timing_status": "OTH",
-                    "run_time": "PT1M",
-                    "to_sequence_number": "11",
-                    "route_link_ref": None,
-                },
+                JourneyPatternTimingLink(
+                    from_atco_code="0600MA0050",
+                    from_timing_status="OTH",
+                    from_sequence_number="3",
+                    to_atco_code="0600MA0046",
+                    to_timing_status="OTH",
+                    to_sequence_number="4",
+                    run_time="PT1M",
+                    route_link_ref=None,
+                ),
+                JourneyPatternTimingLink(
+                    from_atco_code="0600MA0046",
+                    from_timing_status="OTH",
+                    from_sequence_number="4",
+                    to_atco_code="0600MA0017",
+                    to_timing_status="OTH",
+                    to_sequence_number="5",
+                    run_time="PT1M",
+                    route_link_ref=None,
+                ),
+                JourneyPatternTimingLink(
+                    from_atco_code="0600MA0017",
+                    from_timing_status="OTH",
+                    from_sequence_number="5",
+                    to_atco_code="0600MA0018",
+                    to_timing_status="OTH",
+                    to_sequence_number="6",
+                    run_time="PT1M",
+                    route_link_ref=None,
+                ),
+                JourneyPatternTimingLink(
+                    from_atco_code="0600MA0018",
+                    from_timing_status="OTH",
+                    from_sequence_number="6",
+                    to_atco_code="0600MA0020A",
+                    to_timing_status="OTH",
+                    to_sequence_number="7",
+                    run_time="PT1M",
+                    route_link_ref=None,
+                ),
+                JourneyPatternTimingLink(
+                    from_atco_code="0600MA0020A",
+                    from_timing_status="OTH",
+                    from_sequence_number="7",
+                    to_atco_code="0600MA6032",
+                    to_timing_status="OTH",
+                    to_sequence_number="8",
+                    run_time="PT1M",
+                    route_link_ref=None,
+                ),
+                JourneyPatternTimingLink(
+                    from_atco_code="0600MA6032",
+                    from_timing_status="OTH",
+                    from_sequence_number="8",
+                    to_atco_code="0600MA0023",
+                    to_timing_status="OTH",
+                    to_sequence_number="9",
+                    run_time="PT1M",
+                    route_link_ref=None,
+                ),
+                JourneyPatternTimingLink(
+                    from_atco_code="0600MA0023",
+                    from_timing_status="OTH",
+                    from_sequence_number="9",
+                    to_atco_code="0600MA0026A",
+                    to_timing_status="OTH",
+                    to_sequence_number="10",
+                    run_time="PT3M",
+                    route_link_ref=None,
+                ),
+                JourneyPatternTimingLink(
+                    from_atco_code="0600MA0026A",
+                    from_timing_status="OTH",
+                    from_sequence_number="10",
+                    to_atco_code="0600MA6030",
+                    to_timing_status="OTH",
+                    to_sequence_number="11",
+                    run_time="PT1M",
+                    route_link_ref=None,
+                ),
             ],
             [
-                {
-                    "from_atco_code": "0600MA6152",
-                    "from_timing_status": "PTP",
-                    "from_sequence_number": "1",
-                    "to_atco_code": "0600MA6001",
-                    "to_timing_status": "OTH",
-                    "run_time": "PT1M",
-                    "to_sequence_number": "2",
-                    "route_link_ref": None,
-                },
-                {
-                    "from_atco_code": "0600MA6001",
-                    "from_timing_status": "OTH",
-                    "from_sequence_number": "2",
-                    "to_atco_code": "0600MA0050",
-                    "to_timing_status": "OTH",
-                    "run_time": "PT2M",
-                    "to_sequence_number": "3",
-                    "route_link_ref": None,
-                },
+                JourneyPatternTimingLink(
+                    from_atco_code="0600MA6152",
+                    from_timing_status="PTP",
+                    from_sequence_number="1",
+                    to_atco_code="0600MA6001",
+                    to_timing_status="OTH",
+                    to_sequence_number="2",
+                    run_time="PT1M",
+                    route_link_ref=None,
+                ),
+                JourneyPatternTimingLink(
+                    from_atco_code="0600MA6001",
+                    from_timing_status="OTH",
+                    from_sequence_number="2",
+                    to_atco_code="0600MA0050",
+                    to_timing_status="OTH",
+                    to_sequence_number="3",
+                    run_time="PT2M",
+                    route_link_ref=None,
+                ),
             ],
             [
-                {
-                    "from_atco_code": "0600MA0018",
-                    "from_timing_status": "OTH",
-                    "from_sequence_number": "6",
-                    "to_atco_code": "0600MA0020A",
-                    "to_timing_status": "OTH",
-                    "run_time": "PT2M",
-                    "to_sequence_number": "7",
-                    "route_link_ref": None,
-                },
-                {
-                    "from_atco_code": "0600MA0020A",
-                    "from_timing_status": "OTH",
-                    "from_sequence_number": "7",
-                    "to_atco_code": "0600MA6032",
-                    "to_timing_status": "OTH",
-                    "run_time": "PT1M",
-                    "to_sequence_number": "8",
-                    "route_link_ref": None,
-                },
-                {
-                    "from_atco_code": "0600MA6032",
-                    "from_timing_status": "OTH",
-                    "from_sequence_number": "8",
-                    "to_atco_code": "0600MA0023",
-                    "to_timing_status": "OTH",
-                    "run_time": "PT1M",
-                    "to_sequence_number": "9",
-                    "route_link_ref": None,
-                },
-                {
-                    "from_atco_code": "0600MA0023",
-                    "from_timing_status": "OTH",
-                    "from_sequence_number": "9",
-                    "to_atco_code": "0600MA0026A",
-                    "to_timing_status": "OTH",
-                    "run_time": "PT2M",
-                    "to_sequence_number": "10",
-                    "route_link_ref": None,
-                },
-                {
-                    "from_atco_code": "0600MA0026A",
-                    "from_timing_status": "OTH",
-                    "from_sequence_number": "10",
-                    "to_atco_code": "0600MA6030",
-                    "to_timing_status": "OTH",
-                    "run_time": "PT1M",
-                    "to_sequence_number": "11",
-                    "route_link_ref": None,
-                },
+                JourneyPatternTimingLink(
+                    from_atco_code="0600MA0018",
+                    from_timing_status="OTH",
+                    from_sequence_number="6",
+                    to_atco_code="0600MA0020A",
+                    to_timing_status="OTH",
+                    to_sequence_number="7",
+                    run_time="PT2M",
+                    route_link_ref=None,
+                ),
+                JourneyPatternTimingLink(
+                    from_atco_code="0600MA0020A",
+                    from_timing_status="OTH",
+                    from_sequence_number="7",
+                    to_atco_code="0600MA6032",
+                    to_timing_status="OTH",
+                    to_sequence_number="8",
+                    run_time="PT1M",
+                    route_link_ref=None,
+                ),
+                JourneyPatternTimingLink(
+                    from_atco_code="0600MA6032",
+                    from_timing_status="OTH",
+                    from_sequence_number="8",
+                    to_atco_code="0600MA0023",
+                    to_timing_status="OTH",
+                    to_sequence_number="9",
+                    run_time="PT1M",
+                    route_link_ref=None,
+                ),
+                JourneyPatternTimingLink(
+                    from_atco_code="0600MA0023",
+                    from_timing_status="OTH",
+                    from_sequence_number="9",
+                    to_atco_code="0600MA0026A",
+                    to_timing_status="OTH",
+                    to_sequence_number="10",
+                    run_time="PT2M",
+                    route_link_ref=None,
+                ),
+                JourneyPatternTimingLink(
+                    from_atco_code="0600MA0026A",
+                    from_timing_status="OTH",
+                    from_sequence_number="10",
+                    to_atco_code="0600MA6030",
+                    to_timing_status="OTH",
+                    to_sequence_number="11",
+                    run_time="PT1M",
+                    route_link_ref=None,
+                ),
             ],
             [
-                {
-                    "from_atco_code": "0600MA0028A",
-                    "from_timing_status": "OTH",
-                    "from_sequence_number": "13",
-                    "to_atco_code": "0600MA0029",
-                    "to_timing_status": "OTH",
-                    "run_time": "PT1M",
-                    "to_sequence_number": "14",
-                    "route_link_ref": None,
-                },
-                {
-                    "from_atco_code": "0600MA0029",
-                    "from_timing_status": "OTH",
-                    "from_sequence_number": "14",
-                    "to_atco_code": "0600MA0030",
-                    "to_timing_status": "PTP",
-                    "run_time": "PT1M",
-                    "to_sequence_number": "15",
-                    "route_link_ref": None,
-                },
-                {
-                    "from_atco_code": "0600MA0030",
-                    "from_timing_status": "PTP",
-                    "from_sequence_number": "15",
-                    "to_atco_code": "0600MA0031",
-                    "to_timing_status": "OTH",
-                    "run_time": "PT1M",
-                    "to_sequence_number": "16",
-                    "route_link_ref": None,
-                },
-                {
-                    "from_atco_code": "0600MA0031",
-                    "from_timing_status": "OTH",
-                    "from_sequence_number": "16",
-                    "to_atco_code": "0600MA6031",
-                    "to_timing_status": "OTH",
-                    "run_time": "PT0M",
-                    "to_sequence_number": "17",
-                    "route_link_ref": None,
-                },
-                {
-                    "from_atco_code": "0600MA6031",
-                    "from_timing_status": "OTH",
-                    "from_sequence_number": "17",
-                    "to_atco_code": "0600MA0022",
-                    "to_timing_status": "OTH",
-                    "run_time": "PT3M",
-                    "to_sequence_number": "18",
-                    "route_link_ref": None,
-                },
-                {
-                    "from_atco_code": "0600MA0022",
-                    "from_timing_status": "OTH",
-                    "from_sequence_number": "18",
-                    "to_atco_code": "0600MA0021",
-                    "to_timing_status": "OTH",
-                    "run_time": "PT0M",
-                    "to_sequence_number": "19",
-                    "route_link_ref": None,
-                },
-                {
-                    "from_atco_code": "0600MA0021",
-                    "from_timing_status": "OTH",
-                    "from_sequence_number": "19",
-                    "to_atco_code": "0600MA0020",
-                    "to_timing_status": "OTH",
-                    "run_time": "PT1M",
-                    "to_sequence_number": "20",
-                    "route_link_ref": None,
-                },
-                {
-                    "from_atco_code": "0600MA0020",
-                    "from_timing_status": "OTH",
-                    "from_sequence_number": "20",
-                    "to_atco_code": "0600MA0019",
-                    "to_timing_status": "OTH",
-                    "run_time": "PT2M",
-                    "to_sequence_number": "21",
-                    "route_link_ref": None,
-                },
-                {
-                    "from_atco_code": "0600MA0019",
-                    "from_timing_status": "OTH",
-                    "from_sequence_number": "21",
-                    "to_atco_code": "0600MA6033",
-                    "to_timing_status": "OTH",
-                    "run_time": "PT0M",
-                    "to_sequence_number": "22",
-                    "route_link_ref": None,
-                },
-                {
-                    "from_atco_code": "0600MA6033",
-                    "from_timing_status": "OTH",
-                    "from_sequence_number": "22",
-                    "to_atco_code": "0600MA6002",
-                    "to_timing_status": "OTH",
-                    "run_time": "PT1M",
-                    "to_sequence_number": "23",
-                    "route_link_ref": None,
-                },
-                {
-                    "from_atco_code": "0600MA6002",
-                    "from_timing_status": "OTH",
-                    "from_sequence_number": "23",
-                    "to_atco_code": "0600MA0049",
-                    "to_timing_status": "OTH",
-                    "run_time": "PT1M",
-                    "to_sequence_number": "24",
-                    "route_link_ref": None,
-                },
-                {
-                    "from_atco_code": "0600MA0049",
-                    "from_timing_status": "OTH",
-                    "from_sequence_number": "24",
-                    "to_atco_code": "0600MA0096",
-                    "to_timing_status": "OTH",
-                    "run_time": "PT2M",
-                    "to_sequence_number": "25",
-                    "route_link_ref": None,
-                },
-                {
-                    "from_atco_code": "0600MA0096",
-                    "from_timing_status": "OTH",
-                    "from_sequence_number": "25",
-                    "to_atco_code": "0600MA6105",
-                    "to_timing_status": "OTH",
-                    "run_time": "PT1M",
-                    "to_sequence_number": "26",
-                    "route_link_ref": None,
-                },
-                {
-                    "from_atco_code": "0600MA6105",
-                    "from_timing_status": "OTH",
-                    "from_sequence_number": "26",
-                    "to_atco_code": "0600MA6152",
-                    "to_timing_status": "PTP",
-                    "run_time": "PT1M",
-                    "to_sequence_number": "27",
-                    "route_link_ref": None,
-                },
+                JourneyPatternTimingLink(
+                    from_atco_code="0600MA0028A",
+                    from_timing_status="OTH",
+                    from_sequence_number="13",
+                    to_atco_code="0600MA0029",
+                    to_timing_status="OTH",
+                    to_sequence_number="14",
+                    run_time="PT1M",
+                    route_link_ref=None,
+                ),
+                JourneyPatternTimingLink(
+                    from_atco_code="0600MA0029",
+                    from_timing_status="OTH",
+                    from_sequence_number="14",
+                    to_atco_code="0600MA0030",
+                    to_timing_status="PTP",
+                    to_sequence_number="15",
+                    run_time="PT1M",
+                    route_link_ref=None,
+                ),
+                JourneyPatternTimingLink(
+                    from_atco_code="0600MA0030",
+                    from_timing_status="PTP",
+                    from_sequence_number="15",
+                    to_atco_code="0600MA0031",
+                    to_timing_status="OTH",
+                    to_sequence_number="16",
+                    run_time="PT1M",
+                    route_link_ref=None,
+                ),
+                JourneyPatternTimingLink(
+                    from_atco_code="0600MA0031",
+                    from_timing_status="OTH",
+                    from_sequence_number="16",
+                    to_atco_code="0600MA6031",
+                    to_timing_status="OTH",
+                    to_sequence_number="17",
+                    run_time="PT0M",
+                    route_link_ref=None,
+                ),
+                JourneyPatternTimingLink(
+                    from_atco_code="0600MA6031",
+                    from_timing_status="OTH",
+                    from_sequence_number="17",
+                    to_atco_code="0600MA0022",
+                    to_timing_status="OTH",
+                    to_sequence_number="18",
+                    run_time="PT3M",
+                    route_link_ref=None,
+                ),
+                JourneyPatternTimingLink(
+                    from_atco_code="0600MA0022",
+                    from_timing_status="OTH",
+                    from_sequence_number="18",
+                    to_atco_code="0600MA0021",
+                    to_timing_status="OTH",
+                    to_sequence_number="19",
+                    run_time="PT0M",
+                    route_link_ref=None,
+                ),
+                JourneyPatternTimingLink(
+                    from_atco_code="0600MA0021",
+                    from_timing_status="OTH",
+                    from_sequence_number="19",
+                    to_atco_code="0600MA0020",
+                    to_timing_status="OTH",
+                    to_sequence_number="20",
+                    run_time="PT1M",
+                    route_link_ref=None,
+                ),
+                JourneyPatternTimingLink(
+                    from_atco_code="0600MA0020",
+                    from_timing_status="OTH",
+                    from_sequence_number="20",
+                    to_atco_code="0600MA0019",
+                    to_timing_status="OTH",
+                    to_sequence_number="21",
+                    run_time="PT2M",
+                    route_link_ref=None,
+                ),
+                JourneyPatternTimingLink(
+                    from_atco_code="0600MA0019",
+                    from_timing_status="OTH",
+                    from_sequence_number="21",
+                    to_atco_code="0600MA6033",
+                    to_timing_status="OTH",
+                    to_sequence_number="22",
+                    run_time="PT0M",
+                    route_link_ref=None,
+                ),
+                JourneyPatternTimingLink(
+                    from_atco_code="0600MA6033",
+                    from_timing_status="OTH",
+                    from_sequence_number="22",
+                    to_atco_code="0600MA6002",
+                    to_timing_status="OTH",
+                    to_sequence_number="23",
+                    run_time="PT1M",
+                    route_link_ref=None,
+                ),
+                JourneyPatternTimingLink(
+                    from_atco_code="0600MA6002",
+                    from_timing_status="OTH",
+                    from_sequence_number="23",
+                    to_atco_code="0600MA0049",
+                    to_timing_status="OTH",
+                    to_sequence_number="24",
+                    run_time="PT1M",
+                    route_link_ref=None,
+                ),
+                JourneyPatternTimingLink(
+                    from_atco_code="0600MA0049",
+                    from_timing_status="OTH",
+                    from_sequence_number="24",
+                    to_atco_code="0600MA0096",
+                    to_timing_status="OTH",
+                    to_sequence_number="25",
+                    run_time="PT2M",
+                    route_link_ref=None,
+                ),
+                JourneyPatternTimingLink(
+                    from_atco_code="0600MA0096",
+                    from_timing_status="OTH",
+                    from_sequence_number="25",
+                    to_atco_code="0600MA6105",
+                    to_timing_status="OTH",
+                    to_sequence_number="26",
+                    run_time="PT1M",
+                    route_link_ref=None,
+                ),
+                JourneyPatternTimingLink(
+                    from_atco_code="0600MA6105",
+                    from_timing_status="OTH",
+                    from_sequence_number="26",
+                    to_atco_code="0600MA6152",
+                    to_timing_status="PTP",
+                    to_sequence_number="27",
+                    run_time="PT1M",
+                    route_link_ref=None,
+                ),
             ],
         ],
         "journey_pattern_info": {
@@ -922,241 +926,244 @@ expected_list_of_journey_patterns = [
     },
 ]
 
-expected_vehicle_journey = {
-    "vehicle_journey_code": "J42",
-    "service_ref": "NW_01_ANW_4_1",
-    "line_ref": "l_4_ANW",
-    "journey_pattern_ref": "JP1",
-    "departure_time": "07:35:00",
-    "journey_code": None,
-    "operational_for_today": True,
-}
+expected_vehicle_journey = VehicleJourney(
+    vehicle_journey_code="J42",
+    service_ref="NW_01_ANW_4_1",
+    line_ref="l_4_ANW",
+    journey_pattern_ref="JP1",
+    departure_time="07:35:00",
+    journey_code=None,
+    operational_for_today=True,
+    # Thursday 2025-05-08 to Wednesday 2025-05-14, Monday to Friday only
+    operating_calendar=0b1110011,
+    operating_calendar_start_date=datetime.date(2025, 5, 8),
+)
 
 expected_tracks_data_single_section = [
-    {"longitude": "-2.464747836", "latitude": "53.768564459"},
-    {"longitude": "-2.464582725", "latitude": "53.768709451"},
-    {"longitude": "-2.464477424", "latitude": "53.768790752"},
-    {"longitude": "-2.464326709", "latitude": "53.768881217"},
-    {"longitude": "-2.464204747", "latitude": "53.768827761"},
-    {"longitude": "-2.463991365", "latitude": "53.768738707"},
-    {"longitude": "-2.463899845", "latitude": "53.768694121"},
-    {"longitude": "-2.463747345", "latitude": "53.768622807"},
-    {"longitude": "-2.463472490", "latitude": "53.768462084"},
-    {"longitude": "-2.463319595", "latitude": "53.768354819"},
-    {"longitude": "-2.463151036", "latitude": "53.768202673"},
-    {"longitude": "-2.462951940", "latitude": "53.768032668"},
-    {"longitude": "-2.462932185", "latitude": "53.768019834"},
+    TrackPoint("-2.464747836", "53.768564459"),
+    TrackPoint("-2.464582725", "53.768709451"),
+    TrackPoint("-2.464477424", "53.768790752"),
+    TrackPoint("-2.464326709", "53.768881217"),
+    TrackPoint("-2.464204747", "53.768827761"),
+    TrackPoint("-2.463991365", "53.768738707"),
+    TrackPoint("-2.463899845", "53.768694121"),
+    TrackPoint("-2.463747345", "53.768622807"),
+    TrackPoint("-2.463472490", "53.768462084"),
+    TrackPoint("-2.463319595", "53.768354819"),
+    TrackPoint("-2.463151036", "53.768202673"),
+    TrackPoint("-2.462951940", "53.768032668"),
+    TrackPoint("-2.462932185", "53.768019834"),
 ]
 
 expected_tracks_data_multiple_sections = [
-    {"longitude": "-2.480598677", "latitude": "53.749030302"},
-    {"longitude": "-2.480795820", "latitude": "53.749199981"},
-    {"longitude": "-2.480799695", "latitude": "53.749228538"},
-    {"longitude": "-2.480797268", "latitude": "53.749245689"},
-    {"longitude": "-2.480791410", "latitude": "53.749262556"},
-    {"longitude": "-2.480782225", "latitude": "53.749278906"},
-    {"longitude": "-2.480769832", "latitude": "53.749294478"},
-    {"longitude": "-2.480739416", "latitude": "53.749320064"},
-    {"longitude": "-2.480720041", "latitude": "53.749331170"},
-    {"longitude": "-2.480686924", "latitude": "53.749344560"},
-    {"longitude": "-2.480650020", "latitude": "53.749354406"},
-    {"longitude": "-2.480610563", "latitude": "53.749361126"},
-    {"longitude": "-2.480556132", "latitude": "53.749365919"},
-    {"longitude": "-2.480540944", "latitude": "53.749366520"},
-    {"longitude": "-2.480513756", "latitude": "53.749366674"},
-    {"longitude": "-2.480459789", "latitude": "53.749362971"},
-    {"longitude": "-2.480433345", "latitude": "53.749359203"},
-    {"longitude": "-2.480394828", "latitude": "53.749351251"},
-    {"longitude": "-2.480358176", "latitude": "53.749340648"},
-    {"longitude": "-2.480335044", "latitude": "53.749332175"},
-    {"longitude": "-2.480286704", "latitude": "53.749308568"},
-    {"longitude": "-2.479777459", "latitude": "53.749124159"},
-    {"longitude": "-2.479636698", "latitude": "53.749101003"},
-    {"longitude": "-2.479609014", "latitude": "53.749142837"},
-    {"longitude": "-2.479606883", "latitude": "53.749146063"},
-    {"longitude": "-2.479546945", "latitude": "53.749209220"},
-    {"longitude": "-2.479337315", "latitude": "53.749443750"},
-    {"longitude": "-2.479157499", "latitude": "53.749633220"},
-    {"longitude": "-2.479129374", "latitude": "53.749660297"},
-    {"longitude": "-2.479007498", "latitude": "53.749777630"},
-    {"longitude": "-2.478897279", "latitude": "53.749867978"},
-    {"longitude": "-2.478874747", "latitude": "53.749910888"},
-    {"longitude": "-2.478870250", "latitude": "53.749919436"},
-    {"longitude": "-2.478798057", "latitude": "53.749978587"},
-    {"longitude": "-2.478789162", "latitude": "53.749985876"},
-    {"longitude": "-2.478741326", "latitude": "53.750007963"},
-    {"longitude": "-2.478726577", "latitude": "53.750021827"},
-    {"longitude": "-2.478602162", "latitude": "53.750138774"},
-    {"longitude": "-2.478196819", "latitude": "53.750499918"},
-    {"longitude": "-2.477927743", "latitude": "53.750842540"},
-    {"longitude": "-2.477902737", "latitude": "53.750866611"},
-    {"longitude": "-2.477877745", "latitude": "53.750890673"},
-    {"longitude": "-2.477852739", "latitude": "53.750914744"},
-    {"longitude": "-2.477839596", "latitude": "53.750936638"},
-    {"longitude": "-2.477831634", "latitude": "53.750949891"},
-    {"longitude": "-2.477826439", "latitude": "53.750958540"},
-    {"longitude": "-2.477813297", "latitude": "53.750980434"},
-    {"longitude": "-2.477776224", "latitude": "53.751019635"},
-    {"longitude": "-2.477663484", "latitude": "53.751146224"},
-    {"longitude": "-2.477545754", "latitude": "53.751198087"},
-    {"longitude": "-2.477451007", "latitude": "53.751239828"},
-    {"longitude": "-2.476967112", "latitude": "53.751718216"},
-    {"longitude": "-2.476802542", "latitude": "53.751916610"},
-    {"longitude": "-2.476355335", "latitude": "53.752601486"},
-    {"longitude": "-2.476071575", "latitude": "53.752989103"},
-    {"longitude": "-2.475593912", "latitude": "53.753665108"},
-    {"longitude": "-2.475578950", "latitude": "53.753683144"},
-    {"longitude": "-2.475474215", "latitude": "53.753809393"},
-    {"longitude": "-2.475294363", "latitude": "53.753998857"},
-    {"longitude": "-2.475234412", "latitude": "53.754062012"},
-    {"longitude": "-2.475114351", "latitude": "53.754174336"},
-    {"longitude": "-2.475099344", "latitude": "53.754188381"},
-    {"longitude": "-2.475069317", "latitude": "53.754215465"},
-    {"longitude": "-2.475054355", "latitude": "53.754233500"},
-    {"longitude": "-2.474887636", "latitude": "53.754243149"},
-    {"longitude": "-2.474570377", "latitude": "53.754352264"},
-    {"longitude": "-2.474414937", "latitude": "53.754185260"},
-    {"longitude": "-2.474045844", "latitude": "53.753758941"},
-    {"longitude": "-2.473853721", "latitude": "53.753539592"},
-    {"longitude": "-2.473694712", "latitude": "53.753358049"},
-    {"longitude": "-2.473403035", "latitude": "53.753044617"},
-    {"longitude": "-2.473126528", "latitude": "53.752731126"},
-    {"longitude": "-2.472880455", "latitude": "53.752426501"},
-    {"longitude": "-2.472834657", "latitude": "53.752399718"},
-    {"longitude": "-2.472804126", "latitude": "53.752381862"},
-    {"longitude": "-2.472712531", "latitude": "53.752328295"},
-    {"longitude": "-2.472697064", "latitude": "53.752301391"},
-    {"longitude": "-2.472663526", "latitude": "53.752249335"},
-    {"longitude": "-2.472490041", "latitude": "53.751980056"},
-    {"longitude": "-2.472284790", "latitude": "53.752051350"},
-    {"longitude": "-2.472133546", "latitude": "53.752087899"},
-    {"longitude": "-2.472057824", "latitude": "53.752097185"},
-    {"longitude": "-2.471997165", "latitude": "53.752097424"},
-    {"longitude": "-2.471951671", "latitude": "53.752097603"},
-    {"longitude": "-2.471786471", "latitude": "53.752242064"},
-    {"longitude": "-2.471741279", "latitude": "53.752269206"},
-    {"longitude": "-2.471605300", "latitude": "53.752314682"},
-    {"longitude": "-2.470849876", "latitude": "53.752569321"},
-    {"longitude": "-2.471141732", "latitude": "53.752900734"},
-    {"longitude": "-2.471350360", "latitude": "53.753246626"},
-    {"longitude": "-2.471466239", "latitude": "53.753438744"},
-    {"longitude": "-2.471496972", "latitude": "53.753474575"},
-    {"longitude": "-2.471619804", "latitude": "53.753608914"},
-    {"longitude": "-2.471660823", "latitude": "53.753647644"},
-    {"longitude": "-2.472415948", "latitude": "53.754360778"},
-    {"longitude": "-2.472430550", "latitude": "53.754374567"},
-    {"longitude": "-2.472637878", "latitude": "53.754570351"},
-    {"longitude": "-2.472861421", "latitude": "53.754781462"},
-    {"longitude": "-2.472968793", "latitude": "53.754888896"},
-    {"longitude": "-2.472681755", "latitude": "53.754988898"},
-    {"longitude": "-2.472152970", "latitude": "53.755170745"},
-    {"longitude": "-2.471639146", "latitude": "53.755334555"},
-    {"longitude": "-2.471094885", "latitude": "53.755489494"},
-    {"longitude": "-2.470051849", "latitude": "53.755799187"},
-    {"longitude": "-2.469834181", "latitude": "53.755864755"},
-    {"longitude": "-2.468782106", "latitude": "53.756181662"},
-    {"longitude": "-2.468721742", "latitude": "53.756208863"},
-    {"longitude": "-2.468646211", "latitude": "53.756236122"},
-    {"longitude": "-2.468362425", "latitude": "53.756399433"},
-    {"longitude": "-2.468284523", "latitude": "53.756444263"},
-    {"longitude": "-2.467983297", "latitude": "53.756634190"},
-    {"longitude": "-2.467757600", "latitude": "53.756796858"},
-    {"longitude": "-2.467738826", "latitude": "53.756820291"},
-    {"longitude": "-2.467727667", "latitude": "53.756832927"},
-    {"longitude": "-2.467677597", "latitude": "53.756933574"},
-    {"longitude": "-2.467426735", "latitude": "53.757049816"},
-    {"longitude": "-2.467162801", "latitude": "53.757184202"},
-    {"longitude": "-2.467140168", "latitude": "53.757194743"},
-    {"longitude": "-2.467080000", "latitude": "53.757239918"},
-    {"longitude": "-2.466854696", "latitude": "53.757438535"},
-    {"longitude": "-2.466839728", "latitude": "53.757456569"},
-    {"longitude": "-2.466810492", "latitude": "53.757555553"},
-    {"longitude": "-2.466795814", "latitude": "53.758072659"},
-    {"longitude": "-2.466787238", "latitude": "53.758193799"},
-    {"longitude": "-2.466743233", "latitude": "53.758328792"},
-    {"longitude": "-2.466668794", "latitude": "53.758454915"},
-    {"longitude": "-2.466563921", "latitude": "53.758572169"},
-    {"longitude": "-2.466548953", "latitude": "53.758590203"},
-    {"longitude": "-2.466429011", "latitude": "53.758716504"},
-    {"longitude": "-2.466294101", "latitude": "53.758860839"},
-    {"longitude": "-2.466264165", "latitude": "53.758896907"},
-    {"longitude": "-2.466128955", "latitude": "53.759014279"},
-    {"longitude": "-2.465798958", "latitude": "53.759348122"},
-    {"longitude": "-2.465693782", "latitude": "53.759438412"},
-    {"longitude": "-2.465663746", "latitude": "53.759465493"},
-    {"longitude": "-2.465575877", "latitude": "53.759540293"},
-    {"longitude": "-2.465460888", "latitude": "53.759638179"},
-    {"longitude": "-2.464986975", "latitude": "53.759989431"},
-    {"longitude": "-2.464686106", "latitude": "53.760215301"},
-    {"longitude": "-2.464535918", "latitude": "53.760350705"},
-    {"longitude": "-2.464416263", "latitude": "53.760503967"},
-    {"longitude": "-2.464404829", "latitude": "53.760527100"},
-    {"longitude": "-2.464371752", "latitude": "53.760594020"},
-    {"longitude": "-2.464298095", "latitude": "53.760792044"},
-    {"longitude": "-2.464254377", "latitude": "53.760953999"},
-    {"longitude": "-2.464212652", "latitude": "53.761296616"},
-    {"longitude": "-2.464214957", "latitude": "53.761333683"},
-    {"longitude": "-2.464215022", "latitude": "53.761511414"},
-    {"longitude": "-2.464247739", "latitude": "53.761727001"},
-    {"longitude": "-2.464263304", "latitude": "53.761762893"},
-    {"longitude": "-2.464295227", "latitude": "53.761906579"},
-    {"longitude": "-2.464342518", "latitude": "53.762068182"},
-    {"longitude": "-2.464389015", "latitude": "53.762157883"},
-    {"longitude": "-2.464131748", "latitude": "53.762212808"},
-    {"longitude": "-2.463963500", "latitude": "53.762239516"},
-    {"longitude": "-2.463917854", "latitude": "53.762246760"},
-    {"longitude": "-2.463783470", "latitude": "53.762268085"},
-    {"longitude": "-2.463363222", "latitude": "53.762318597"},
-    {"longitude": "-2.463010871", "latitude": "53.762360954"},
-    {"longitude": "-2.462435064", "latitude": "53.762417107"},
-    {"longitude": "-2.462283675", "latitude": "53.762444655"},
-    {"longitude": "-2.462026503", "latitude": "53.762508564"},
-    {"longitude": "-2.462350764", "latitude": "53.762875848"},
-    {"longitude": "-2.462825251", "latitude": "53.763413279"},
-    {"longitude": "-2.463021951", "latitude": "53.763367578"},
-    {"longitude": "-2.463188709", "latitude": "53.763357946"},
-    {"longitude": "-2.463355565", "latitude": "53.763357300"},
-    {"longitude": "-2.463431409", "latitude": "53.763357007"},
-    {"longitude": "-2.463537690", "latitude": "53.763365584"},
-    {"longitude": "-2.463644070", "latitude": "53.763383149"},
-    {"longitude": "-2.463738467", "latitude": "53.763405099"},
-    {"longitude": "-2.463872196", "latitude": "53.763436194"},
-    {"longitude": "-2.464146226", "latitude": "53.763525014"},
-    {"longitude": "-2.464344724", "latitude": "53.763622997"},
-    {"longitude": "-2.464149499", "latitude": "53.763821608"},
-    {"longitude": "-2.463744099", "latitude": "53.764200678"},
-    {"longitude": "-2.463548882", "latitude": "53.764381195"},
-    {"longitude": "-2.463778561", "latitude": "53.764468669"},
-    {"longitude": "-2.463878502", "latitude": "53.764562324"},
-    {"longitude": "-2.464123306", "latitude": "53.764685430"},
-    {"longitude": "-2.464486987", "latitude": "53.764878900"},
-    {"longitude": "-2.464528881", "latitude": "53.764922348"},
-    {"longitude": "-2.464526953", "latitude": "53.765033538"},
-    {"longitude": "-2.464285731", "latitude": "53.765169295"},
-    {"longitude": "-2.464165169", "latitude": "53.765241667"},
-    {"longitude": "-2.464059776", "latitude": "53.765313980"},
-    {"longitude": "-2.464029735", "latitude": "53.765341060"},
-    {"longitude": "-2.463999891", "latitude": "53.765386116"},
-    {"longitude": "-2.463939087", "latitude": "53.765467083"},
-    {"longitude": "-2.463761143", "latitude": "53.765746564"},
-    {"longitude": "-2.463597051", "latitude": "53.765998866"},
-    {"longitude": "-2.463567008", "latitude": "53.766025946"},
-    {"longitude": "-2.463324466", "latitude": "53.766318099"},
-    {"longitude": "-2.463267573", "latitude": "53.766386628"},
-    {"longitude": "-2.462982511", "latitude": "53.766675349"},
-    {"longitude": "-2.463058955", "latitude": "53.766728982"},
-    {"longitude": "-2.463120130", "latitude": "53.766773686"},
-    {"longitude": "-2.463460605", "latitude": "53.767383560"},
-    {"longitude": "-2.463599316", "latitude": "53.767580761"},
-    {"longitude": "-2.463783342", "latitude": "53.767759811"},
-    {"longitude": "-2.463829349", "latitude": "53.767804573"},
-    {"longitude": "-2.463921164", "latitude": "53.767876122"},
-    {"longitude": "-2.464196613", "latitude": "53.768090770"},
-    {"longitude": "-2.464425460", "latitude": "53.768206728"},
-    {"longitude": "-2.464821583", "latitude": "53.768357990"},
-    {"longitude": "-2.464913004", "latitude": "53.768393587"},
-    {"longitude": "-2.464778057", "latitude": "53.768537920"},
-    {"longitude": "-2.464747836", "latitude": "53.768564459"},
+    TrackPoint("-2.480598677", "53.749030302"),
+    TrackPoint("-2.480795820", "53.749199981"),
+    TrackPoint("-2.480799695", "53.749228538"),
+    TrackPoint("-2.480797268", "53.749245689"),
+    TrackPoint("-2.480791410", "53.749262556"),
+    TrackPoint("-2.480782225", "53.749278906"),
+    TrackPoint("-2.480769832", "53.749294478"),
+    TrackPoint("-2.480739416", "53.749320064"),
+    TrackPoint("-2.480720041", "53.749331170"),
+    TrackPoint("-2.480686924", "53.749344560"),
+    TrackPoint("-2.480650020", "53.749354406"),
+    TrackPoint("-2.480610563", "53.749361126"),
+    TrackPoint("-2.480556132", "53.749365919"),
+    TrackPoint("-2.480540944", "53.749366520"),
+    TrackPoint("-2.480513756", "53.749366674"),
+    TrackPoint("-2.480459789", "53.749362971"),
+    TrackPoint("-2.480433345", "53.749359203"),
+    TrackPoint("-2.480394828", "53.749351251"),
+    TrackPoint("-2.480358176", "53.749340648"),
+    TrackPoint("-2.480335044", "53.749332175"),
+    TrackPoint("-2.480286704", "53.749308568"),
+    TrackPoint("-2.479777459", "53.749124159"),
+    TrackPoint("-2.479636698", "53.749101003"),
+    TrackPoint("-2.479609014", "53.749142837"),
+    TrackPoint("-2.479606883", "53.749146063"),
+    TrackPoint("-2.479546945", "53.749209220"),
+    TrackPoint("-2.479337315", "53.749443750"),
+    TrackPoint("-2.479157499", "53.749633220"),
+    TrackPoint("-2.479129374", "53.749660297"),
+    TrackPoint("-2.479007498", "53.749777630"),
+    TrackPoint("-2.478897279", "53.749867978"),
+    TrackPoint("-2.478874747", "53.749910888"),
+    TrackPoint("-2.478870250", "53.749919436"),
+    TrackPoint("-2.478798057", "53.749978587"),
+    TrackPoint("-2.478789162", "53.749985876"),
+    TrackPoint("-2.478741326", "53.750007963"),
+    TrackPoint("-2.478726577", "53.750021827"),
+    TrackPoint("-2.478602162", "53.750138774"),
+    TrackPoint("-2.478196819", "53.750499918"),
+    TrackPoint("-2.477927743", "53.750842540"),
+    TrackPoint("-2.477902737", "53.750866611"),
+    TrackPoint("-2.477877745", "53.750890673"),
+    TrackPoint("-2.477852739", "53.750914744"),
+    TrackPoint("-2.477839596", "53.750936638"),
+    TrackPoint("-2.477831634", "53.750949891"),
+    TrackPoint("-2.477826439", "53.750958540"),
+    TrackPoint("-2.477813297", "53.750980434"),
+    TrackPoint("-2.477776224", "53.751019635"),
+    TrackPoint("-2.477663484", "53.751146224"),
+    TrackPoint("-2.477545754", "53.751198087"),
+    TrackPoint("-2.477451007", "53.751239828"),
+    TrackPoint("-2.476967112", "53.751718216"),
+    TrackPoint("-2.476802542", "53.751916610"),
+    TrackPoint("-2.476355335", "53.752601486"),
+    TrackPoint("-2.476071575", "53.752989103"),
+    TrackPoint("-2.475593912", "53.753665108"),
+    TrackPoint("-2.475578950", "53.753683144"),
+    TrackPoint("-2.475474215", "53.753809393"),
+    TrackPoint("-2.475294363", "53.753998857"),
+    TrackPoint("-2.475234412", "53.754062012"),
+    TrackPoint("-2.475114351", "53.754174336"),
+    TrackPoint("-2.475099344", "53.754188381"),
+    TrackPoint("-2.475069317", "53.754215465"),
+    TrackPoint("-2.475054355", "53.754233500"),
+    TrackPoint("-2.474887636", "53.754243149"),
+    TrackPoint("-2.474570377", "53.754352264"),
+    TrackPoint("-2.474414937", "53.754185260"),
+    TrackPoint("-2.474045844", "53.753758941"),
+    TrackPoint("-2.473853721", "53.753539592"),
+    TrackPoint("-2.473694712", "53.753358049"),
+    TrackPoint("-2.473403035", "53.753044617"),
+    TrackPoint("-2.473126528", "53.752731126"),
+    TrackPoint("-2.472880455", "53.752426501"),
+    TrackPoint("-2.472834657", "53.752399718"),
+    TrackPoint("-2.472804126", "53.752381862"),
+    TrackPoint("-2.472712531", "53.752328295"),
+    TrackPoint("-2.472697064", "53.752301391"),
+    TrackPoint("-2.472663526", "53.752249335"),
+    TrackPoint("-2.472490041", "53.751980056"),
+    TrackPoint("-2.472284790", "53.752051350"),
+    TrackPoint("-2.472133546", "53.752087899"),
+    TrackPoint("-2.472057824", "53.752097185"),
+    TrackPoint("-2.471997165", "53.752097424"),
+    TrackPoint("-2.471951671", "53.752097603"),
+    TrackPoint("-2.471786471", "53.752242064"),
+    TrackPoint("-2.471741279", "53.752269206"),
+    TrackPoint("-2.471605300", "53.752314682"),
+    TrackPoint("-2.470849876", "53.752569321"),
+    TrackPoint("-2.471141732", "53.752900734"),
+    TrackPoint("-2.471350360", "53.753246626"),
+    TrackPoint("-2.471466239", "53.753438744"),
+    TrackPoint("-2.471496972", "53.753474575"),
+    TrackPoint("-2.471619804", "53.753608914"),
+    TrackPoint("-2.471660823", "53.753647644"),
+    TrackPoint("-2.472415948", "53.754360778"),
+    TrackPoint("-2.472430550", "53.754374567"),
+    TrackPoint("-2.472637878", "53.754570351"),
+    TrackPoint("-2.472861421", "53.754781462"),
+    TrackPoint("-2.472968793", "53.754888896"),
+    TrackPoint("-2.472681755", "53.754988898"),
+    TrackPoint("-2.472152970", "53.755170745"),
+    TrackPoint("-2.471639146", "53.755334555"),
+    TrackPoint("-2.471094885", "53.755489494"),
+    TrackPoint("-2.470051849", "53.755799187"),
+    TrackPoint("-2.469834181", "53.755864755"),
+    TrackPoint("-2.468782106", "53.756181662"),
+    TrackPoint("-2.468721742", "53.756208863"),
+    TrackPoint("-2.468646211", "53.756236122"),
+    TrackPoint("-2.468362425", "53.756399433"),
+    TrackPoint("-2.468284523", "53.756444263"),
+    TrackPoint("-2.467983297", "53.756634190"),
+    TrackPoint("-2.467757600", "53.756796858"),
+    TrackPoint("-2.467738826", "53.756820291"),
+    TrackPoint("-2.467727667", "53.756832927"),
+    TrackPoint("-2.467677597", "53.756933574"),
+    TrackPoint("-2.467426735", "53.757049816"),
+    TrackPoint("-2.467162801", "53.757184202"),
+    TrackPoint("-2.467140168", "53.757194743"),
+    TrackPoint("-2.467080000", "53.757239918"),
+    TrackPoint("-2.466854696", "53.757438535"),
+    TrackPoint("-2.466839728", "53.757456569"),
+    TrackPoint("-2.466810492", "53.757555553"),
+    TrackPoint("-2.466795814", "53.758072659"),
+    TrackPoint("-2.466787238", "53.758193799"),
+    TrackPoint("-2.466743233", "53.758328792"),
+    TrackPoint("-2.466668794", "53.758454915"),
+    TrackPoint("-2.466563921", "53.758572169"),
+    TrackPoint("-2.466548953", "53.758590203"),
+    TrackPoint("-2.466429011", "53.758716504"),
+    TrackPoint("-2.466294101", "53.758860839"),
+    TrackPoint("-2.466264165", "53.758896907"),
+    TrackPoint("-2.466128955", "53.759014279"),
+    TrackPoint("-2.465798958", "53.759348122"),
+    TrackPoint("-2.465693782", "53.759438412"),
+    TrackPoint("-2.465663746", "53.759465493"),
+    TrackPoint("-2.465575877", "53.759540293"),
+    TrackPoint("-2.465460888", "53.759638179"),
+    TrackPoint("-2.464986975", "53.759989431"),
+    TrackPoint("-2.464686106", "53.760215301"),
+    TrackPoint("-2.464535918", "53.760350705"),
+    TrackPoint("-2.464416263", "53.760503967"),
+    TrackPoint("-2.464404829", "53.760527100"),
+    TrackPoint("-2.464371752", "53.760594020"),
+    TrackPoint("-2.464298095", "53.760792044"),
+    TrackPoint("-2.464254377", "53.760953999"),
+    TrackPoint("-2.464212652", "53.761296616"),
+    TrackPoint("-2.464214957", "53.761333683"),
+    TrackPoint("-2.464215022", "53.761511414"),
+    TrackPoint("-2.464247739", "53.761727001"),
+    TrackPoint("-2.464263304", "53.761762893"),
+    TrackPoint("-2.464295227", "53.761906579"),
+    TrackPoint("-2.464342518", "53.762068182"),
+    TrackPoint("-2.464389015", "53.762157883"),
+    TrackPoint("-2.464131748", "53.762212808"),
+    TrackPoint("-2.463963500", "53.762239516"),
+    TrackPoint("-2.463917854", "53.762246760"),
+    TrackPoint("-2.463783470", "53.762268085"),
+    TrackPoint("-2.463363222", "53.762318597"),
+    TrackPoint("-2.463010871", "53.762360954"),
+    TrackPoint("-2.462435064", "53.762417107"),
+    TrackPoint("-2.462283675", "53.762444655"),
+    TrackPoint("-2.462026503", "53.762508564"),
+    TrackPoint("-2.462350764", "53.762875848"),
+    TrackPoint("-2.462825251", "53.763413279"),
+    TrackPoint("-2.463021951", "53.763367578"),
+    TrackPoint("-2.463188709", "53.763357946"),
+    TrackPoint("-2.463355565", "53.763357300"),
+    TrackPoint("-2.463431409", "53.763357007"),
+    TrackPoint("-2.463537690", "53.763365584"),
+    TrackPoint("-2.463644070", "53.763383149"),
+    TrackPoint("-2.463738467", "53.763405099"),
+    TrackPoint("-2.463872196", "53.763436194"),
+    TrackPoint("-2.464146226", "53.763525014"),
+    TrackPoint("-2.464344724", "53.763622997"),
+    TrackPoint("-2.464149499", "53.763821608"),
+    TrackPoint("-2.463744099", "53.764200678"),
+    TrackPoint("-2.463548882", "53.764381195"),
+    TrackPoint("-2.463778561", "53.764468669"),
+    TrackPoint("-2.463878502", "53.764562324"),
+    TrackPoint("-2.464123306", "53.764685430"),
+    TrackPoint("-2.464486987", "53.764878900"),
+    TrackPoint("-2.464528881", "53.764922348"),
+    TrackPoint("-2.464526953", "53.765033538"),
+    TrackPoint("-2.464285731", "53.765169295"),
+    TrackPoint("-2.464165169", "53.765241667"),
+    TrackPoint("-2.464059776", "53.765313980"),
+    TrackPoint("-2.464029735", "53.765341060"),
+    TrackPoint("-2.463999891", "53.765386116"),
+    TrackPoint("-2.463939087", "53.765467083"),
+    TrackPoint("-2.463761143", "53.765746564"),
+    TrackPoint("-2.463597051", "53.765998866"),
+    TrackPoint("-2.463567008", "53.766025946"),
+    TrackPoint("-2.463324466", "53.766318099"),
+    TrackPoint("-2.463267573", "53.766386628"),
+    TrackPoint("-2.462982511", "53.766675349"),
+    TrackPoint("-2.463058955", "53.766728982"),
+    TrackPoint("-2.463120130", "53.766773686"),
+    TrackPoint("-2.463460605", "53.767383560"),
+    TrackPoint("-2.463599316", "53.767580761"),
+    TrackPoint("-2.463783342", "53.767759811"),
+    TrackPoint("-2.463829349", "53.767804573"),
+    TrackPoint("-2.463921164", "53.767876122"),
+    TrackPoint("-2.464196613", "53.768090770"),
+    TrackPoint("-2.464425460", "53.768206728"),
+    TrackPoint("-2.464821583", "53.768357990"),
+    TrackPoint("-2.464913004", "53.768393587"),
+    TrackPoint("-2.464778057", "53.768537920"),
+    TrackPoint("-2.464747836", "53.768564459"),
 ]
 
 
@@ -0,0 +1,227 @@
+import io
+import os
+import zipfile
+from unittest.mock import MagicMock, patch
+
+import pytest
+import bulk_load
+from bulk_load import (
+    TxcFile,
+    check_new_tables,
+    find_txc_files,
+    load_file,
+    open_local_copy,
+)
+from stage_timer import StageTimer
+
+TXC = b"<TransXChange />"
+
+
+def write_zip(path, members: dict):
+    with zipfile.ZipFile(path, "w") as archive:
+        for name, content in members.items():
+            archive.writestr(name, content)
+
+
+def build_zip(members: dict) -> bytes:
+    buffer = io.BytesIO()
+    write_zip(buffer, members)
+    return buffer.getvalue()
+
+
+class TestFindTxcFiles:
+    def test_files_are_keyed_like_the_unzipper_keys_them(self, tmp_path):
+        write_zip(
+            tmp_path / "EA.zip",
+            {
+                "ea_1.xml": TXC,
+                "nested.zip": build_zip({"ea_2.xml": TXC}),
+                "readme.txt": b"",
+            },
+        )
+        (tmp_path / "extra").mkdir()
+        (tmp_path / "extra" / "file.xml").write_bytes(TXC)
+
+        files = find_txc_files(str(tmp_path), "local/tnds/")
+
+        assert sorted(file.key for file in files) == [
+            "local/tnds/EA/ea_1.xml",
+            "local/tnds/EA/nested/ea_2.xml",
+            "local/tnds/extra/file.xml",
+        ]
+        nested = next(file for file in files if file.key.endswith("ea_2.xml"))
+        assert nested.path == str(tmp_path / "EA.zip")
+        assert nested.members == ("nested.zip", "ea_2.xml")
+
+    def test_largest_files_come_first(self, tmp_path):
+        (tmp_path / "small.xml").write_bytes(TXC)
+        (tmp_path / "large.xml").write_bytes(TXC * 10)
+
+        files = find_txc_files(str(tmp_path), "local/bods")
+
+        assert [file.key for file in files] == [
+            "local/bods/large.xml",
+            "local/bods/small.xml",
+        ]
+
+    def test_s3_prefix_keeps_object_keys(self, s3):
+        s3.create_bucket(
+            Bucket="txc-bucket",
+            CreateBucketConfiguration={"LocationConstraint": "eu-west-2"},
+        )
+        s3.put_object(Bucket="txc-bucket", Key="20250213/tnds/WM/a.xml", Body=TXC)
+        s3.put_object(Bucket="txc-bucket", Key="20250213/tnds/WM.zip", Body=b"")
+
+        files = find_txc_files("s3://txc-bucket/20250213/tnds", "ignored", s3)
+
+        assert files == [
+            TxcFile(
+                "20250213/tnds/WM/a.xml",
+                "s3://txc-bucket/20250213/tnds/WM/a.xml",
+                (),
+                len(TXC),
+            )
+        ]
+
+
+class TestOpenLocalCopy:
+    def test_nested_zip_members_are_extracted_and_removed(self, tmp_path):
+        write_zip(tmp_path / "EA.zip", {"nested.zip": build_zip({"ea.xml": TXC})})
+        txc_file = TxcFile(
+            "local/tnds/EA/nested/ea.xml",
+            str(tmp_path / "EA.zip"),
+            ("nested.zip", "ea.xml"),
+            len(TXC),
+        )
+        timer = StageTimer()
+
+        with open_local_copy(txc_file, str(tmp_path), None, timer) as path:
+            with open(path, "rb") as file:
+                assert file.read() == TXC
+
+        assert not os.path.exists(path)
+        assert timer.stages["Download"]["bytes"] == len(TXC)
+
+    def test_plain_files_are_read_in_place(self, tmp_path):
+        (tmp_path / "file.xml").write_bytes(TXC)
+        txc_file = TxcFile("local/bods/file.xml", str(tmp_path / "file.xml"), (), 16)
+
+        with open_local_copy(txc_file, str(tmp_path), None, StageTimer()) as path:
+            assert path == str(tmp_path / "file.xml")
+
+        assert os.path.exists(path)
+
+
+@pytest.fixture
+def connection_manager(metrics, tmp_path):
+    connection_manager = MagicMock()
+    worker = {
+        "connection_manager": connection_manager,
+        "bank_holidays": [],
+        "metrics": metrics,
+        "s3": None,
+        "tmp_dir": str(tmp_path),
+    }
+
+    with patch.dict(bulk_load.worker, worker):
+        yield connection_manager
+
+
+@pytest.fixture
+def txc_file(tmp_path):
+    (tmp_path / "file.xml").write_bytes(TXC)
+
+    return TxcFile("local/tnds/WM/file.xml", str(tmp_path / "file.xml"), (), len(TXC))
+
+
+class TestLoadFile:
+    @patch("bulk_load.write_txc_file_to_db")
+    def test_written_file_is_summarised(
+        self, write_patch, connection_manager, txc_file
+    ):
+        write_patch.return_value = True
+
+        result = load_file(txc_file)
+
+        assert result["status"] == "written"
+        assert result["key"] == "local/tnds/WM/file.xml"
+        assert write_patch.call_args.args[:3] == (
+            txc_file.path,
+            len(TXC),
+            "local/tnds/WM/file.xml",
+        )
+        connection_manager.release.assert_called_once()
+
+    @patch("bulk_load.write_txc_file_to_db")
+    def test_skip_reason_is_taken_from_metrics(
+        self, write_patch, connection_manager, txc_file, metrics
+    ):
+        def skip_file(*args):
+            metrics.add_metric(name="NoUseableDataInFile", unit="NoUnit", value=1)
+            return False
+
+        write_patch.side_effect = skip_file
+
+        result = load_file(txc_file)
+
+        assert result["status"] == "skipped"
+        assert result["metrics"] == ["NoUseableDataInFile"]
+        assert not metrics.metric_set
+
+    @patch("bulk_load.write_txc_file_to_db")
+    def test_metrics_of_each_file_are_by_data_source(
+        self, write_patch, connection_manager, txc_file, metrics
+    ):
+        dimensions = []
+        write_patch.side_effect = lambda *args: dimensions.append(
+            dict(metrics.dimension_set)
+        )
+
+        load_file(txc_file)
+        load_file(txc_file._replace(key="local/bods/file.xml"))
+
+        assert dimensions == [
+            {"By Data Source": "tnds"},
+            {"By Data Source": "bods"},
+        ]
+        assert not metrics.dimension_set
+
+    @patch("bulk_load.write_txc_file_to_db")
+    def test_errors_are_recorded_and_do_not_stop_the_load(
+        self, write_patch, connection_manager, txc_file
+    ):
+        write_patch.side_effect = ValueError("Bad file")
+
+        result = load_file(txc_file)
+
+        assert result["status"] == "failed"
+        assert result["error"] == "Bad file"
+        connection_manager.release.assert_called_once()
+
+
+class TestCheckNewTables:
+    def test_missing_tables_are_reported(self):
+        cursor = MagicMock()
+        cursor.fetchall.return_value = [("operators_new",), ("services_new",)]
+
+        assert check_new_tables(cursor) == [
+            "operators_new does not exist",
+            "services_new does not exist",
+        ]
+        cursor.execute.assert_called_once()
+
+    def test_empty_operators_are_reported(self):
+        cursor = MagicMock()
+        cursor.fetchall.return_value = []
+        cursor.fetchone.return_value = (False,)
+
+        assert check_new_tables(cursor) == [
+            "operators_new is empty, so every file would be skipped"
+        ]
+
+    def test_prepared_database_has_no_problems(self):
+        cursor = MagicMock()
+        cursor.fetchall.return_value = []
+        cursor.fetchone.return_value = (True,)
+
+        assert check_new_tables(cursor) == []
@@ -0,0 +1,52 @@
+import datetime
+from unittest.mock import MagicMock
+
+from bulk_writer import COPY_THRESHOLD, bulk_insert, write_copy_buffer
+
+columns = ("operator_service_id", "longitude", "latitude")
+
+
+class TestCopyBuffer:
+    def test_values_are_written_in_copy_text_format(self):
+        buffer = write_copy_buffer(
+            [
+                (1, None, True, datetime.date(2025, 5, 8)),
+                (2, "tab\there", False, "back\\slash\nnewline"),
+            ]
+        )
+
+        assert buffer.getvalue() == (
+            "1\t\\N\tt\t2025-05-08\n" "2\ttab\\there\tf\tback\\\\slash\\nnewline\n"
+        )
+
+
+class TestBulkInsert:
+    def test_no_statement_is_sent_for_empty_rows(self):
+        cursor = MagicMock()
+
+        bulk_insert(cursor, "tracks_new", columns, [])
+
+        cursor.execute.assert_not_called()
+        cursor.copy_expert.assert_not_called()
+
+    def test_small_batches_use_one_multi_row_insert(self):
+        cursor = MagicMock()
+
+        bulk_insert(cursor, "tracks_new", columns, [(1, "-2.1", "53.1"), (1, "-2.2", "53.2")])
+
+        cursor.execute.assert_called_once_with(
+            "INSERT INTO tracks_new (operator_service_id, longitude, latitude) VALUES (%s, %s, %s), (%s, %s, %s)",
+            [1, "-2.1", "53.1", 1, "-2.2", "53.2"],
+        )
+        cursor.copy_expert.assert_not_called()
+
+    def test_large_batches_are_copied(self):
+        cursor = MagicMock()
+        rows = [(1, "-2.1", "53.1")] * COPY_THRESHOLD
+
+        bulk_insert(cursor, "tracks_new", columns, rows)
+
+        cursor.execute.assert_not_called()
+        query, buffer = cursor.copy_expert.call_args.args
+        assert query == "COPY tracks_new (operator_service_id, longitude, latitude) FROM STDIN"
+        assert buffer.getvalue() == "1\t-2.1\t53.1\n" * COPY_THRESHOLD
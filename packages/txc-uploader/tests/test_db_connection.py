@@ -0,0 +1,122 @@
+from unittest.mock import MagicMock
+
+import psycopg2
+import pytest
+from db_connection import ConnectionManager
+from psycopg2.extensions import (
+    TRANSACTION_STATUS_IDLE,
+    TRANSACTION_STATUS_INERROR,
+    TRANSACTION_STATUS_UNKNOWN,
+)
+
+
+def create_connection():
+    connection = MagicMock()
+    connection.closed = 0
+    connection.get_transaction_status.return_value = TRANSACTION_STATUS_IDLE
+    return connection
+
+
+class TestConnectionManager:
+    def test_connection_is_reused_while_healthy(self):
+        connect = MagicMock(side_effect=lambda dsn: create_connection())
+        manager = ConnectionManager(lambda force_fetch: "dsn", connect)
+
+        first = manager.get_connection()
+        manager.release()
+        second = manager.get_connection()
+
+        assert first is second
+        assert connect.call_count == 1
+        assert manager.metrics()["connections_opened"] == 1
+        assert manager.metrics()["connections_reused"] == 1
+        assert manager.metrics()["reuse_rate"] == 0.5
+
+    def test_closed_connection_is_replaced(self):
+        connect = MagicMock(side_effect=lambda dsn: create_connection())
+        manager = ConnectionManager(lambda force_fetch: "dsn", connect)
+
+        first = manager.get_connection()
+        first.closed = 1
+        second = manager.get_connection()
+
+        assert first is not second
+        assert connect.call_count == 2
+
+    def test_connection_in_unknown_state_is_replaced(self):
+        connect = MagicMock(side_effect=lambda dsn: create_connection())
+        manager = ConnectionManager(lambda force_fetch: "dsn", connect)
+
+        first = manager.get_connection()
+        first.get_transaction_status.return_value = TRANSACTION_STATUS_UNKNOWN
+
+        assert manager.get_connection() is not first
+
+    def test_open_transaction_is_rolled_back_on_release(self):
+        manager = ConnectionManager(
+            lambda force_fetch: "dsn", MagicMock(side_effect=lambda dsn: create_connection())
+        )
+
+        connection = manager.get_connection()
+        connection.get_transaction_status.return_value = TRANSACTION_STATUS_INERROR
+        manager.release()
+
+        connection.rollback.assert_called_once()
+
+    def test_connection_is_probed_before_reuse(self):
+        manager = ConnectionManager(
+            lambda force_fetch: "dsn",
+            MagicMock(side_effect=lambda dsn: create_connection()),
+        )
+
+        first = manager.get_connection()
+        manager.release()
+        first.cursor.return_value.__enter__.return_value.execute.side_effect = (
+            psycopg2.OperationalError()
+        )
+
+        assert manager.get_connection() is not first
+        first.close.assert_called_once()
+
+    def test_credentials_are_refetched_after_failed_connect(self):
+        get_dsn = MagicMock(side_effect=lambda force_fetch: f"dsn-{force_fetch}")
+        connect = MagicMock(side_effect=[psycopg2.OperationalError(), create_connection()])
+        manager = ConnectionManager(get_dsn, connect)
+
+        manager.get_connection()
+
+        assert [call.args[0] for call in connect.call_args_list] == [
+            "dsn-False",
+            "dsn-True",
+        ]
+
+    def test_second_connect_failure_is_raised(self):
+        connect = MagicMock(side_effect=psycopg2.OperationalError())
+        manager = ConnectionManager(lambda force_fetch: "dsn", connect)
+
+        with pytest.raises(psycopg2.OperationalError):
+            manager.get_connection()
+
+        assert manager.connection is None
+
+    def test_connections_of_each_invocation_are_added_to_metrics(self, metrics):
+        manager = ConnectionManager(
+            lambda force_fetch: "dsn",
+            MagicMock(side_effect=lambda dsn: create_connection()),
+        )
+
+        manager.get_connection()
+        manager.put_metrics(metrics)
+        first = metrics.serialize_metric_set()
+        metrics.clear_metrics()
+
+        manager.get_connection()
+        manager.put_metrics(metrics)
+        second = metrics.serialize_metric_set()
+
+        assert first["ConnectionsOpened"] == [1.0]
+        assert first["ConnectionReuseRate"] == [0.0]
+        assert "ConnectTimeSeconds" in first
+        assert second["ConnectionsOpened"] == [0.0]
+        assert second["ConnectionReuseRate"] == [100.0]
+        assert second["ConnectTimeSeconds"] == [0.0]
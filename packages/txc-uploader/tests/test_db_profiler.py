@@ -0,0 +1,121 @@
+import os
+import sys
+from unittest.mock import MagicMock, call, patch
+
+from bulk_writer import insert_rows
+from db_profiler import (
+    ProfilingCursor,
+    StatementProfile,
+    get_statement_template,
+    open_cursor,
+)
+
+
+def check_txc_lines_exist():
+    return get_statement_template(sys._getframe())
+
+
+class RecordingCursor:
+    def execute(self, query, vars=None):
+        self.template = get_statement_template(sys._getframe(1))
+
+
+class TestStatementTemplate:
+    def test_statement_is_named_after_its_calling_function(self):
+        assert check_txc_lines_exist() == "check_txc_lines_exist"
+
+    def test_bulk_writer_helpers_are_skipped(self):
+        cursor = RecordingCursor()
+
+        insert_rows(cursor, "tracks_new", ("longitude",), [("-2.1",)])
+
+        assert (
+            cursor.template
+            == "TestStatementTemplate.test_bulk_writer_helpers_are_skipped"
+        )
+
+
+class TestStatementProfile:
+    def test_statements_are_grouped_by_template(self):
+        profile = StatementProfile()
+
+        profile.record("insert_into_txc_journey_pattern_table", 0.002, 3)
+        profile.record("insert_into_txc_journey_pattern_table", 0.004, 1)
+        profile.record("StopResolver.load", 0.010, 120)
+
+        assert profile.summary() == {
+            "statements": {
+                "StopResolver.load": {
+                    "calls": 1,
+                    "total_ms": 10.0,
+                    "max_ms": 10.0,
+                    "rows": 120,
+                },
+                "insert_into_txc_journey_pattern_table": {
+                    "calls": 2,
+                    "total_ms": 6.0,
+                    "max_ms": 4.0,
+                    "rows": 4,
+                },
+            },
+            "plans": {},
+        }
+
+    def test_no_plans_are_needed_without_a_threshold(self):
+        assert not StatementProfile().needs_plan("StopResolver.load", 10)
+
+    def test_one_plan_is_needed_per_slow_template(self):
+        profile = StatementProfile(explain_threshold_ms=50)
+
+        assert not profile.needs_plan("StopResolver.load", 0.049)
+        assert profile.needs_plan("StopResolver.load", 0.05)
+
+        profile.plans["StopResolver.load"] = "Seq Scan on stops_new"
+
+        assert not profile.needs_plan("StopResolver.load", 0.5)
+
+
+class TestExplain:
+    def test_savepoint_is_released_after_the_plan(self):
+        profiling_cursor = MagicMock()
+        cursor = profiling_cursor.connection.cursor.return_value.__enter__.return_value
+        cursor.mogrify.return_value = b"SELECT 1"
+        cursor.fetchall.return_value = [("Result",)]
+
+        plan = ProfilingCursor.explain(profiling_cursor, "SELECT %s", (1,))
+
+        assert plan == "Result"
+        assert cursor.execute.call_args_list == [
+            call("SAVEPOINT statement_profile"),
+            call(b"EXPLAIN (ANALYZE, BUFFERS) SELECT 1"),
+            call("ROLLBACK TO SAVEPOINT statement_profile"),
+            call("RELEASE SAVEPOINT statement_profile"),
+        ]
+
+
+class TestOpenCursor:
+    def test_plain_cursor_is_used_by_default(self):
+        db_connection = MagicMock()
+
+        with patch.dict(os.environ, {"TXC_DB_PROFILE": "false"}):
+            with open_cursor(db_connection, MagicMock(), "key") as cursor:
+                pass
+
+        db_connection.cursor.assert_called_once_with()
+        assert cursor is db_connection.cursor.return_value.__enter__.return_value
+
+    def test_profile_is_logged_once_per_file(self):
+        db_connection = MagicMock()
+        logger = MagicMock()
+
+        with patch.dict(
+            os.environ,
+            {"TXC_DB_PROFILE": "true", "TXC_DB_PROFILE_EXPLAIN_MS": "250"},
+        ):
+            with open_cursor(db_connection, logger, "key") as cursor:
+                cursor.profile.record("NocCache.load", 0.001, 5)
+
+        db_connection.cursor.assert_called_once_with(cursor_factory=ProfilingCursor)
+        assert cursor.profile.explain_threshold_ms == 250
+        logger.info.assert_called_once()
+        assert '"NocCache.load": {"calls": 1' in logger.info.call_args.args[0]
@@ -0,0 +1,102 @@
+import os
+import pstats
+import tracemalloc
+from unittest.mock import MagicMock, patch
+
+import pytest
+from file_profiler import get_profile_s3_uri, profile_file
+
+BUCKET = "test-profiles"
+
+
+def build_buffers():
+    return [bytearray(1000) for _ in range(1000)]
+
+
+class TestProfileSwitch:
+    def test_profiling_is_off_by_default(self):
+        with patch.dict(os.environ, {"TXC_PROFILE": "false"}):
+            assert get_profile_s3_uri({"Records": []}) is None
+
+    def test_event_field_switches_profiling_on(self):
+        with patch.dict(os.environ, {"TXC_PROFILE_S3_URI": "s3://bucket/env"}):
+            assert get_profile_s3_uri({"profile": True}) == "s3://bucket/env"
+            event = {"profile": True, "profileS3Uri": "s3://bucket/event"}
+            assert get_profile_s3_uri(event) == "s3://bucket/event"
+
+    def test_environment_switches_profiling_on(self):
+        with patch.dict(
+            os.environ,
+            {"TXC_PROFILE": "true", "TXC_PROFILE_S3_URI": "s3://bucket/profiles"},
+        ):
+            assert get_profile_s3_uri({}) == "s3://bucket/profiles"
+
+    def test_profiling_without_a_destination_is_rejected(self):
+        with patch.dict(os.environ, {"TXC_PROFILE": "true"}):
+            os.environ.pop("TXC_PROFILE_S3_URI", None)
+            with pytest.raises(ValueError):
+                get_profile_s3_uri({})
+
+
+class TestProfileFile:
+    def test_nothing_is_traced_when_switched_off(self):
+        s3 = MagicMock()
+
+        with profile_file(s3, None, "key", MagicMock()):
+            assert not tracemalloc.is_tracing()
+
+        s3.put_object.assert_not_called()
+
+    def test_profile_and_allocations_are_uploaded(self, s3, tmp_path):
+        s3.create_bucket(
+            Bucket=BUCKET,
+            CreateBucketConfiguration={"LocationConstraint": "eu-west-2"},
+        )
+
+        with profile_file(
+            s3, f"s3://{BUCKET}/profiles/", "20250213/bods/file.xml", MagicMock()
+        ):
+            buffers = build_buffers()
+        del buffers
+
+        assert not tracemalloc.is_tracing()
+        keys = [
+            item["Key"] for item in s3.list_objects_v2(Bucket=BUCKET)["Contents"]
+        ]
+        assert len(keys) == 2
+        assert all(key.startswith("profiles/20250213/bods/file.xml/") for key in keys)
+
+        pstats_key = next(key for key in keys if key.endswith(".pstats"))
+        pstats_path = tmp_path / "file.pstats"
+        s3.download_file(BUCKET, pstats_key, str(pstats_path))
+        stats = pstats.Stats(str(pstats_path))
+        assert any(function[2] == "build_buffers" for function in stats.stats)
+
+        allocations_key = next(key for key in keys if key.endswith(".allocations.txt"))
+        allocations = (
+            s3.get_object(Bucket=BUCKET, Key=allocations_key)["Body"].read().decode()
+        )
+        assert allocations.startswith("Peak traced memory: ")
+        assert "test_file_profiler.py" in allocations
+
+    def test_profile_is_uploaded_when_the_file_fails(self, s3):
+        s3.create_bucket(
+            Bucket=BUCKET,
+            CreateBucketConfiguration={"LocationConstraint": "eu-west-2"},
+        )
+
+        with pytest.raises(RuntimeError):
+            with profile_file(s3, f"s3://{BUCKET}", "key", MagicMock()):
+                raise RuntimeError("database unavailable")
+
+        assert s3.list_objects_v2(Bucket=BUCKET)["KeyCount"] == 2
+
+    def test_failed_upload_does_not_hide_the_result(self):
+        s3 = MagicMock()
+        s3.put_object.side_effect = Exception("access denied")
+        logger = MagicMock()
+
+        with profile_file(s3, "s3://bucket", "key", logger):
+            pass
+
+        logger.error.assert_called_once()
@@ -0,0 +1,59 @@
+from unittest.mock import MagicMock
+
+from noc_cache import NocCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def create_cursor(*results):
+    cursor = MagicMock()
+    cursor.fetchall.side_effect = list(results)
+    return cursor
+
+
+class TestNocCache:
+    def test_noc_codes_are_loaded_once_within_the_ttl(self):
+        clock = FakeClock()
+        cache = NocCache(ttl_seconds=300, clock=clock)
+        cursor = create_cursor([("ANWE",), ("TEST",)])
+
+        assert cache.get_noc_codes(cursor) == {"ANWE", "TEST"}
+        clock.now = 299
+        assert cache.get_noc_codes(cursor) == {"ANWE", "TEST"}
+
+        cursor.execute.assert_called_once_with("SELECT noc_code FROM operators_new")
+        assert cache.loads == 1
+
+    def test_noc_codes_are_reloaded_after_the_ttl(self):
+        clock = FakeClock()
+        cache = NocCache(ttl_seconds=300, clock=clock)
+        cursor = create_cursor([("ANWE",)], [("ANWE",), ("NEW",)])
+
+        cache.get_noc_codes(cursor)
+        clock.now = 300
+
+        assert cache.get_noc_codes(cursor) == {"ANWE", "NEW"}
+        assert cache.loads == 2
+
+    def test_empty_operators_table_is_cached(self):
+        cache = NocCache(clock=FakeClock())
+        cursor = create_cursor([])
+
+        assert cache.get_noc_codes(cursor) == frozenset()
+        assert cache.get_noc_codes(cursor) == frozenset()
+        assert cache.loads == 1
+
+    def test_cleared_cache_is_reloaded(self):
+        cache = NocCache(clock=FakeClock())
+        cursor = create_cursor([("ANWE",)], [("TEST",)])
+
+        cache.get_noc_codes(cursor)
+        cache.clear()
+
+        assert cache.get_noc_codes(cursor) == {"TEST"}
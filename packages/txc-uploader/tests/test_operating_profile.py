@@ -0,0 +1,182 @@
+import datetime
+import os
+from unittest.mock import patch
+
+import pytest
+from operating_profile import (
+    DAYS_OF_WEEK_MASKS,
+    DEFAULT_OPERATING_PROFILE,
+    get_bank_holiday_calendar,
+    get_compiled_operating_profile,
+    get_operating_calendar,
+    get_operating_calendar_horizon_days,
+    is_service_operational,
+    runs_on,
+)
+from tests.helpers.test_data import test_data
+
+service_operating_period = {"StartDate": "2018-01-28", "EndDate": "2099-12-31"}
+
+
+class TestCompiledOperatingProfile:
+    @pytest.mark.parametrize(
+        "days_of_week, operational_days",
+        [
+            ("MondayToFriday", [0, 1, 2, 3, 4]),
+            ("MondayToSaturday", [0, 1, 2, 3, 4, 5]),
+            ("Weekend", [5, 6]),
+            ("NotWednesday", [0, 1, 3, 4, 5, 6]),
+            ("Sunday", [6]),
+        ],
+    )
+    def test_days_of_week_are_compiled_to_bitmask(
+        self, days_of_week, operational_days
+    ):
+        profile = get_compiled_operating_profile(
+            test_data.generate_mock_operating_profile({days_of_week: None})
+        )
+        # 2025-05-05 is a Monday
+        week = [datetime.date(2025, 5, 5) + datetime.timedelta(days=i) for i in range(7)]
+
+        assert [
+            day.weekday() for day in week if profile.is_operational(day, {})
+        ] == operational_days
+        assert profile.days_of_week == DAYS_OF_WEEK_MASKS[days_of_week]
+
+    def test_equal_profiles_share_one_compiled_profile(self):
+        first = test_data.generate_mock_journey({"MondayToFriday": None})
+        second = test_data.generate_mock_journey({"MondayToFriday": None})
+
+        assert first["OperatingProfile"] is not second["OperatingProfile"]
+        assert get_compiled_operating_profile(
+            first["OperatingProfile"]
+        ) is get_compiled_operating_profile(second["OperatingProfile"])
+
+    def test_missing_profile_uses_default(self):
+        assert get_compiled_operating_profile(None) is DEFAULT_OPERATING_PROFILE
+
+    @pytest.mark.parametrize(
+        "date, expected_result",
+        [
+            (datetime.date(2025, 12, 24), True),
+            (datetime.date(2025, 12, 25), False),
+            (datetime.date(2025, 12, 27), True),
+            (datetime.date(2026, 1, 2), False),
+        ],
+    )
+    def test_special_days_are_evaluated_against_date_ranges(self, date, expected_result):
+        profile = get_compiled_operating_profile(
+            {
+                "RegularDayType": {"DaysOfWeek": {"MondayToFriday": None}},
+                "SpecialDaysOperation": {
+                    "DaysOfOperation": {
+                        "DateRange": {"StartDate": "2025-12-27", "EndDate": "2025-12-27"}
+                    },
+                    "DaysOfNonOperation": {
+                        "DateRange": [
+                            {"StartDate": "2025-12-25", "EndDate": "2025-12-26"},
+                            {"StartDate": "2026-01-01", "EndDate": "2026-01-02"},
+                        ]
+                    },
+                },
+            }
+        )
+
+        assert profile.is_operational(date, {}) == expected_result
+
+
+class TestBankHolidayCalendar:
+    def test_calendar_maps_dates_to_txc_names(self):
+        calendar = get_bank_holiday_calendar(
+            [
+                {"title": "Christmas Day", "date": "2025-12-25"},
+                {"title": "Unknown holiday", "date": "2025-12-25"},
+            ]
+        )
+
+        assert calendar == {datetime.date(2025, 12, 25): ["ChristmasDayHoliday", None]}
+
+    def test_calendar_is_reused_for_the_same_list(self):
+        bank_holidays = [{"title": "Boxing Day", "date": "2025-12-26"}]
+
+        assert get_bank_holiday_calendar(bank_holidays) is get_bank_holiday_calendar(
+            bank_holidays
+        )
+
+
+class TestIsServiceOperational:
+    def test_bank_holiday_operation_overrides_days_of_week(self):
+        vehicle_journey = test_data.generate_mock_journey_bank_holiday(
+            {"DaysOfOperation": {"AllBankHolidays": None}}
+        )
+
+        assert is_service_operational(
+            vehicle_journey,
+            [{"title": "Mock bank holiday", "date": "2025-05-10"}],
+            None,
+            service_operating_period,
+            datetime.date(2025, 5, 10),
+        )
+
+    def test_service_not_yet_started_is_not_operational(self):
+        assert not is_service_operational(
+            test_data.mock_journey_no_operating_profile,
+            [],
+            None,
+            {"StartDate": "2025-06-01"},
+            datetime.date(2025, 5, 8),
+        )
+
+
+class TestOperatingCalendar:
+    def test_calendar_matches_daily_evaluation(self):
+        vehicle_journey = test_data.generate_mock_journey({"MondayToFriday": None})
+        bank_holidays = [{"title": "Spring bank holiday", "date": "2025-05-26"}]
+        start_date = datetime.date(2025, 5, 8)
+
+        operating_calendar = get_operating_calendar(
+            vehicle_journey,
+            bank_holidays,
+            None,
+            service_operating_period,
+            start_date,
+            60,
+        )
+
+        for offset in range(61):
+            date = start_date + datetime.timedelta(days=offset)
+            assert runs_on(operating_calendar, start_date, date) == (
+                is_service_operational(
+                    vehicle_journey,
+                    bank_holidays,
+                    None,
+                    service_operating_period,
+                    date,
+                )
+            )
+
+    def test_calendar_stops_at_end_of_operating_period(self):
+        operating_calendar = get_operating_calendar(
+            test_data.mock_journey_no_operating_profile,
+            [],
+            None,
+            {"StartDate": "2025-01-01", "EndDate": "2025-05-09"},
+            datetime.date(2025, 5, 8),
+            5,
+        )
+
+        assert operating_calendar == 0b11
+
+    def test_dates_outside_calendar_do_not_run(self):
+        start_date = datetime.date(2025, 5, 8)
+
+        assert not runs_on(0b1, start_date, start_date - datetime.timedelta(days=1))
+        assert not runs_on(-1, start_date, start_date + datetime.timedelta(days=63))
+
+    def test_horizon_must_fit_in_bigint(self):
+        with patch.dict(os.environ, {"OPERATING_CALENDAR_HORIZON_DAYS": "63"}):
+            with pytest.raises(ValueError):
+                get_operating_calendar_horizon_days()
+
+        with patch.dict(os.environ, {"OPERATING_CALENDAR_HORIZON_DAYS": "30"}):
+            assert get_operating_calendar_horizon_days() == 30
@@ -0,0 +1,52 @@
+import os
+
+import pytest
+from s3_reader import S3RangeReader, open_s3_object
+from txc_parser import parse_txc
+
+test_data_dir = os.path.dirname(os.path.realpath(__file__)) + "/helpers/test_data"
+bucket = "test-bucket"
+
+
+@pytest.fixture
+def s3_bucket(s3):
+    s3.create_bucket(
+        Bucket=bucket,
+        CreateBucketConfiguration={"LocationConstraint": "eu-west-2"},
+    )
+    return s3
+
+
+class TestS3RangeReader:
+    @pytest.mark.parametrize("part_size", [100, 1024, 10_000_000])
+    def test_bytes_are_returned_in_order(self, s3_bucket, part_size):
+        body = bytes(range(256)) * 40
+        s3_bucket.put_object(Bucket=bucket, Key="object", Body=body)
+
+        with open_s3_object(
+            s3_bucket, bucket, "object", len(body), part_size=part_size
+        ) as reader:
+            assert reader.read() == body
+
+    def test_ranges_cover_the_object(self, s3_bucket):
+        reader = S3RangeReader(s3_bucket, bucket, "missing", 10, part_size=4)
+
+        assert reader.ranges == [(0, 3), (4, 7), (8, 9)]
+        reader.close()
+
+    def test_empty_object_reads_nothing(self, s3_bucket):
+        s3_bucket.put_object(Bucket=bucket, Key="empty", Body=b"")
+
+        with open_s3_object(s3_bucket, bucket, "empty", 0) as reader:
+            assert reader.read() == b""
+
+    def test_parser_reads_from_ranged_download(self, s3_bucket):
+        file_path = f"{test_data_dir}/mock_txc.xml"
+        with open(file_path, "rb") as file:
+            body = file.read()
+        s3_bucket.put_object(Bucket=bucket, Key="mock_txc.xml", Body=body)
+
+        with open_s3_object(
+            s3_bucket, bucket, "mock_txc.xml", len(body), part_size=4096
+        ) as reader:
+            assert parse_txc(reader) == parse_txc(file_path)
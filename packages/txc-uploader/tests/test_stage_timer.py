@@ -0,0 +1,84 @@
+from stage_timer import StageTimer
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestStageTimer:
+    def test_spans_of_a_stage_add_up(self):
+        clock = FakeClock()
+        timer = StageTimer(clock)
+
+        for seconds in (1.5, 2.0):
+            with timer.span("VehicleJourneys"):
+                clock.now += seconds
+            timer.count("VehicleJourneys", rows=10)
+
+        assert timer.summary() == {
+            "total_seconds": 3.5,
+            "stages": {
+                "VehicleJourneys": {
+                    "seconds": 3.5,
+                    "spans": 2,
+                    "rows": 20,
+                    "bytes": 0,
+                }
+            },
+        }
+
+    def test_span_is_recorded_when_the_stage_fails(self):
+        clock = FakeClock()
+        timer = StageTimer(clock)
+
+        try:
+            with timer.span("Commit"):
+                clock.now += 0.25
+                raise RuntimeError("connection lost")
+        except RuntimeError:
+            pass
+
+        assert timer.summary()["stages"]["Commit"]["seconds"] == 0.25
+
+    def test_nested_spans_are_both_recorded(self):
+        clock = FakeClock()
+        timer = StageTimer(clock)
+
+        with timer.span("ServiceLoop"):
+            clock.now += 1
+            with timer.span("Tracks"):
+                clock.now += 2
+
+        stages = timer.summary()["stages"]
+        assert stages["ServiceLoop"]["seconds"] == 3
+        assert stages["Tracks"]["seconds"] == 2
+
+    def test_stages_are_added_to_metrics(self, metrics):
+        clock = FakeClock()
+        timer = StageTimer(clock)
+
+        with timer.span("Download"):
+            clock.now += 0.5
+        timer.count("Download", bytes=2048)
+        with timer.span("Commit"):
+            clock.now += 0.1
+
+        timer.put_metrics(metrics)
+        emitted = metrics.serialize_metric_set()
+
+        assert emitted["DownloadSeconds"] == [0.5]
+        assert emitted["DownloadBytes"] == [2048.0]
+        assert "DownloadRows" not in emitted
+        assert "CommitSeconds" in emitted
+        assert {
+            metric["Name"]: metric["Unit"]
+            for metric in emitted["_aws"]["CloudWatchMetrics"][0]["Metrics"]
+        } == {
+            "DownloadSeconds": "Seconds",
+            "DownloadBytes": "Bytes",
+            "CommitSeconds": "Seconds",
+        }
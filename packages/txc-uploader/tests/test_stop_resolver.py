@@ -0,0 +1,53 @@
+from unittest.mock import MagicMock
+
+from stop_resolver import StopResolver
+from tests.helpers import test_xml_helpers
+from txc_document import TxcDocument
+
+mock_data_dict = test_xml_helpers.generate_mock_data_dict()
+
+
+class TestStopResolver:
+    def test_stops_are_fetched_in_one_query(self):
+        cursor = MagicMock()
+        cursor.fetchall.return_value = [
+            ("0600MA6152", "070", "-2.1", "53.2"),
+            ("0600MA6001", "070", "-2.2", "53.3"),
+        ]
+
+        resolver = StopResolver.load(cursor, {"0600MA6152", "0600MA6001"})
+
+        cursor.execute.assert_called_once()
+        assert sorted(cursor.execute.call_args.args[1][0]) == [
+            "0600MA6001",
+            "0600MA6152",
+        ]
+        assert resolver.get_stop_location("0600MA6001") == ("-2.2", "53.3")
+
+    def test_no_query_is_sent_without_stops(self):
+        cursor = MagicMock()
+
+        StopResolver.load(cursor, set())
+
+        cursor.execute.assert_not_called()
+
+    def test_admin_area_codes_are_combined_across_stops(self):
+        resolver = StopResolver(
+            [
+                ("A", "070", "-2.1", "53.2"),
+                ("A", "071", "-2.1", "53.2"),
+                ("B", "072", "-2.2", "53.3"),
+                ("C", None, "-2.3", "53.4"),
+            ]
+        )
+
+        assert resolver.get_admin_area_codes({"A", "C", "unknown"}) == {"070", "071"}
+        assert resolver.get_stop_location("C") == ("-2.3", "53.4")
+        assert resolver.get_stop_location("unknown") is None
+
+    def test_document_stop_codes_cover_every_timing_link(self):
+        stop_codes = TxcDocument(mock_data_dict).stop_codes
+
+        assert "0600MA6152" in stop_codes
+        assert "0600MA6001" in stop_codes
+        assert all(stop_code.startswith("0600") for stop_code in stop_codes)
@@ -0,0 +1,63 @@
+from unittest.mock import MagicMock
+
+from track_geometries import TrackGeometryCache, get_geometry_hash
+
+
+def create_cursor(*table_oids):
+    cursor = MagicMock()
+    cursor.fetchone.side_effect = [(table_oid,) for table_oid in table_oids]
+    return cursor
+
+
+class TestTrackGeometryCache:
+    def test_identical_polylines_share_a_hash(self):
+        assert get_geometry_hash("_p~iF~ps|U") == get_geometry_hash("_p~iF~ps|U")
+        assert get_geometry_hash("_p~iF~ps|U") != get_geometry_hash("_p~iF~ps|V")
+
+    def test_hashes_are_remembered_once_the_file_commits(self):
+        cache = TrackGeometryCache()
+        cursor = create_cursor(1, 1)
+
+        cache.start_file(cursor)
+        cache.add("abc")
+        assert cache.contains("abc")
+        cache.commit()
+
+        cache.start_file(cursor)
+        assert cache.contains("abc")
+        cursor.execute.assert_called_with(
+            "SELECT to_regclass('track_geometries_new')::oid"
+        )
+
+    def test_hashes_of_a_rolled_back_file_are_forgotten(self):
+        cache = TrackGeometryCache()
+        cursor = create_cursor(1, 1)
+
+        cache.start_file(cursor)
+        cache.add("abc")
+
+        cache.start_file(cursor)
+        assert not cache.contains("abc")
+
+    def test_hashes_are_forgotten_when_a_new_load_recreates_the_table(self):
+        cache = TrackGeometryCache()
+        cursor = create_cursor(1, 2)
+
+        cache.start_file(cursor)
+        cache.add("abc")
+        cache.commit()
+
+        cache.start_file(cursor)
+        assert not cache.contains("abc")
+
+    def test_clear_forgets_the_load(self):
+        cache = TrackGeometryCache()
+        cursor = create_cursor(1, 1)
+
+        cache.start_file(cursor)
+        cache.add("abc")
+        cache.commit()
+        cache.clear()
+
+        cache.start_file(cursor)
+        assert not cache.contains("abc")
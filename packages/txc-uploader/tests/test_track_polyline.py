@@ -0,0 +1,41 @@
+from track_polyline import decode_polyline, encode_polyline
+from txc_records import TrackPoint
+
+
+class TestPolyline:
+    def test_reference_polyline_is_encoded_at_five_decimal_places(self):
+        tracks = [
+            TrackPoint("-120.2", "38.5"),
+            TrackPoint("-120.95", "40.7"),
+            TrackPoint("-126.453", "43.252"),
+        ]
+
+        assert encode_polyline(tracks, 5) == ("_p~iF~ps|U_ulLnnqC_mqNvxq`@", 3)
+
+    def test_tracks_round_trip_to_six_decimal_places(self):
+        tracks = [
+            TrackPoint("-2.464747836", "53.768564459"),
+            TrackPoint("-2.464582725", "53.768709451"),
+            TrackPoint("-2.464477424", "53.768790752"),
+        ]
+
+        polyline, point_count = encode_polyline(tracks)
+
+        assert point_count == 3
+        assert decode_polyline(polyline) == [
+            (-2.464748, 53.768564),
+            (-2.464583, 53.768709),
+            (-2.464477, 53.768791),
+        ]
+
+    def test_points_without_numeric_coordinates_are_left_out(self):
+        tracks = [TrackPoint("-2.1", "53.1"), TrackPoint("", "53.2"), TrackPoint("-2.3", "53.3")]
+
+        polyline, point_count = encode_polyline(tracks)
+
+        assert point_count == 2
+        assert decode_polyline(polyline) == [(-2.1, 53.1), (-2.3, 53.3)]
+
+    def test_empty_track_encodes_to_an_empty_polyline(self):
+        assert encode_polyline([]) == ("", 0)
+        assert decode_polyline("") == []
@@ -0,0 +1,64 @@
+import os
+from unittest.mock import patch
+
+import pytest
+from track_simplifier import (
+    METRES_PER_DEGREE,
+    get_track_simplify_tolerance_metres,
+    simplify_track,
+)
+from txc_records import TrackPoint
+
+# Close to 1 metre of latitude
+METRE = 1 / METRES_PER_DEGREE
+
+
+def track(*offsets_metres):
+    return [
+        TrackPoint(f"{-2.0 + east * METRE / 0.6:.9f}", f"{53.0 + north * METRE:.9f}")
+        for east, north in offsets_metres
+    ]
+
+
+class TestSimplifyTrack:
+    def test_points_on_a_straight_line_are_dropped(self):
+        points = track(*[(0, north) for north in range(0, 100, 5)])
+
+        assert simplify_track(points, 1) == [points[0], points[-1]]
+
+    def test_corners_beyond_the_tolerance_are_kept(self):
+        points = track((0, 0), (0, 50), (0, 100), (50, 100), (100, 100))
+
+        assert simplify_track(points, 1) == [points[0], points[2], points[4]]
+
+    def test_deviations_within_the_tolerance_are_dropped(self):
+        points = track((0, 0), (2, 50), (0, 100))
+
+        assert simplify_track(points, 5) == [points[0], points[2]]
+        assert simplify_track(points, 1) == points
+
+    def test_routes_ending_where_they_began_keep_their_far_side(self):
+        points = track((0, 0), (0, 100), (100, 100), (100, 0), (0, 0))
+
+        assert simplify_track(points, 1) == points
+
+    def test_zero_tolerance_keeps_every_point(self):
+        points = track((0, 0), (0, 1), (0, 2))
+
+        assert simplify_track(points, 0) is points
+
+    def test_non_numeric_coordinates_are_left_alone(self):
+        points = [TrackPoint("-2.0", "53.0"), TrackPoint("x", "y"), TrackPoint("-2.1", "53.1")]
+
+        assert simplify_track(points, 10) is points
+
+
+class TestToleranceSetting:
+    def test_simplification_is_off_by_default(self):
+        with patch.dict(os.environ, {}, clear=True):
+            assert get_track_simplify_tolerance_metres() == 0
+
+    def test_negative_tolerance_is_rejected(self):
+        with patch.dict(os.environ, {"TXC_TRACK_SIMPLIFY_TOLERANCE_METRES": "-1"}):
+            with pytest.raises(ValueError):
+                get_track_simplify_tolerance_metres()
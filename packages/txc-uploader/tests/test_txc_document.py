@@ -0,0 +1,94 @@
+from tests.helpers import test_xml_helpers
+from txc_document import TxcDocument, index_by, partition_vehicle_journeys_by_line
+
+mock_data_dict = test_xml_helpers.generate_mock_data_dict()
+mock_tracks_data_dict = test_xml_helpers.generate_mock_txc_tracks_data_dict()
+
+
+class TestIndexBy:
+    def test_first_item_with_duplicate_key_is_kept(self):
+        items = [{"@id": "A", "value": 1}, {"@id": "A", "value": 2}, {"@id": "B"}]
+
+        assert index_by(items, "@id") == {
+            "A": {"@id": "A", "value": 1},
+            "B": {"@id": "B"},
+        }
+
+    def test_items_without_key_are_skipped(self):
+        assert index_by([{"name": "A"}, None], "@id") == {}
+
+
+class TestPartitionVehicleJourneysByLine:
+    def test_journeys_are_bucketed_by_line_ref(self):
+        journeys = [
+            {"VehicleJourneyCode": "1", "LineRef": "L1", "JourneyPatternRef": "JP1"},
+            {"VehicleJourneyCode": "2", "LineRef": "L2", "JourneyPatternRef": "JP2"},
+            {"VehicleJourneyCode": "3", "LineRef": "L1", "JourneyPatternRef": "JP3"},
+            {"VehicleJourneyCode": "4", "LineRef": "L1"},
+        ]
+
+        partition = partition_vehicle_journeys_by_line(journeys)
+
+        assert partition == {"L1": [journeys[0], journeys[2]], "L2": [journeys[1]]}
+
+    def test_journeys_are_inherited_through_vehicle_journey_ref(self):
+        journeys = [
+            {"VehicleJourneyCode": "1", "LineRef": "L1", "JourneyPatternRef": "JP1"},
+            {"VehicleJourneyCode": "2", "LineRef": "L2", "VehicleJourneyRef": "1"},
+            {"VehicleJourneyCode": "3", "LineRef": "L1", "VehicleJourneyRef": "1"},
+            {"VehicleJourneyCode": "4", "LineRef": "L3", "VehicleJourneyRef": "9"},
+        ]
+
+        partition = partition_vehicle_journeys_by_line(journeys)
+
+        assert partition == {"L1": [journeys[0]], "L2": [journeys[0]]}
+
+    def test_partition_is_built_once_per_document(self):
+        document = TxcDocument(mock_data_dict)
+
+        assert document.vehicle_journeys_by_line is document.vehicle_journeys_by_line
+        assert [
+            journey["VehicleJourneyCode"]
+            for journey in document.vehicle_journeys_by_line["l_4_ANW"]
+        ] == ["J42", "J1", "J2", "J3", "J15"]
+
+
+class TestTxcDocument:
+    def test_elements_are_indexed_by_id(self):
+        document = TxcDocument(mock_tracks_data_dict)
+
+        assert document.routes_by_id["RT1"]["@id"] == "RT1"
+        assert document.route_sections_by_id["RS1"]["@id"] == "RS1"
+        assert "RL1" in document.route_links_by_section_id["RS1"]
+        assert "RL1" not in document.route_links_by_section_id["RS2"]
+
+    def test_vehicle_journeys_are_counted(self):
+        document = TxcDocument(mock_data_dict)
+
+        assert document.vehicle_journey_count == len(document.vehicle_journeys)
+        assert document.has_vehicle_journeys
+
+    def test_missing_sections_produce_empty_indexes(self):
+        document = TxcDocument({"TransXChange": {}})
+
+        assert document.journey_pattern_sections_by_id == {}
+        assert document.routes_by_id == {}
+        assert document.vehicle_journeys == []
+        assert document.get_operators() == []
+        assert document.get_route_section_refs("RT1") is None
+
+    def test_unknown_section_refs_are_ignored(self):
+        document = TxcDocument(mock_data_dict)
+
+        assert document.process_journey_pattern_sections(["missing"]) == []
+
+    def test_journey_patterns_are_transformed_once_per_service(self):
+        document = TxcDocument(mock_data_dict)
+        service = document.services[0]
+
+        first = document.collect_journey_patterns(service)
+        second = document.collect_journey_patterns(service)
+
+        assert first is second
+        assert first == document.transform_journey_patterns(service)
+        assert document.journey_pattern_stats == {"transforms": 1, "reused": 1}
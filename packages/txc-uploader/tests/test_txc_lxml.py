@@ -0,0 +1,111 @@
+import datetime
+import os
+
+import pytest
+from lxml import etree
+from txc_document import TxcDocument
+from txc_lxml import element_to_dict, extract_txc
+from txc_parser import parse_txc
+from txc_processor import collect_vehicle_journey
+
+test_data_dir = os.path.dirname(os.path.realpath(__file__)) + "/helpers/test_data"
+
+mock_files = [
+    "mock_txc.xml",
+    "mock_txc_invalid.xml",
+    "mock_ferry_txc.xml",
+    "mock_txc_tracks.xml",
+]
+
+
+def load_documents(file_name):
+    file_path = f"{test_data_dir}/{file_name}"
+    return TxcDocument(parse_txc(file_path)), TxcDocument(extract_txc(file_path))
+
+
+class TestElementToDict:
+    @pytest.mark.parametrize(
+        "xml, expected",
+        [
+            ("<a/>", None),
+            ("<a> text </a>", "text"),
+            ('<a id="1"/>', {"@id": "1"}),
+            ('<a id="1">text</a>', {"@id": "1", "#text": "text"}),
+            ("<a><b>1</b><b>2</b><c/></a>", {"b": ["1", "2"], "c": None}),
+        ],
+    )
+    def test_values_match_xmltodict(self, xml, expected):
+        assert element_to_dict(etree.fromstring(xml)) == expected
+
+
+@pytest.mark.parametrize("file_name", mock_files)
+class TestExtractTxcMatchesDictPath:
+    def test_operators_and_services(self, file_name):
+        document, lxml_document = load_documents(file_name)
+
+        assert lxml_document.get_operators() == document.get_operators()
+        assert lxml_document.services == document.services
+
+    def test_journey_patterns(self, file_name):
+        document, lxml_document = load_documents(file_name)
+
+        assert lxml_document.stop_codes == document.stop_codes
+        for service in document.services:
+            if "JourneyPattern" in service["StandardService"]:
+                assert lxml_document.collect_journey_patterns(
+                    service
+                ) == document.collect_journey_patterns(service)
+
+    def test_routes_and_tracks(self, file_name):
+        document, lxml_document = load_documents(file_name)
+
+        for route_ref in document.routes_by_id:
+            assert lxml_document.get_route_section_refs(
+                route_ref
+            ) == document.get_route_section_refs(route_ref)
+
+        for section_ref, route_links in document.route_links_by_section_id.items():
+            assert lxml_document.collect_track_data(
+                [section_ref], list(route_links)
+            ) == document.collect_track_data([section_ref], list(route_links))
+
+    def test_vehicle_journeys(self, file_name):
+        document, lxml_document = load_documents(file_name)
+        service = document.services[0]
+        today = datetime.date(2025, 5, 8)
+
+        def collect(vehicle_journeys):
+            return [
+                collect_vehicle_journey(
+                    vehicle_journey,
+                    [],
+                    service.get("OperatingProfile"),
+                    service.get("OperatingPeriod"),
+                    today,
+                    60,
+                )
+                for vehicle_journey in vehicle_journeys
+            ]
+
+        assert collect(lxml_document.vehicle_journeys) == collect(
+            document.vehicle_journeys
+        )
+        assert (
+            lxml_document.vehicle_journeys_by_line.keys()
+            == document.vehicle_journeys_by_line.keys()
+        )
+
+
+class TestSharedOperatingProfiles:
+    def test_identical_profiles_are_converted_once(self):
+        vehicle_journeys = TxcDocument(
+            extract_txc(f"{test_data_dir}/mock_txc.xml")
+        ).vehicle_journeys
+
+        assert vehicle_journeys[0]["OperatingProfile"] == vehicle_journeys[1][
+            "OperatingProfile"
+        ]
+        assert (
+            vehicle_journeys[0]["OperatingProfile"]
+            is vehicle_journeys[1]["OperatingProfile"]
+        )
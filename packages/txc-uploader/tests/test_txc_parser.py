@@ -0,0 +1,114 @@
+import io
+import os
+import xml.etree.ElementTree as eT
+
+import pytest
+import xmltodict
+from txc_document import TxcDocument
+from unittest.mock import patch
+
+from txc_parser import (
+    TXC_NAMESPACES,
+    get_txc_parser_engine,
+    parse_txc,
+    parse_txc_for_streaming,
+)
+
+test_data_dir = os.path.dirname(os.path.realpath(__file__)) + "/helpers/test_data"
+
+mock_files = [
+    "mock_txc.xml",
+    "mock_txc_invalid.xml",
+    "mock_ferry_txc.xml",
+    "mock_txc_tracks.xml",
+]
+
+
+def parse_with_element_tree_round_trip(file_path):
+    tree = eT.parse(file_path)
+    xml_string = eT.tostring(tree.getroot(), encoding="utf-8", method="xml")
+    return xmltodict.parse(
+        xml_string, process_namespaces=True, namespaces=TXC_NAMESPACES
+    )
+
+
+def without_namespace_declarations(data_dict):
+    # ElementTree renames namespace prefixes when re-serialising, so the
+    # collected xmlns declarations are the only part expected to differ
+    root = dict(data_dict["TransXChange"])
+    root.pop("@xmlns", None)
+    return {"TransXChange": root}
+
+
+class TestParseTxc:
+    @pytest.mark.parametrize("file_name", mock_files)
+    def test_output_matches_element_tree_round_trip(self, file_name):
+        file_path = f"{test_data_dir}/{file_name}"
+
+        assert without_namespace_declarations(
+            parse_txc(file_path)
+        ) == without_namespace_declarations(
+            parse_with_element_tree_round_trip(file_path)
+        )
+
+    def test_accepts_bytes_and_streams(self):
+        file_path = f"{test_data_dir}/mock_txc.xml"
+        with open(file_path, "rb") as file:
+            contents = file.read()
+
+        expected = parse_txc(file_path)
+
+        assert parse_txc(contents) == expected
+        assert parse_txc(io.BytesIO(contents)) == expected
+
+    def test_namespace_is_stripped_from_element_names(self):
+        data_dict = parse_txc(f"{test_data_dir}/mock_txc.xml")
+
+        assert "Services" in data_dict["TransXChange"]
+        assert "Service" in data_dict["TransXChange"]["Services"]
+
+
+class TestParseTxcForStreaming:
+    def test_reference_sections_match_full_parse(self):
+        file_path = f"{test_data_dir}/mock_txc.xml"
+        document = TxcDocument(parse_txc(file_path))
+
+        data_dict, vehicle_journey_stream = parse_txc_for_streaming(file_path)
+        streamed_document = TxcDocument(data_dict, vehicle_journey_stream.count)
+
+        assert streamed_document.services == document.services
+        assert streamed_document.get_operators() == document.get_operators()
+        assert (
+            streamed_document.journey_pattern_sections_by_id
+            == document.journey_pattern_sections_by_id
+        )
+        assert streamed_document.vehicle_journey_count == len(
+            document.vehicle_journeys
+        )
+
+    def test_only_journeys_without_journey_pattern_are_kept(self):
+        data_dict, _ = parse_txc_for_streaming(f"{test_data_dir}/mock_txc.xml")
+        vehicle_journeys = TxcDocument(data_dict).vehicle_journeys
+
+        assert vehicle_journeys
+        assert not any("JourneyPatternRef" in journey for journey in vehicle_journeys)
+
+    def test_stream_yields_every_vehicle_journey_in_order(self):
+        file_path = f"{test_data_dir}/mock_txc.xml"
+        _, vehicle_journey_stream = parse_txc_for_streaming(file_path)
+        streamed = []
+
+        vehicle_journey_stream.for_each(streamed.append)
+
+        assert streamed == TxcDocument(parse_txc(file_path)).vehicle_journeys
+
+
+class TestTxcParserEngine:
+    def test_defaults_to_xmltodict(self):
+        with patch.dict(os.environ, {}, clear=True):
+            assert get_txc_parser_engine() == "xmltodict"
+
+    def test_unknown_engine_is_rejected(self):
+        with patch.dict(os.environ, {"TXC_PARSER_ENGINE": "sax"}):
+            with pytest.raises(ValueError):
+                get_txc_parser_engine()
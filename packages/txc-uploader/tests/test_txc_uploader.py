@@ -1,28 +1,42 @@
 import datetime
 import os
-from unittest.mock import MagicMock, patch
+from unittest.mock import ANY, MagicMock, call, patch
 
 import boto3
 import pytest
 from psycopg2.extensions import cursor
 from tests.helpers import test_xml_helpers
 from tests.helpers.test_data import test_data
+from operating_profile import calculate_days_of_operation, is_service_operational
+from stage_timer import StageTimer
 from txc_processor import (
-    calculate_days_of_operation,
+    add_data_source_dimension,
     check_file_has_usable_data,
     collect_journey_pattern_section_refs_and_info,
-    collect_journey_patterns,
-    collect_track_data,
     collect_vehicle_journey,
     create_unique_line_id,
     download_from_s3_and_write_to_db,
     extract_data_for_txc_operator_service_table,
     format_vehicle_journeys,
-    is_service_operational,
+    insert_into_txc_journey_pattern_table,
+    collect_service_track,
+    insert_into_txc_tracks_table,
+    insert_into_txc_vehicle_journey_table,
+    insert_streamed_vehicle_journeys,
     iterate_through_journey_patterns_and_run_insert_queries,
     make_list,
-    select_route_and_run_insert_query,
+    put_metric_data,
+    reserve_journey_pattern_ids,
+    resolve_operator_service_ids,
+    select_route_and_collect_track,
+    write_to_database,
+    write_txc_file_to_db,
 )
+from txc_document import TxcDocument
+from txc_parser import parse_txc_for_streaming
+from track_geometries import TrackGeometryCache
+from track_polyline import decode_polyline
+from txc_records import TrackPoint
 
 logger = MagicMock()
 mock_data_dict = test_xml_helpers.generate_mock_data_dict()
@@ -38,21 +52,21 @@ class TestLineIdGeneration:
 
 class TestNonBusFileHasUsableData:
     def test_non_bus_file_with_valid_data_is_usable(self):
-        data = mock_non_bus_dict
+        document = TxcDocument(mock_non_bus_dict)
         service = mock_non_bus_dict["TransXChange"]["Services"]["Service"]
-        assert check_file_has_usable_data(data, service) == True
+        assert check_file_has_usable_data(document, service) == True
 
 
 class TestFileHasUsableData:
     def test_file_with_valid_data_is_usable(self):
-        data = mock_data_dict
+        document = TxcDocument(mock_data_dict)
         service = mock_data_dict["TransXChange"]["Services"]["Service"]
-        assert check_file_has_usable_data(data, service) == True
+        assert check_file_has_usable_data(document, service) == True
 
     def test_file_with_invalid_data_is_not_usable(self):
-        data = mock_invalid_data_dict
+        document = TxcDocument(mock_invalid_data_dict)
         service = mock_invalid_data_dict["TransXChange"]["Services"]["Service"]
-        assert check_file_has_usable_data(data, service) == False
+        assert check_file_has_usable_data(document, service) == False
 
 
 class TestCalculateDaysOfOperation:
@@ -236,35 +250,129 @@ class TestJourneyIsOperational:
 
 
 class TestDatabaseInsertQuerying:
+    @patch("txc_processor.reserve_journey_pattern_ids")
     @patch("txc_processor.insert_into_txc_journey_pattern_table")
     @patch("txc_processor.insert_into_txc_journey_pattern_link_table")
-    def test_insert_methods_are_called_correct_number_of_times(
-        self, mock_jp_insert, mock_jpl_insert
+    def test_journey_patterns_and_links_are_written_in_one_pass(
+        self, mock_jpl_insert, mock_jp_insert, mock_reserve_ids
     ):
         service = mock_data_dict["TransXChange"]["Services"]["Service"]
-        mock_journey_patterns = collect_journey_patterns(mock_data_dict, service)
+        document = TxcDocument(mock_data_dict)
+        mock_journey_patterns = document.collect_journey_patterns(service)
         vehicle_journeys, _ = format_vehicle_journeys(
             mock_data_dict["TransXChange"]["VehicleJourneys"]["VehicleJourney"],
             "l_4_ANW",
             [],
             service,
         )
-        mock_jp_insert.side_effect = [9, 27, 13, 1, 11, 5, 28, 12, 10, 6, 13, 27, 4]
+        journey_pattern_ids = list(range(100, 100 + len(mock_journey_patterns)))
+        mock_reserve_ids.return_value = journey_pattern_ids
+        mock_jp_insert.return_value = set(journey_pattern_ids)
         mock_cursor = MagicMock()
         mock_op_service_id = 12
 
         iterate_through_journey_patterns_and_run_insert_queries(
             mock_cursor,
-            mock_data_dict,
+            document,
             mock_op_service_id,
             service,
-            vehicle_journeys,
+            {
+                vehicle_journey.journey_pattern_ref
+                for vehicle_journey in vehicle_journeys
+            },
             "JP4",
             logger,
         )
 
-        assert mock_jp_insert.call_count == len(mock_journey_patterns)
-        assert mock_jpl_insert.call_count == len(mock_journey_patterns)
+        mock_reserve_ids.assert_called_once_with(
+            mock_cursor, len(mock_journey_patterns)
+        )
+        assert mock_jp_insert.call_count == 1
+        journey_pattern_rows = mock_jp_insert.call_args.args[1]
+        assert [row[0] for row in journey_pattern_rows] == journey_pattern_ids
+        assert {row[1] for row in journey_pattern_rows} == {mock_op_service_id}
+
+        assert mock_jpl_insert.call_count == 1
+        link_rows = mock_jpl_insert.call_args.args[1]
+        assert {row[0] for row in link_rows} == set(journey_pattern_ids)
+        assert len(link_rows) == sum(
+            len(journey_pattern_section)
+            for journey_pattern in mock_journey_patterns
+            for journey_pattern_section in journey_pattern["journey_pattern_sections"]
+        )
+
+    @patch("txc_processor.reserve_journey_pattern_ids")
+    @patch("txc_processor.insert_into_txc_journey_pattern_table")
+    @patch("txc_processor.insert_into_txc_journey_pattern_link_table")
+    def test_links_are_skipped_for_existing_journey_patterns(
+        self, mock_jpl_insert, mock_jp_insert, mock_reserve_ids
+    ):
+        service = mock_data_dict["TransXChange"]["Services"]["Service"]
+        document = TxcDocument(mock_data_dict)
+        mock_journey_patterns = document.collect_journey_patterns(service)
+        journey_pattern_refs = {
+            journey_pattern["journey_pattern_info"]["journey_pattern_ref"]
+            for journey_pattern in mock_journey_patterns
+        }
+        journey_pattern_ids = list(range(1, len(mock_journey_patterns) + 1))
+        mock_reserve_ids.return_value = journey_pattern_ids
+        mock_jp_insert.return_value = {1}
+
+        iterate_through_journey_patterns_and_run_insert_queries(
+            MagicMock(),
+            document,
+            12,
+            service,
+            journey_pattern_refs,
+            None,
+            logger,
+        )
+
+        link_rows = mock_jpl_insert.call_args.args[1]
+        assert {row[0] for row in link_rows} == {1}
+        assert [row[-1] for row in link_rows] == list(
+            range(
+                sum(
+                    len(journey_pattern_section)
+                    for journey_pattern_section in mock_journey_patterns[0][
+                        "journey_pattern_sections"
+                    ]
+                )
+            )
+        )
+
+    def test_journey_pattern_ids_are_reserved_in_one_query(self):
+        cursor = MagicMock()
+        cursor.fetchall.return_value = [(7,), (8,), (9,)]
+
+        assert reserve_journey_pattern_ids(cursor, 3) == [7, 8, 9]
+        cursor.execute.assert_called_once_with(
+            "SELECT nextval(pg_get_serial_sequence('service_journey_patterns_new', 'id')) FROM generate_series(1, %(count)s)",
+            {"count": 3},
+        )
+
+    def test_no_ids_are_reserved_without_journey_patterns(self):
+        cursor = MagicMock()
+
+        assert reserve_journey_pattern_ids(cursor, 0) == []
+        cursor.execute.assert_not_called()
+
+    def test_journey_patterns_are_inserted_with_their_reserved_ids(self):
+        cursor = MagicMock()
+        cursor.fetchall.return_value = [(7,)]
+        rows = [
+            (7, 12, "Upton", "outbound", "RT1", "JP1", "JPS1"),
+            (8, 12, "Upton", "outbound", "RT1", "JP2", "JPS1"),
+        ]
+
+        assert insert_into_txc_journey_pattern_table(cursor, rows) == {7}
+        query, values = cursor.execute.call_args.args
+        assert query == (
+            "INSERT INTO service_journey_patterns_new (id, operator_service_id, destination_display, direction, route_ref, journey_pattern_ref, section_refs) "
+            "VALUES (%s, %s, %s, %s, %s, %s, %s), (%s, %s, %s, %s, %s, %s, %s) "
+            "ON CONFLICT DO NOTHING RETURNING id"
+        )
+        assert values == [value for row in rows for value in row]
 
 
 class TestDataCollectionFunctionality:
@@ -326,7 +434,7 @@ class TestDataCollectionFunctionality:
     def test_collect_journey_patterns(self):
         service = mock_data_dict["TransXChange"]["Services"]["Service"]
         assert (
-            collect_journey_patterns(mock_data_dict, service)
+            TxcDocument(mock_data_dict).collect_journey_patterns(service)
             == test_data.expected_list_of_journey_patterns
         )
 
@@ -343,15 +451,20 @@ class TestDataCollectionFunctionality:
                 [],
                 mock_service_operating_profile,
                 mock_service_operating_period,
+                datetime.date(2025, 5, 8),
+                6,
             )
             == test_data.expected_vehicle_journey
         )
 
+    @patch("txc_processor.reserve_journey_pattern_ids")
     @patch("txc_processor.insert_into_txc_journey_pattern_table")
     @patch("txc_processor.insert_into_txc_journey_pattern_link_table")
     def test_correct_route_ref_and_links_selected_for_journey_pattern(
-        self, mock_jp_insert, mock_jpl_insert
+        self, mock_jpl_insert, mock_jp_insert, mock_reserve_ids
     ):
+        mock_reserve_ids.side_effect = lambda cursor, count: list(range(count))
+        mock_jp_insert.side_effect = lambda cursor, rows: {row[0] for row in rows}
         service = mock_tracks_data_dict["TransXChange"]["Services"]["Service"]
         mock_cursor = MagicMock()
         mock_op_service_id = 12
@@ -363,10 +476,13 @@ class TestDataCollectionFunctionality:
         )
         route_ref, link_refs = iterate_through_journey_patterns_and_run_insert_queries(
             mock_cursor,
-            mock_tracks_data_dict,
+            TxcDocument(mock_tracks_data_dict),
             mock_op_service_id,
             service,
-            vehicle_journeys,
+            {
+                vehicle_journey.journey_pattern_ref
+                for vehicle_journey in vehicle_journeys
+            },
             "JP1",
             logger,
         )
@@ -388,15 +504,15 @@ class TestDataCollectionFunctionality:
             "RL13",
         ]
 
-    @patch("txc_processor.insert_into_txc_tracks_table")
+    @patch("txc_processor.collect_service_track")
     def test_correct_tracks_are_inserted_with_multiple_route_sections(
         self, mock_routes_insert
     ):
-        mock_cursor = MagicMock(spec=cursor)
+        service_tracks = {}
         mock_op_service_id = 12
-        select_route_and_run_insert_query(
-            mock_cursor,
-            mock_tracks_data_dict,
+        select_route_and_collect_track(
+            service_tracks,
+            TxcDocument(mock_tracks_data_dict),
             mock_op_service_id,
             "RT1",
             [
@@ -417,34 +533,53 @@ class TestDataCollectionFunctionality:
         )
 
         mock_routes_insert.assert_called_once_with(
-            mock_cursor,
+            service_tracks,
             test_data.expected_tracks_data_multiple_sections,
             mock_op_service_id,
         )
 
-    @patch("txc_processor.insert_into_txc_tracks_table")
+    @patch("txc_processor.collect_service_track")
     def test_correct_tracks_are_inserted_with_one_route_section(
         self, mock_routes_insert
     ):
-        mock_cursor = MagicMock(spec=cursor)
+        service_tracks = {}
         mock_op_service_id = 12
-        select_route_and_run_insert_query(
-            mock_cursor,
-            mock_tracks_data_dict,
+        select_route_and_collect_track(
+            service_tracks,
+            TxcDocument(mock_tracks_data_dict),
             mock_op_service_id,
             "RT3",
             ["RL14"],
         )
 
         mock_routes_insert.assert_called_once_with(
-            mock_cursor,
+            service_tracks,
             test_data.expected_tracks_data_single_section,
             mock_op_service_id,
         )
 
-    @patch("txc_processor.insert_into_txc_tracks_table")
+    @patch("txc_processor.collect_service_track")
+    def test_tracks_are_simplified_within_the_tolerance(self, mock_routes_insert):
+        service_tracks = {}
+
+        collected, inserted = select_route_and_collect_track(
+            service_tracks,
+            TxcDocument(test_xml_helpers.generate_mock_txc_tracks_data_dict()),
+            12,
+            "RT3",
+            ["RL14"],
+            tolerance_metres=1000,
+        )
+
+        inserted_tracks = mock_routes_insert.call_args.args[1]
+        assert collected == len(test_data.expected_tracks_data_single_section)
+        assert inserted == len(inserted_tracks) < collected
+        assert inserted_tracks[0] == test_data.expected_tracks_data_single_section[0]
+        assert inserted_tracks[-1] == test_data.expected_tracks_data_single_section[-1]
+
+    @patch("txc_processor.collect_service_track")
     def test_no_tracks_inserted_when_coordinates_missing(self, mock_routes_insert):
-        mock_cursor = MagicMock(spec=cursor)
+        service_tracks = {}
         mock_op_service_id = 12
         mock_tracks_data_dict["TransXChange"]["RouteSections"]["RouteSection"] = [
             {
@@ -464,9 +599,9 @@ class TestDataCollectionFunctionality:
             }
         ]
 
-        select_route_and_run_insert_query(
-            mock_cursor,
-            mock_tracks_data_dict,
+        select_route_and_collect_track(
+            service_tracks,
+            TxcDocument(mock_tracks_data_dict),
             mock_op_service_id,
             "RT1",
             ["RL1"],
@@ -475,6 +610,120 @@ class TestDataCollectionFunctionality:
         mock_routes_insert.assert_not_called()
 
 
+@pytest.fixture
+def geometry_cache():
+    with patch("txc_processor.track_geometry_cache", TrackGeometryCache()) as cache:
+        yield cache
+
+
+class TestInsertTracks:
+    def generate_track(self, offset):
+        return [
+            TrackPoint(f"{-2.46 + offset:.6f}", "53.76"),
+            TrackPoint(f"{-2.45 + offset:.6f}", "53.77"),
+        ]
+
+    @patch("txc_processor.insert_rows")
+    def test_new_geometry_is_written_once_and_referenced(
+        self, mock_insert_rows, geometry_cache
+    ):
+        mock_cursor = MagicMock(spec=cursor)
+        tracks = test_data.expected_tracks_data_single_section
+        service_tracks = {}
+
+        collect_service_track(service_tracks, tracks, 12)
+        insert_into_txc_tracks_table(mock_cursor, service_tracks)
+
+        geometry_rows = mock_insert_rows.call_args_list[0].args[3]
+        geometry_hash, polyline, point_count = geometry_rows[0]
+        assert mock_insert_rows.call_args_list == [
+            call(
+                mock_cursor,
+                "track_geometries_new",
+                ("geometry_hash", "polyline", "point_count"),
+                [(geometry_hash, polyline, len(tracks))],
+                on_conflict="(geometry_hash) DO NOTHING",
+            ),
+            call(
+                mock_cursor,
+                "service_tracks_new",
+                ("operator_service_id", "geometry_hash"),
+                [(12, geometry_hash)],
+                on_conflict="(operator_service_id) DO NOTHING",
+            ),
+        ]
+        assert decode_polyline(polyline)[0] == (-2.464748, 53.768564)
+
+    @patch("txc_processor.insert_rows")
+    def test_services_sharing_a_route_reuse_its_geometry(
+        self, mock_insert_rows, geometry_cache
+    ):
+        tracks = test_data.expected_tracks_data_single_section
+        service_tracks = {}
+
+        collect_service_track(service_tracks, tracks, 12)
+        collect_service_track(service_tracks, list(tracks), 13)
+        insert_into_txc_tracks_table(MagicMock(spec=cursor), service_tracks)
+
+        geometry_insert, service_insert = mock_insert_rows.call_args_list
+        [(geometry_hash, *_)] = geometry_insert.args[3]
+        assert service_insert.args[3] == [(12, geometry_hash), (13, geometry_hash)]
+        assert geometry_cache.file_stats == {"written": 1, "reused": 1}
+
+    @patch("txc_processor.insert_rows")
+    def test_rows_are_written_in_key_order_whatever_the_service_order(
+        self, mock_insert_rows, geometry_cache
+    ):
+        tracks_by_service = {
+            service_id: self.generate_track(service_id / 100)
+            for service_id in range(5)
+        }
+        inserts = []
+
+        for service_ids in (range(5), reversed(range(5))):
+            service_tracks = {}
+            for service_id in service_ids:
+                collect_service_track(
+                    service_tracks, tracks_by_service[service_id], service_id
+                )
+
+            geometry_cache.clear()
+            mock_insert_rows.reset_mock()
+            insert_into_txc_tracks_table(MagicMock(spec=cursor), service_tracks)
+            inserts.append([call.args[1:] for call in mock_insert_rows.call_args_list])
+
+        assert inserts[0] == inserts[1]
+        geometry_hashes = [row[0] for row in inserts[0][0][2]]
+        service_ids = [row[0] for row in inserts[0][1][2]]
+        assert geometry_hashes == sorted(geometry_hashes)
+        assert len(geometry_hashes) == 5
+        assert service_ids == [0, 1, 2, 3, 4]
+
+    @patch("txc_processor.insert_rows")
+    def test_geometries_written_earlier_in_the_load_are_skipped(
+        self, mock_insert_rows, geometry_cache
+    ):
+        service_tracks = {}
+        collect_service_track(service_tracks, self.generate_track(0), 12)
+        geometry_cache.add(service_tracks[12][0])
+
+        insert_into_txc_tracks_table(MagicMock(spec=cursor), service_tracks)
+
+        [service_insert] = mock_insert_rows.call_args_list
+        assert service_insert.args[1] == "service_tracks_new"
+        assert geometry_cache.file_stats == {"written": 0, "reused": 1}
+
+    @patch("txc_processor.insert_rows")
+    def test_nothing_is_written_without_points(self, mock_insert_rows, geometry_cache):
+        service_tracks = {}
+
+        collect_service_track(service_tracks, [], 12)
+        insert_into_txc_tracks_table(MagicMock(spec=cursor), service_tracks)
+
+        assert service_tracks == {}
+        mock_insert_rows.assert_not_called()
+
+
 class TestCollectTrackData:
     def test_omit_easting_northing_from_tracks(self):
         route_sections = [
@@ -510,11 +759,14 @@ class TestCollectTrackData:
         route_section_refs = ["section1"]
         link_refs = ["link1"]
         expected_routes = [
-            {"longitude": 1.1111, "latitude": 2.2222},
-            {"longitude": 3.3333, "latitude": 4.4444},
+            TrackPoint(1.1111, 2.2222),
+            TrackPoint(3.3333, 4.4444),
         ]
 
-        result = collect_track_data(route_sections, route_section_refs, link_refs)
+        document = TxcDocument(
+            {"TransXChange": {"RouteSections": {"RouteSection": route_sections}}}
+        )
+        result = document.collect_track_data(route_section_refs, link_refs)
         assert result == expected_routes
 
     def test_omit_track_data_with_none_values(self):
@@ -550,17 +802,217 @@ class TestCollectTrackData:
         route_section_refs = ["section1"]
         link_refs = ["link1"]
         expected_routes = [
-            {"longitude": 1.1111, "latitude": 2.2222},
+            TrackPoint(1.1111, 2.2222),
         ]
 
-        result = collect_track_data(route_sections, route_section_refs, link_refs)
+        document = TxcDocument(
+            {"TransXChange": {"RouteSections": {"RouteSection": route_sections}}}
+        )
+        result = document.collect_track_data(route_section_refs, link_refs)
         assert result == expected_routes
 
 
+class TestMetrics:
+    def test_metrics_are_buffered_as_embedded_metric_format(self, metrics):
+        add_data_source_dimension(metrics, "bods")
+        put_metric_data(metrics, "InvalidNoc", 1)
+        put_metric_data(metrics, "NoLineDataInFile", 1)
+
+        emitted = metrics.serialize_metric_set()
+
+        assert emitted["_aws"]["CloudWatchMetrics"] == [
+            {
+                "Namespace": "ReferenceDataService/Uploaders",
+                "Dimensions": [["By Data Source"]],
+                "Metrics": [
+                    {"Name": "InvalidNoc", "Unit": "None"},
+                    {"Name": "NoLineDataInFile", "Unit": "None"},
+                ],
+            }
+        ]
+        assert emitted["By Data Source"] == "bods"
+        assert emitted["InvalidNoc"] == [1.0]
+        assert emitted["NoLineDataInFile"] == [1.0]
+
+    def test_file_without_operators_records_metric_without_a_query(self, metrics):
+        db_connection = MagicMock()
+
+        assert not write_to_database(
+            {"TransXChange": {}}, None, "bods", "key", db_connection, logger, metrics, {}
+        )
+
+        db_connection.cursor.assert_not_called()
+        assert metrics.serialize_metric_set()["NoOperatorData"] == [1.0]
+
+
+class TestResolveOperatorServiceIds:
+    operator = {"NationalOperatorCode": "TEST", "OperatorShortName": "Test"}
+
+    def generate_service(self, service_code, line_ids):
+        return {
+            "ServiceCode": service_code,
+            "OperatingPeriod": {"StartDate": "2025-01-01"},
+            "Mode": "bus",
+            "StandardService": {"Origin": "A", "Destination": "B"},
+            "Lines": {
+                "Line": [
+                    {"@id": line_id, "LineName": line_id} for line_id in line_ids
+                ]
+            },
+        }
+
+    def test_lines_are_resolved_in_two_round_trips(self):
+        services = [
+            self.generate_service(f"SVC{i}", [f"L{i}a", f"L{i}b"]) for i in range(50)
+        ]
+        operator_service_lines = [
+            (self.operator, service, line)
+            for service in services
+            for line in service["Lines"]["Line"]
+        ]
+        db_cursor = MagicMock()
+        # Only the first line already exists, and the inserted lines come
+        # back in reverse order
+        db_cursor.fetchall.side_effect = [
+            [(0, 7)] + [(i, None) for i in range(1, 100)],
+            [
+                (99 + i, "TEST", f"L{i // 2}{'ab'[i % 2]}", f"SVC{i // 2}")
+                + (datetime.date(2025, 1, 1), None, "tnds")
+                for i in reversed(range(1, 100))
+            ],
+        ]
+
+        operator_service_ids = resolve_operator_service_ids(
+            db_cursor,
+            operator_service_lines,
+            frozenset({"TEST"}),
+            "WM",
+            "tnds",
+            "key",
+            MagicMock(),
+            logger,
+        )
+
+        assert db_cursor.execute.call_count == 2
+        lookup_query, lookup_params = db_cursor.execute.call_args_list[0].args
+        insert_query, insert_params = db_cursor.execute.call_args_list[1].args
+        assert "IS NOT DISTINCT FROM" in lookup_query
+        assert lookup_params[:7] == [0, "TEST", "L0a", "SVC0", "2025-01-01", None, "tnds"]
+        assert insert_query.startswith("INSERT INTO services_new")
+        assert insert_query.endswith(
+            "RETURNING id, noc_code, line_name, service_code, start_date, end_date, data_source"
+        )
+        assert len(insert_params) == 99 * 16
+
+        assert operator_service_ids[("TEST", "L0a", "SVC0", "2025-01-01", None, "tnds")] == 7
+        assert operator_service_ids[("TEST", "L0b", "SVC0", "2025-01-01", None, "tnds")] == 100
+        assert operator_service_ids[("TEST", "L49b", "SVC49", "2025-01-01", None, "tnds")] == 198
+
+    def test_duplicate_lines_are_inserted_once(self):
+        service = self.generate_service("SVC1", ["L1", "L1"])
+        db_cursor = MagicMock()
+        db_cursor.fetchall.side_effect = [
+            [(0, None)],
+            [(3, "TEST", "L1", "SVC1", datetime.date(2025, 1, 1), None, "tnds")],
+        ]
+
+        operator_service_ids = resolve_operator_service_ids(
+            db_cursor,
+            [(self.operator, service, line) for line in service["Lines"]["Line"]],
+            frozenset({"TEST"}),
+            "WM",
+            "tnds",
+            "key",
+            MagicMock(),
+            logger,
+        )
+
+        assert len(db_cursor.execute.call_args_list[1].args[1]) == 16
+        assert operator_service_ids == {
+            ("TEST", "L1", "SVC1", "2025-01-01", None, "tnds"): 3
+        }
+
+    def test_nothing_is_inserted_when_all_lines_exist(self):
+        service = self.generate_service("SVC1", ["L1"])
+        db_cursor = MagicMock()
+        db_cursor.fetchall.return_value = [(0, 5)]
+
+        resolve_operator_service_ids(
+            db_cursor,
+            [(self.operator, service, service["Lines"]["Line"][0])],
+            frozenset({"TEST"}),
+            "WM",
+            "tnds",
+            "key",
+            MagicMock(),
+            logger,
+        )
+
+        db_cursor.execute.assert_called_once()
+
+    def test_lines_of_unknown_operators_are_rejected_without_a_query(self, metrics):
+        service = self.generate_service("SVC1", ["L1", "L2"])
+        db_cursor = MagicMock()
+
+        operator_service_ids = resolve_operator_service_ids(
+            db_cursor,
+            [(self.operator, service, line) for line in service["Lines"]["Line"]],
+            frozenset({"OTHER"}),
+            "WM",
+            "tnds",
+            "key",
+            metrics,
+            logger,
+        )
+
+        assert operator_service_ids == {}
+        db_cursor.execute.assert_not_called()
+        assert metrics.serialize_metric_set()["InvalidNoc"] == [1.0]
+
+
+class TestStreamedVehicleJourneys:
+    @patch("txc_processor.bulk_insert")
+    def test_streamed_rows_match_in_memory_rows(self, mock_bulk_insert):
+        file_path = (
+            os.path.dirname(os.path.realpath(__file__))
+            + "/helpers/test_data/mock_txc.xml"
+        )
+        document = TxcDocument(mock_data_dict)
+        service = document.services[0]
+
+        vehicle_journeys, journey_pattern_to_use = format_vehicle_journeys(
+            document.vehicle_journeys, "l_4_ANW", [], service
+        )
+        insert_into_txc_vehicle_journey_table(MagicMock(), vehicle_journeys, 12)
+        expected_rows = mock_bulk_insert.call_args.args[3]
+        mock_bulk_insert.reset_mock()
+
+        data_dict, vehicle_journey_stream = parse_txc_for_streaming(file_path)
+        journey_pattern_counts = insert_streamed_vehicle_journeys(
+            MagicMock(),
+            TxcDocument(data_dict, vehicle_journey_stream.count),
+            vehicle_journey_stream,
+            {"l_4_ANW": [(12, service)]},
+            [],
+            batch_size=2,
+        )
+
+        streamed_rows = [
+            row for call in mock_bulk_insert.call_args_list for row in call.args[3]
+        ]
+        assert streamed_rows == expected_rows
+        assert [len(call.args[3]) for call in mock_bulk_insert.call_args_list] == [
+            2,
+            2,
+            1,
+        ]
+        assert max(journey_pattern_counts["l_4_ANW"]) == journey_pattern_to_use
+
+
 class TestMainFunctionality:
     @patch("txc_processor.write_to_database")
     def test_integration_between_s3_download_and_database_write_functionality(
-        self, db_patch, s3, cloudwatch
+        self, db_patch, s3, metrics
     ):
         dir_path = os.path.dirname(os.path.realpath(__file__))
         mock_file_dir = dir_path + "/helpers/test_data/mock_txc.xml"
@@ -577,7 +1029,7 @@ class TestMainFunctionality:
 
         download_from_s3_and_write_to_db(
             s3,
-            cloudwatch,
+            metrics,
             mock_bucket,
             mock_key,
             mock_file_dir,
@@ -592,6 +1044,132 @@ class TestMainFunctionality:
             mock_key,
             db_connection,
             logger,
-            cloudwatch,
+            metrics,
             {},
+            timer=ANY,
         )
+
+        emitted = metrics.serialize_metric_set()
+        assert emitted["ParseBytes"] == [float(os.path.getsize(mock_file_dir))]
+        assert "ParseSeconds" in emitted
+        assert emitted["file"] == mock_key
+
+    @patch("txc_processor.write_to_database", return_value=True)
+    def test_stage_metrics_of_a_written_file_are_by_data_source(
+        self, db_patch, s3, metrics
+    ):
+        dir_path = os.path.dirname(os.path.realpath(__file__))
+        mock_file_dir = dir_path + "/helpers/test_data/mock_txc.xml"
+        mock_bucket = "test-bucket"
+        mock_key = "20250213/bods/test-key"
+        s3.create_bucket(
+            Bucket=mock_bucket,
+            CreateBucketConfiguration={"LocationConstraint": "eu-west-2"},
+        )
+        s3.put_object(Bucket=mock_bucket, Key=mock_key, Body=open(mock_file_dir, "rb"))
+
+        download_from_s3_and_write_to_db(
+            s3,
+            metrics,
+            mock_bucket,
+            mock_key,
+            mock_file_dir,
+            MagicMock(),
+            logger,
+            {},
+        )
+
+        emitted = metrics.serialize_metric_set()
+        [metric_directive] = emitted["_aws"]["CloudWatchMetrics"]
+        assert metric_directive["Dimensions"] == [["By Data Source"]]
+        metric_names = [metric["Name"] for metric in metric_directive["Metrics"]]
+        assert "ParseSeconds" in metric_names
+        assert emitted["By Data Source"] == "bods"
+
+    @patch("txc_processor.write_to_database")
+    def test_large_files_are_downloaded_and_streamed(
+        self, db_patch, s3, metrics, tmp_path
+    ):
+        dir_path = os.path.dirname(os.path.realpath(__file__))
+        mock_file_dir = dir_path + "/helpers/test_data/mock_txc.xml"
+        mock_bucket = "test-bucket"
+        mock_key = "20250213/tnds/WM/test-key"
+        file_path = str(tmp_path / "test-key")
+        s3.create_bucket(
+            Bucket=mock_bucket,
+            CreateBucketConfiguration={"LocationConstraint": "eu-west-2"},
+        )
+        s3.put_object(Bucket=mock_bucket, Key=mock_key, Body=open(mock_file_dir, "rb"))
+
+        with patch.dict(os.environ, {"TXC_STREAMING_THRESHOLD_BYTES": "1000"}):
+            download_from_s3_and_write_to_db(
+                s3,
+                metrics,
+                mock_bucket,
+                mock_key,
+                file_path,
+                MagicMock(),
+                logger,
+                {},
+            )
+
+        assert os.path.exists(file_path)
+        vehicle_journey_stream = db_patch.call_args.args[8]
+        assert vehicle_journey_stream.source == file_path
+        assert vehicle_journey_stream.count == 42
+
+    @patch("txc_processor.write_to_database")
+    def test_local_files_are_parsed_and_written(self, db_patch, metrics):
+        dir_path = os.path.dirname(os.path.realpath(__file__))
+        mock_file_dir = dir_path + "/helpers/test_data/mock_txc.xml"
+        mock_key = "local/tnds/WM/mock_txc.xml"
+        db_connection = MagicMock()
+        timer = StageTimer()
+
+        write_txc_file_to_db(
+            mock_file_dir,
+            os.path.getsize(mock_file_dir),
+            mock_key,
+            db_connection,
+            logger,
+            metrics,
+            {},
+            timer,
+        )
+
+        db_patch.assert_called_once_with(
+            mock_data_dict,
+            "WM",
+            "tnds",
+            mock_key,
+            db_connection,
+            logger,
+            metrics,
+            {},
+            None,
+            timer=timer,
+        )
+        assert timer.stages["Parse"]["bytes"] == os.path.getsize(mock_file_dir)
+        assert metrics.dimension_set == {"By Data Source": "tnds"}
+
+    @patch("txc_processor.write_to_database")
+    def test_large_local_files_are_streamed(self, db_patch, metrics):
+        dir_path = os.path.dirname(os.path.realpath(__file__))
+        mock_file_dir = dir_path + "/helpers/test_data/mock_txc.xml"
+
+        with patch.dict(os.environ, {"TXC_STREAMING_THRESHOLD_BYTES": "1000"}):
+            write_txc_file_to_db(
+                mock_file_dir,
+                os.path.getsize(mock_file_dir),
+                "local/bods/mock_txc.xml",
+                MagicMock(),
+                logger,
+                metrics,
+                {},
+                StageTimer(),
+            )
+
+        assert db_patch.call_args.args[1:3] == (None, "bods")
+        vehicle_journey_stream = db_patch.call_args.args[8]
+        assert vehicle_journey_stream.source == mock_file_dir
+        assert vehicle_journey_stream.count == 42
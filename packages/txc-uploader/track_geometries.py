@@ -0,0 +1,52 @@
+import hashlib
+from typing import Optional
+
+from psycopg2.extensions import cursor as Cursor
+
+
+def get_geometry_hash(polyline: str) -> str:
+    """Key a track geometry by its content. The polyline is the simplified
+    coordinate sequence at a fixed precision, so identical routes share it."""
+    return hashlib.sha256(polyline.encode("ascii")).hexdigest()
+
+
+class TrackGeometryCache:
+    """Hashes of the track geometries already in track_geometries_new for the
+    current load, kept for the life of a warm Lambda container.
+
+    The cleardown recreates track_geometries_new at the start of every load,
+    so the table's oid identifies the load and the hashes are forgotten as
+    soon as it changes. Hashes written by a file are only remembered once
+    that file has committed.
+    """
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self.table_oid: Optional[int] = None
+        self.hashes = set()
+        self.pending = set()
+        self.file_stats = {"written": 0, "reused": 0}
+
+    def start_file(self, cursor: Cursor):
+        cursor.execute("SELECT to_regclass('track_geometries_new')::oid")
+        row = cursor.fetchone()
+        table_oid = row[0] if row else None
+
+        if table_oid != self.table_oid:
+            self.table_oid = table_oid
+            self.hashes = set()
+
+        self.pending = set()
+        self.file_stats = {"written": 0, "reused": 0}
+
+    def contains(self, geometry_hash: str) -> bool:
+        return geometry_hash in self.hashes or geometry_hash in self.pending
+
+    def add(self, geometry_hash: str):
+        self.pending.add(geometry_hash)
+
+    def commit(self):
+        self.hashes.update(self.pending)
+        self.pending = set()
@@ -0,0 +1,76 @@
+from typing import Optional
+
+# Six decimal places keep points within about 0.1m, well inside the
+# accuracy of the surveyed tracks, where the usual five would round to 1m
+POLYLINE_PRECISION = 6
+
+
+def encode_value(value: int, encoded: list):
+    value = ~(value << 1) if value < 0 else value << 1
+
+    while value >= 0x20:
+        encoded.append(chr((0x20 | (value & 0x1F)) + 63))
+        value >>= 5
+
+    encoded.append(chr(value + 63))
+
+
+def get_coordinate(value) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def encode_polyline(tracks: list, precision: int = POLYLINE_PRECISION) -> tuple:
+    """Encode a track as a Google encoded polyline of latitude, longitude
+    pairs, the order expected by common decoders.
+
+    Returns the polyline and the number of points in it. Points whose
+    coordinates are not numbers are left out, as no map could draw them.
+    """
+    factor = 10**precision
+    encoded = []
+    previous_latitude = previous_longitude = 0
+    point_count = 0
+
+    for point in tracks:
+        longitude = get_coordinate(point.longitude)
+        latitude = get_coordinate(point.latitude)
+        if longitude is None or latitude is None:
+            continue
+
+        latitude = round(latitude * factor)
+        longitude = round(longitude * factor)
+        encode_value(latitude - previous_latitude, encoded)
+        encode_value(longitude - previous_longitude, encoded)
+        previous_latitude, previous_longitude = latitude, longitude
+        point_count += 1
+
+    return "".join(encoded), point_count
+
+
+def decode_polyline(polyline: str, precision: int = POLYLINE_PRECISION) -> list:
+    """Decode a polyline written by encode_polyline into (longitude,
+    latitude) tuples, in the order of the track."""
+    factor = 10**precision
+    values = []
+    value = shift = 0
+
+    for character in polyline:
+        chunk = ord(character) - 63
+        value |= (chunk & 0x1F) << shift
+        shift += 5
+
+        if chunk < 0x20:
+            values.append(~(value >> 1) if value & 1 else value >> 1)
+            value = shift = 0
+
+    points = []
+    latitude = longitude = 0
+    for index in range(0, len(values) - 1, 2):
+        latitude += values[index]
+        longitude += values[index + 1]
+        points.append((longitude / factor, latitude / factor))
+
+    return points
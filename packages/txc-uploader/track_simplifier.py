@@ -0,0 +1,102 @@
+import math
+import os
+
+EARTH_RADIUS_METRES = 6371008.8
+
+METRES_PER_DEGREE = math.pi / 180 * EARTH_RADIUS_METRES
+
+
+def get_track_simplify_tolerance_metres() -> float:
+    """Tracks are simplified to within this many metres of the original
+    line before insert. 0, the default, inserts every point."""
+    tolerance = float(os.getenv("TXC_TRACK_SIMPLIFY_TOLERANCE_METRES", "0"))
+
+    if tolerance < 0:
+        raise ValueError("TXC_TRACK_SIMPLIFY_TOLERANCE_METRES must not be negative")
+
+    return tolerance
+
+
+def project_to_metres(tracks: list) -> list:
+    """Project points onto a plane in metres about their mean latitude.
+
+    An equirectangular projection is accurate to well under a metre over
+    the few tens of kilometres a route covers, and needs no dependencies.
+    """
+    coordinates = [(float(point.longitude), float(point.latitude)) for point in tracks]
+    mean_latitude = sum(latitude for _, latitude in coordinates) / len(coordinates)
+    longitude_scale = METRES_PER_DEGREE * math.cos(math.radians(mean_latitude))
+
+    return [
+        (longitude * longitude_scale, latitude * METRES_PER_DEGREE)
+        for longitude, latitude in coordinates
+    ]
+
+
+def get_farthest_point(points: list, first: int, last: int) -> tuple:
+    """Return the index of the point between first and last farthest from
+    the segment joining them, and its squared distance."""
+    start_x, start_y = points[first]
+    end_x, end_y = points[last]
+    segment_x = end_x - start_x
+    segment_y = end_y - start_y
+    segment_length_squared = segment_x * segment_x + segment_y * segment_y
+
+    farthest_index = first
+    farthest_distance_squared = 0.0
+
+    for index in range(first + 1, last):
+        x, y = points[index]
+        offset_x = x - start_x
+        offset_y = y - start_y
+
+        if segment_length_squared > 0:
+            # Distance to the segment rather than the line, so that the
+            # points of a route ending where it began are measured sensibly
+            position = (offset_x * segment_x + offset_y * segment_y) / segment_length_squared
+            position = min(1.0, max(0.0, position))
+            offset_x -= position * segment_x
+            offset_y -= position * segment_y
+
+        distance_squared = offset_x * offset_x + offset_y * offset_y
+        if distance_squared > farthest_distance_squared:
+            farthest_index = index
+            farthest_distance_squared = distance_squared
+
+    return farthest_index, farthest_distance_squared
+
+
+def simplify_track(tracks: list, tolerance_metres: float) -> list:
+    """Drop the points of a route that lie within tolerance_metres of the
+    line through the points kept, using Douglas–Peucker.
+
+    The first and last points are always kept and the order of the rest is
+    unchanged. Tracks whose coordinates are not all numbers are returned as
+    they are.
+    """
+    if tolerance_metres <= 0 or len(tracks) < 3:
+        return tracks
+
+    try:
+        points = project_to_metres(tracks)
+    except ValueError:
+        return tracks
+
+    tolerance_squared = tolerance_metres * tolerance_metres
+    keep = bytearray(len(points))
+    keep[0] = keep[-1] = 1
+
+    # An explicit stack, as long tracks would exceed the recursion limit
+    sections = [(0, len(points) - 1)]
+    while sections:
+        first, last = sections.pop()
+        if last - first < 2:
+            continue
+
+        index, distance_squared = get_farthest_point(points, first, last)
+        if distance_squared > tolerance_squared:
+            keep[index] = 1
+            sections.append((first, index))
+            sections.append((index, last))
+
+    return [point for point, kept in zip(tracks, keep) if kept]
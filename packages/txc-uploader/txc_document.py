@@ -0,0 +1,331 @@
+import functools
+import itertools
+from typing import Optional
+
+from txc_records import JourneyPatternTimingLink, TrackPoint, intern_string
+
+
+def make_list(item):
+    if not isinstance(item, list):
+        return [item]
+    return item
+
+
+def get_list(parent: dict, container: str, element: str) -> list:
+    items = (parent.get(container) or {}).get(element)
+    return make_list(items) if items is not None else []
+
+
+def index_by(items: list, key: str) -> dict:
+    index = {}
+    for item in items:
+        if isinstance(item, dict) and key in item:
+            # Keep the first match to preserve the behaviour of a linear search
+            index.setdefault(item[key], item)
+    return index
+
+
+def get_referencing_lines(vehicle_journeys: list) -> dict:
+    """Map vehicle journey codes to the lines of the journeys that reference
+    them through VehicleJourneyRef in place of their own JourneyPatternRef."""
+    referencing_lines = {}
+    for journey in vehicle_journeys:
+        if (
+            "JourneyPatternRef" not in journey
+            and "VehicleJourneyRef" in journey
+            and "LineRef" in journey
+        ):
+            referencing_lines.setdefault(journey["VehicleJourneyRef"], []).append(
+                journey["LineRef"]
+            )
+
+    return referencing_lines
+
+
+def get_vehicle_journey_lines(journey: dict, referencing_lines: dict) -> list:
+    line_refs = dict.fromkeys(
+        referencing_lines.get(journey.get("VehicleJourneyCode"), [])
+    )
+    if "LineRef" in journey:
+        line_refs[journey["LineRef"]] = None
+
+    return list(line_refs)
+
+
+def partition_vehicle_journeys_by_line(vehicle_journeys: list) -> dict:
+    """Bucket vehicle journeys with a journey pattern by the lines they run on.
+
+    A journey belongs to its own LineRef and to the LineRef of every journey
+    without a JourneyPatternRef that points at it through VehicleJourneyRef.
+    File order is kept within each line.
+    """
+    referencing_lines = get_referencing_lines(vehicle_journeys)
+
+    vehicle_journeys_by_line = {}
+    for journey in vehicle_journeys:
+        if "JourneyPatternRef" not in journey:
+            continue
+
+        for line_ref in get_vehicle_journey_lines(journey, referencing_lines):
+            vehicle_journeys_by_line.setdefault(line_ref, []).append(journey)
+
+    return vehicle_journeys_by_line
+
+
+def extract_coordinates(location):
+    """Extract longitude and latitude from a location or translation."""
+    translation = location.get("Translation", None)
+    if translation is None:
+        longitude = location.get("Longitude", None)
+        latitude = location.get("Latitude", None)
+    else:
+        longitude = translation.get("Longitude", None)
+        latitude = translation.get("Latitude", None)
+    return longitude, latitude
+
+
+def collect_journey_pattern_section_refs_and_info(raw_journey_patterns):
+    journey_patterns = []
+    for raw_journey_pattern in raw_journey_patterns:
+        journey_pattern_info = {
+            "direction": (
+                raw_journey_pattern["Direction"]
+                if "Direction" in raw_journey_pattern
+                else None
+            ),
+            "destination_display": (
+                raw_journey_pattern["DestinationDisplay"]
+                if "DestinationDisplay" in raw_journey_pattern
+                else None
+            ),
+            "route_ref": (
+                raw_journey_pattern["RouteRef"]
+                if "RouteRef" in raw_journey_pattern
+                else None
+            ),
+            "journey_pattern_ref": (
+                raw_journey_pattern["@id"] if "@id" in raw_journey_pattern else None
+            ),
+        }
+
+        raw_journey_pattern_section_refs = raw_journey_pattern[
+            "JourneyPatternSectionRefs"
+        ]
+        journey_patterns.append(
+            {
+                "journey_pattern_info": journey_pattern_info,
+                "journey_pattern_section_refs": make_list(
+                    raw_journey_pattern_section_refs
+                ),
+            }
+        )
+
+    return journey_patterns
+
+
+def process_journey_pattern_timing_links(raw_journey_pattern_section: dict):
+    raw_journey_pattern_timing_links = make_list(
+        raw_journey_pattern_section.get("JourneyPatternTimingLink")
+    )
+    journey_pattern_timing_links = []
+    for raw_journey_pattern_timing_link in raw_journey_pattern_timing_links:
+        if raw_journey_pattern_timing_link:
+            link_from = raw_journey_pattern_timing_link.get("From")
+            link_to = raw_journey_pattern_timing_link.get("To")
+            journey_pattern_timing_link = JourneyPatternTimingLink(
+                from_atco_code=intern_string(link_from["StopPointRef"]),
+                from_timing_status=intern_string(link_from.get("TimingStatus", None)),
+                from_sequence_number=link_from.get("@SequenceNumber"),
+                to_atco_code=intern_string(link_to["StopPointRef"]),
+                to_timing_status=intern_string(link_to.get("TimingStatus", None)),
+                to_sequence_number=link_to.get("@SequenceNumber"),
+                run_time=intern_string(
+                    raw_journey_pattern_timing_link.get("RunTime", None)
+                ),
+                route_link_ref=intern_string(
+                    raw_journey_pattern_timing_link.get("RouteLinkRef", None)
+                ),
+            )
+            journey_pattern_timing_links.append(journey_pattern_timing_link)
+
+    return journey_pattern_timing_links
+
+
+class TxcDocument:
+    """A parsed TXC file with its referenced elements indexed by id.
+
+    Built once per file so that journey pattern sections, routes, route
+    sections and route links can be resolved from their refs without
+    scanning the whole document each time.
+    """
+
+    def __init__(self, data: dict, vehicle_journey_count: Optional[int] = None):
+        self.data = data
+        txc = data["TransXChange"]
+
+        self.services = get_list(txc, "Services", "Service")
+        self.vehicle_journeys = get_list(txc, "VehicleJourneys", "VehicleJourney")
+        # Streamed files only hold the journeys other journeys inherit from
+        self.vehicle_journey_count = (
+            len(self.vehicle_journeys)
+            if vehicle_journey_count is None
+            else vehicle_journey_count
+        )
+
+        self.journey_pattern_sections_by_id = index_by(
+            get_list(txc, "JourneyPatternSections", "JourneyPatternSection"), "@id"
+        )
+        self.routes_by_id = index_by(get_list(txc, "Routes", "Route"), "@id")
+        self.route_sections_by_id = index_by(
+            get_list(txc, "RouteSections", "RouteSection"), "@id"
+        )
+        self.route_links_by_section_id = {
+            section_id: index_by(
+                make_list(route_section.get("RouteLink") or []), "@id"
+            )
+            for section_id, route_section in self.route_sections_by_id.items()
+        }
+
+        # Keyed by id() as services are unhashable dicts owned by this document
+        self.journey_patterns_by_service = {}
+        self.journey_pattern_stats = {"transforms": 0, "reused": 0}
+
+    @property
+    def stop_codes(self) -> set:
+        stop_codes = set()
+        for journey_pattern_section in self.journey_pattern_sections_by_id.values():
+            for journey_pattern_timing_link in make_list(
+                journey_pattern_section.get("JourneyPatternTimingLink")
+            ):
+                if not journey_pattern_timing_link:
+                    continue
+                for end in ("From", "To"):
+                    stop_code = (journey_pattern_timing_link.get(end) or {}).get(
+                        "StopPointRef"
+                    )
+                    if stop_code:
+                        stop_codes.add(stop_code)
+
+        return stop_codes
+
+    @functools.cached_property
+    def vehicle_journeys_by_line(self) -> dict:
+        return partition_vehicle_journeys_by_line(self.vehicle_journeys)
+
+    @property
+    def has_vehicle_journeys(self) -> bool:
+        return self.vehicle_journey_count > 0
+
+    def get_operators(self):
+        operators = self.data["TransXChange"].get("Operators", None)
+
+        if operators:
+            operator_list = make_list(operators.get("Operator", []))
+            licensed_operator_list = make_list(operators.get("LicensedOperator", []))
+            return operator_list + licensed_operator_list
+
+        return []
+
+    def get_services_for_operator(self, operator):
+        return [
+            service
+            for service in self.services
+            if service["RegisteredOperatorRef"] == operator["@id"]
+        ]
+
+    def process_journey_pattern_sections(self, journey_pattern_section_refs: list):
+        journey_pattern_sections = []
+        for journey_pattern_section_ref in journey_pattern_section_refs:
+            raw_journey_pattern_section = self.journey_pattern_sections_by_id.get(
+                journey_pattern_section_ref
+            )
+
+            if raw_journey_pattern_section:
+                journey_pattern_sections.append(
+                    process_journey_pattern_timing_links(raw_journey_pattern_section)
+                )
+
+        return journey_pattern_sections
+
+    def collect_journey_patterns(self, service: dict):
+        """Return the transformed journey patterns of a service.
+
+        The result is computed once per service and shared by every line of
+        it, so callers must treat it as read-only.
+        """
+        journey_patterns = self.journey_patterns_by_service.get(id(service))
+
+        if journey_patterns is not None:
+            self.journey_pattern_stats["reused"] += 1
+            return journey_patterns
+
+        self.journey_pattern_stats["transforms"] += 1
+        journey_patterns = self.transform_journey_patterns(service)
+        self.journey_patterns_by_service[id(service)] = journey_patterns
+
+        return journey_patterns
+
+    def transform_journey_patterns(self, service: dict):
+        raw_journey_patterns = make_list(service["StandardService"]["JourneyPattern"])
+
+        journey_patterns_section_refs_and_info = (
+            collect_journey_pattern_section_refs_and_info(raw_journey_patterns)
+        )
+
+        journey_patterns = []
+        for journey_pattern in journey_patterns_section_refs_and_info:
+            journey_pattern_section_refs = make_list(
+                journey_pattern["journey_pattern_section_refs"]
+            )
+            processed_journey_pattern = {
+                "journey_pattern_sections": self.process_journey_pattern_sections(
+                    journey_pattern_section_refs
+                ),
+                "journey_pattern_info": journey_pattern["journey_pattern_info"],
+                "journey_pattern_section_refs": journey_pattern_section_refs,
+            }
+            journey_patterns.append(processed_journey_pattern)
+
+        return journey_patterns
+
+    def get_route_section_refs(self, route_ref: str):
+        route = self.routes_by_id.get(route_ref)
+
+        if route is None or route.get("RouteSectionRef", None) is None:
+            return None
+
+        return make_list(route["RouteSectionRef"])
+
+    def collect_track_data(self, route_section_refs, link_refs):
+        routes = []
+
+        for ref in route_section_refs:
+            route_links = self.route_links_by_section_id.get(ref)
+
+            if not route_links:
+                continue
+
+            for link_ref in link_refs:
+                route_link = route_links.get(link_ref)
+
+                if route_link is None:
+                    continue
+
+                track_data = route_link.get("Track", None)
+
+                if track_data is None:
+                    continue
+
+                for track in make_list(track_data):
+                    mapping = track["Mapping"]
+                    if mapping is None:
+                        continue
+
+                    for location in make_list(mapping["Location"]):
+                        longitude, latitude = extract_coordinates(location)
+                        if longitude is not None and latitude is not None:
+                            routes.append(TrackPoint(longitude, latitude))
+
+        clean_routes = [k for k, g in itertools.groupby(routes)]
+
+        return clean_routes
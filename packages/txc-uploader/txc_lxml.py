@@ -0,0 +1,293 @@
+import functools
+import os
+from typing import Optional
+
+from lxml import etree
+
+from txc_parser import TxcSource, parse_txc
+
+TXC_NAMESPACE = "http://www.transxchange.org.uk/"
+
+TXC_XPATH_NAMESPACES = {"t": TXC_NAMESPACE}
+
+PARSER_OPTIONS = {
+    "huge_tree": True,
+    "remove_comments": True,
+    "remove_blank_text": True,
+    "resolve_entities": False,
+    "no_network": True,
+}
+
+
+def compile_xpath(path: str) -> etree.XPath:
+    return etree.XPath(path, namespaces=TXC_XPATH_NAMESPACES)
+
+
+# Compiled once at import and shared by every file
+OPERATORS = compile_xpath("/t:TransXChange/t:Operators/t:Operator")
+LICENSED_OPERATORS = compile_xpath("/t:TransXChange/t:Operators/t:LicensedOperator")
+SERVICES = compile_xpath("/t:TransXChange/t:Services/t:Service")
+JOURNEY_PATTERN_SECTIONS = compile_xpath(
+    "/t:TransXChange/t:JourneyPatternSections/t:JourneyPatternSection"
+)
+ROUTES = compile_xpath("/t:TransXChange/t:Routes/t:Route")
+ROUTE_SECTIONS = compile_xpath("/t:TransXChange/t:RouteSections/t:RouteSection")
+VEHICLE_JOURNEYS = compile_xpath("/t:TransXChange/t:VehicleJourneys/t:VehicleJourney")
+
+JOURNEY_PATTERN_TIMING_LINKS = compile_xpath("t:JourneyPatternTimingLink")
+ROUTE_SECTION_REFS = compile_xpath("t:RouteSectionRef")
+ROUTE_LINKS = compile_xpath("t:RouteLink")
+TRACKS = compile_xpath("t:Track")
+MAPPINGS = compile_xpath("t:Mapping")
+LOCATIONS = compile_xpath("t:Location")
+
+TIMING_LINK_FIELDS = ("RunTime", "RouteLinkRef")
+TIMING_LINK_END_FIELDS = ("StopPointRef", "TimingStatus")
+COORDINATE_FIELDS = ("Longitude", "Latitude")
+VEHICLE_JOURNEY_FIELDS = (
+    "VehicleJourneyCode",
+    "ServiceRef",
+    "LineRef",
+    "JourneyPatternRef",
+    "VehicleJourneyRef",
+    "DepartureTime",
+    "OperatingProfile",
+    "Operational",
+)
+
+# Read-only subtrees that repeat across vehicle journeys
+SHARED_FIELDS = ("OperatingProfile",)
+
+TXC_TAG_PREFIX = f"{{{TXC_NAMESPACE}}}"
+
+
+@functools.lru_cache(maxsize=1024)
+def get_name(tag: str) -> str:
+    """Name an element or attribute the way xmltodict does with TXC_NAMESPACES."""
+    if tag.startswith(TXC_TAG_PREFIX):
+        return tag[len(TXC_TAG_PREFIX) :]
+    if tag.startswith("{"):
+        namespace, name = tag[1:].split("}", 1)
+        return f"{namespace}:{name}"
+    return tag
+
+
+def get_text(element) -> Optional[str]:
+    if len(element):
+        text = "".join([element.text or ""] + [child.tail or "" for child in element])
+    else:
+        text = element.text
+
+    return (text.strip() or None) if text else None
+
+
+def element_to_dict(element):
+    """Convert an element to the value xmltodict would produce for it."""
+    if not len(element) and not element.attrib:
+        return get_text(element)
+
+    item = {f"@{get_name(key)}": value for key, value in element.attrib.items()}
+
+    for child in element:
+        if not isinstance(child.tag, str):
+            continue
+
+        name = get_name(child.tag)
+        value = element_to_dict(child)
+        if name not in item:
+            item[name] = value
+        elif isinstance(item[name], list):
+            item[name].append(value)
+        else:
+            item[name] = [item[name], value]
+
+    text = get_text(element)
+
+    if not item:
+        return text
+    if text:
+        item["#text"] = text
+    return item
+
+
+def put_children(target: dict, element, names: tuple, shared_values=None):
+    """Copy the named children of an element into target, converted as
+    xmltodict would. Missing children are left out so that membership tests
+    behave the same as on a full parse.
+
+    Children named in shared_values are converted once per distinct markup
+    and the same value is reused, which suits the operating profiles that
+    most journeys of a file repeat.
+    """
+    for child in element:
+        if not isinstance(child.tag, str):
+            continue
+
+        name = get_name(child.tag)
+        if name not in names:
+            continue
+
+        if shared_values is not None and name in SHARED_FIELDS:
+            markup = etree.tostring(child, with_tail=False)
+            value = shared_values.get(markup)
+            if value is None:
+                value = shared_values[markup] = element_to_dict(child)
+        else:
+            value = element_to_dict(child)
+
+        if name not in target:
+            target[name] = value
+        elif isinstance(target[name], list):
+            target[name].append(value)
+        else:
+            target[name] = [target[name], value]
+
+    return target
+
+
+def extract_timing_link_end(element) -> dict:
+    item = put_children({}, element, TIMING_LINK_END_FIELDS)
+    if "SequenceNumber" in element.attrib:
+        item["@SequenceNumber"] = element.attrib["SequenceNumber"]
+
+    return item
+
+
+def extract_journey_pattern_section(element) -> dict:
+    timing_links = []
+    for timing_link_element in JOURNEY_PATTERN_TIMING_LINKS(element):
+        timing_link = put_children({}, timing_link_element, TIMING_LINK_FIELDS)
+        for end in timing_link_element:
+            if isinstance(end.tag, str) and get_name(end.tag) in ("From", "To"):
+                timing_link[get_name(end.tag)] = extract_timing_link_end(end)
+        timing_links.append(timing_link)
+
+    return {
+        "@id": element.get("id"),
+        "JourneyPatternTimingLink": timing_links,
+    }
+
+
+def is_empty(element) -> bool:
+    """xmltodict turns elements without attributes, children or text into None."""
+    return not (len(element) or element.attrib or get_text(element))
+
+
+def extract_location(element):
+    if is_empty(element):
+        return None
+
+    location = put_children({}, element, COORDINATE_FIELDS)
+    for child in element:
+        if isinstance(child.tag, str) and get_name(child.tag) == "Translation":
+            location["Translation"] = (
+                None if is_empty(child) else put_children({}, child, COORDINATE_FIELDS)
+            )
+
+    return location
+
+
+def extract_track(element) -> dict:
+    track = {}
+    for mapping_element in MAPPINGS(element)[:1]:
+        locations = [
+            extract_location(location) for location in LOCATIONS(mapping_element)
+        ]
+        # Mirror xmltodict for malformed tracks so that both paths fail alike:
+        # an empty Mapping is None and one without locations has no Location
+        if locations:
+            track["Mapping"] = {"Location": locations}
+        else:
+            track["Mapping"] = None if is_empty(mapping_element) else {}
+
+    return track
+
+
+def extract_route_section(element) -> dict:
+    return {
+        "@id": element.get("id"),
+        "RouteLink": [
+            {
+                "@id": route_link.get("id"),
+                "Track": [extract_track(track) for track in TRACKS(route_link)],
+            }
+            for route_link in ROUTE_LINKS(element)
+        ],
+    }
+
+
+def extract_route(element) -> dict:
+    return {
+        "@id": element.get("id"),
+        "RouteSectionRef": [
+            get_text(route_section_ref)
+            for route_section_ref in ROUTE_SECTION_REFS(element)
+        ],
+    }
+
+
+def extract_txc_from_tree(root) -> dict:
+    """Pull the sections txc_processor reads out of a parsed TXC tree.
+
+    Operators and services are small and are converted whole. Journey
+    pattern sections, route sections and vehicle journeys are reduced to the
+    fields the uploader uses, so stop points, timing link overrides and other
+    unused elements are never turned into Python objects.
+    """
+    operating_profiles = {}
+
+    return {
+        "TransXChange": {
+            "Operators": {
+                "Operator": [element_to_dict(operator) for operator in OPERATORS(root)],
+                "LicensedOperator": [
+                    element_to_dict(operator) for operator in LICENSED_OPERATORS(root)
+                ],
+            },
+            "Services": {
+                "Service": [element_to_dict(service) for service in SERVICES(root)]
+            },
+            "JourneyPatternSections": {
+                "JourneyPatternSection": [
+                    extract_journey_pattern_section(section)
+                    for section in JOURNEY_PATTERN_SECTIONS(root)
+                ]
+            },
+            "Routes": {"Route": [extract_route(route) for route in ROUTES(root)]},
+            "RouteSections": {
+                "RouteSection": [
+                    extract_route_section(route_section)
+                    for route_section in ROUTE_SECTIONS(root)
+                ]
+            },
+            "VehicleJourneys": {
+                "VehicleJourney": [
+                    put_children(
+                        {}, vehicle_journey, VEHICLE_JOURNEY_FIELDS, operating_profiles
+                    )
+                    for vehicle_journey in VEHICLE_JOURNEYS(root)
+                ]
+            },
+        }
+    }
+
+
+def extract_txc(source: TxcSource) -> dict:
+    """Parse a TXC file with libxml2 and extract what the uploader needs.
+
+    Accepts the same sources as parse_txc. Files outside the TXC namespace
+    fall back to the xmltodict parser.
+    """
+    parser = etree.XMLParser(**PARSER_OPTIONS)
+
+    if isinstance(source, bytes):
+        root = etree.fromstring(source, parser)
+    elif isinstance(source, (str, os.PathLike)):
+        root = etree.parse(os.fspath(source), parser).getroot()
+    else:
+        root = etree.parse(source, parser).getroot()
+
+    if root.tag != f"{TXC_TAG_PREFIX}TransXChange":
+        return parse_txc(etree.tostring(root))
+
+    return extract_txc_from_tree(root)
@@ -0,0 +1,130 @@
+import os
+from typing import BinaryIO, Union
+
+import xmltodict
+
+TXC_NAMESPACES = {"http://www.transxchange.org.uk/": None}
+
+TxcSource = Union[str, os.PathLike, bytes, BinaryIO]
+
+# Files above this size are parsed without materialising their vehicle journeys
+DEFAULT_STREAMING_THRESHOLD_BYTES = 50 * 1024 * 1024
+
+
+# "xmltodict" parses the whole document, "lxml" extracts only what the uploader reads
+TXC_PARSER_ENGINES = ("xmltodict", "lxml")
+
+
+def get_txc_parser_engine() -> str:
+    engine = os.getenv("TXC_PARSER_ENGINE", "xmltodict")
+
+    if engine not in TXC_PARSER_ENGINES:
+        raise ValueError(
+            f"TXC_PARSER_ENGINE must be one of {', '.join(TXC_PARSER_ENGINES)}"
+        )
+
+    return engine
+
+
+def get_streaming_threshold_bytes() -> int:
+    return int(
+        os.getenv("TXC_STREAMING_THRESHOLD_BYTES", DEFAULT_STREAMING_THRESHOLD_BYTES)
+    )
+
+
+def parse_txc(source: TxcSource) -> dict:
+    """Parse a TXC document in a single pass into a namespace-stripped dict.
+
+    Accepts a file path, the raw bytes of the document or a binary file-like
+    object. Files and streams are fed to expat incrementally so the document
+    is never held in memory as both a tree and a serialised string.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as file:
+            return parse_txc(file)
+
+    return xmltodict.parse(
+        source, process_namespaces=True, namespaces=TXC_NAMESPACES
+    )
+
+
+# VehicleJourney elements sit at TransXChange/VehicleJourneys/VehicleJourney
+SECTION_ITEM_DEPTH = 3
+
+
+def parse_txc_sections(source: TxcSource, handle_item):
+    """Parse a TXC document one section item at a time.
+
+    handle_item is called with the section name and the parsed child of each
+    top-level section (e.g. "Services" and one Service); nothing else of the
+    document is kept in memory.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as file:
+            return parse_txc_sections(file, handle_item)
+
+    def item_callback(path, item):
+        (_, _), (section, _), (element, _) = path
+        handle_item(section, element, item)
+        return True
+
+    def postprocessor(path, key, value):
+        # xmltodict still appends each handed-off item to its siblings, so
+        # drop it here to stop the whole section building up in memory
+        if len(path) == SECTION_ITEM_DEPTH and key == path[-1][0]:
+            return None
+        return key, value
+
+    xmltodict.parse(
+        source,
+        process_namespaces=True,
+        namespaces=TXC_NAMESPACES,
+        item_depth=SECTION_ITEM_DEPTH,
+        item_callback=item_callback,
+        postprocessor=postprocessor,
+    )
+
+
+class VehicleJourneyStream:
+    """Re-reads the VehicleJourney elements of a TXC file one at a time."""
+
+    def __init__(self, source: Union[str, os.PathLike], count: int):
+        self.source = source
+        self.count = count
+
+    def for_each(self, handle_vehicle_journey):
+        def handle_item(section, element, item):
+            if section == "VehicleJourneys" and element == "VehicleJourney":
+                handle_vehicle_journey(item)
+
+        parse_txc_sections(self.source, handle_item)
+
+
+def parse_txc_for_streaming(
+    source: Union[str, os.PathLike],
+) -> tuple[dict, VehicleJourneyStream]:
+    """Parse everything in a TXC file except the bulk of its vehicle journeys.
+
+    Only vehicle journeys without a JourneyPatternRef are kept, as other
+    journeys inherit their line through them. The rest are read again
+    later through the returned stream so that memory use does not grow with
+    the number of journeys in the file.
+    """
+    sections = {}
+    vehicle_journey_count = 0
+
+    def handle_item(section, element, item):
+        nonlocal vehicle_journey_count
+
+        if section == "VehicleJourneys" and element == "VehicleJourney":
+            vehicle_journey_count += 1
+            if "JourneyPatternRef" in (item or {}):
+                return
+
+        sections.setdefault(section, {}).setdefault(element, []).append(item)
+
+    parse_txc_sections(source, handle_item)
+
+    return {"TransXChange": sections}, VehicleJourneyStream(
+        source, vehicle_journey_count
+    )
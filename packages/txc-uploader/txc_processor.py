@@ -1,28 +1,54 @@
 import datetime
-import itertools
-import xml.etree.ElementTree as eT
+import json
 from typing import Optional
 
-import xmltodict
-from psycopg2 import IntegrityError
+from aws_lambda_powertools import Metrics
+from aws_lambda_powertools.metrics import MetricUnit
 from psycopg2.extensions import connection as Connection
 from psycopg2.extensions import cursor as Cursor
-
-NOC_INTEGRITY_ERROR_MSG = "Cannot add or update a child row: a foreign key constraint fails (`ref_data`.`services`, CONSTRAINT `fk_services_operators_nocCode` FOREIGN KEY (`nocCode`) REFERENCES `operators` (`nocCode`))"
-
-bank_holiday_txc_mapping = {
-    "New Year’s Day": "NewYearsDay",
-    "Good Friday": "GoodFriday",
-    "Easter Monday": "EasterMonday",
-    "Early May bank holiday": "MayDay",
-    "Spring bank holiday": "SpringBank",
-    "Summer bank holiday": "LateSummerBankHolidayNotScotland",
-    "Scotland Summer bank holiday": "AugustBankHolidayScotland",
-    "Christmas Day": "ChristmasDayHoliday",
-    "Boxing Day": "BoxingDayHoliday",
-    "2nd January": "Jan2ndScotland",
-    "St Andrew’s Day": "StAndrewsDayHoliday",
-}
+from bulk_writer import bulk_insert, insert_rows
+from db_profiler import open_cursor
+from noc_cache import NocCache
+from operating_profile import (
+    get_operating_calendar,
+    get_operating_calendar_horizon_days,
+    runs_on,
+)
+from s3_reader import open_s3_object
+from stage_timer import StageTimer
+from stop_resolver import StopResolver
+from track_geometries import TrackGeometryCache, get_geometry_hash
+from track_polyline import encode_polyline
+from track_simplifier import get_track_simplify_tolerance_metres, simplify_track
+from txc_document import (
+    TxcDocument,
+    collect_journey_pattern_section_refs_and_info,
+    get_referencing_lines,
+    get_vehicle_journey_lines,
+    make_list,
+    partition_vehicle_journeys_by_line,
+)
+from txc_lxml import extract_txc
+from txc_records import JourneyPatternTimingLink, VehicleJourney, intern_string
+from txc_parser import (
+    VehicleJourneyStream,
+    get_streaming_threshold_bytes,
+    get_txc_parser_engine,
+    parse_txc,
+    parse_txc_for_streaming,
+)
+
+# Rows of streamed vehicle journeys held in memory before they are written
+VEHICLE_JOURNEY_BATCH_SIZE = 5000
+
+METRIC_NAMESPACE = "ReferenceDataService/Uploaders"
+
+DATA_SOURCE_DIMENSION = "By Data Source"
+
+# Shared by every file handled in a warm container
+noc_cache = NocCache()
+
+track_geometry_cache = TrackGeometryCache()
 
 
 def create_unique_line_id(noc, line_name):
@@ -31,60 +57,18 @@ def create_unique_line_id(noc, line_name):
     return f"{first_part}{second_part}{noc}:{noc}{line_name}"
 
 
-def put_metric_data_by_data_source(cloudwatch, data_source, metric_name, metric_value):
-    cloudwatch.put_metric_data(
-        MetricData=[
-            {
-                "MetricName": metric_name,
-                "Dimensions": [
-                    {"Name": "By Data Source", "Value": data_source},
-                ],
-                "Unit": "None",
-                "Value": metric_value,
-            },
-        ],
-        Namespace="ReferenceDataService/Uploaders",
-    )
-
-
-def make_list(item):
-    if not isinstance(item, list):
-        return [item]
-    return item
+def add_data_source_dimension(metrics: Metrics, data_source):
+    """Tag the metrics of a file with its data source. Each file's metrics
+    are written as one embedded metric format log line with a single
+    dimension set, so this is set before any metric of the file is added."""
+    if metrics.dimension_set.get(DATA_SOURCE_DIMENSION) != data_source:
+        metrics.add_dimension(name=DATA_SOURCE_DIMENSION, value=data_source)
 
 
-def get_operators(data_dict, data_source, cloudwatch):
-    operators = data_dict["TransXChange"].get("Operators", None)
-
-    if operators:
-        operator_list = make_list(operators.get("Operator", []))
-        licensed_operator_list = make_list(operators.get("LicensedOperator", []))
-        return operator_list + licensed_operator_list
-
-    return []
-
-
-def get_services_for_operator(data_dict, operator):
-    if "Services" in data_dict["TransXChange"]:
-        services = make_list(data_dict["TransXChange"]["Services"]["Service"])
-        services_for_operator = [
-            service
-            for service in services
-            if service["RegisteredOperatorRef"] == operator["@id"]
-        ]
-        return services_for_operator
-
-
-def get_vehicle_journeys(data_dict):
-    if (
-        "VehicleJourneys" in data_dict["TransXChange"]
-        and data_dict["TransXChange"]["VehicleJourneys"] is not None
-    ):
-        vehicle_journeys = make_list(
-            data_dict["TransXChange"]["VehicleJourneys"]["VehicleJourney"]
-        )
-
-        return vehicle_journeys
+def put_metric_data(metrics: Metrics, metric_name, metric_value):
+    """Buffer a metric for the embedded metric format log line that is
+    written when the invocation ends."""
+    metrics.add_metric(name=metric_name, unit=MetricUnit.NoUnit, value=metric_value)
 
 
 def get_lines_for_service(service):
@@ -124,61 +108,6 @@ def extract_data_for_txc_operator_service_table(operator, service, line):
     )
 
 
-def collect_journey_pattern_section_refs_and_info(raw_journey_patterns):
-    journey_patterns = []
-    for raw_journey_pattern in raw_journey_patterns:
-        journey_pattern_info = {
-            "direction": (
-                raw_journey_pattern["Direction"]
-                if "Direction" in raw_journey_pattern
-                else None
-            ),
-            "destination_display": (
-                raw_journey_pattern["DestinationDisplay"]
-                if "DestinationDisplay" in raw_journey_pattern
-                else None
-            ),
-            "route_ref": (
-                raw_journey_pattern["RouteRef"]
-                if "RouteRef" in raw_journey_pattern
-                else None
-            ),
-            "journey_pattern_ref": (
-                raw_journey_pattern["@id"] if "@id" in raw_journey_pattern else None
-            ),
-        }
-
-        raw_journey_pattern_section_refs = raw_journey_pattern[
-            "JourneyPatternSectionRefs"
-        ]
-        journey_patterns.append(
-            {
-                "journey_pattern_info": journey_pattern_info,
-                "journey_pattern_section_refs": make_list(
-                    raw_journey_pattern_section_refs
-                ),
-            }
-        )
-
-    return journey_patterns
-
-
-def is_date_within_ranges(date, date_ranges):
-    if date_ranges is not None:
-        date_ranges = make_list(date_ranges)
-    for date_range in date_ranges:
-        today = datetime.date.today().strftime("%Y-%m-%d")
-        start_date = datetime.datetime.strptime(
-            date_range.get("startDate", today), "%Y-%m-%d"
-        ).date()
-        end_date = datetime.datetime.strptime(
-            date_range.get("endDate", today), "%Y-%m-%d"
-        ).date()
-        if start_date <= date <= end_date:
-            return True
-    return False
-
-
 def safeget(dct, *keys):
     for key in keys:
         try:
@@ -188,384 +117,87 @@ def safeget(dct, *keys):
     return dct
 
 
-def calculate_days_of_operation(days_of_week):
-    formatted_days_of_week = {}
-
-    if not days_of_week:
-        return formatted_days_of_week
-
-    if any(
-        key in days_of_week
-        for key in [
-            "Monday",
-            "MondayToFriday",
-            "MondayToSaturday",
-            "MondayToSunday",
-            "NotTuesday",
-            "NotWednesday",
-            "NotThursday",
-            "NotFriday",
-            "NotSaturday",
-            "NotSunday",
-        ]
-    ):
-        formatted_days_of_week["Monday"] = None
-
-    if any(
-        key in days_of_week
-        for key in [
-            "Tuesday",
-            "MondayToFriday",
-            "MondayToSaturday",
-            "MondayToSunday",
-            "NotMonday",
-            "NotWednesday",
-            "NotThursday",
-            "NotFriday",
-            "NotSaturday",
-            "NotSunday",
-        ]
-    ):
-        formatted_days_of_week["Tuesday"] = None
-
-    if any(
-        key in days_of_week
-        for key in [
-            "Wednesday",
-            "MondayToFriday",
-            "MondayToSaturday",
-            "MondayToSunday",
-            "NotMonday",
-            "NotTuesday",
-            "NotThursday",
-            "NotFriday",
-            "NotSaturday",
-            "NotSunday",
-        ]
-    ):
-        formatted_days_of_week["Wednesday"] = None
-
-    if any(
-        key in days_of_week
-        for key in [
-            "Thursday",
-            "MondayToFriday",
-            "MondayToSaturday",
-            "MondayToSunday",
-            "NotMonday",
-            "NotTuesday",
-            "NotWednesday",
-            "NotFriday",
-            "NotSaturday",
-            "NotSunday",
-        ]
-    ):
-        formatted_days_of_week["Thursday"] = None
-
-    if any(
-        key in days_of_week
-        for key in [
-            "Friday",
-            "MondayToFriday",
-            "MondayToSaturday",
-            "MondayToSunday",
-            "NotMonday",
-            "NotTuesday",
-            "NotWednesday",
-            "NotThursday",
-            "NotSaturday",
-            "NotSunday",
-        ]
-    ):
-        formatted_days_of_week["Friday"] = None
-
-    if any(
-        key in days_of_week
-        for key in [
-            "Saturday",
-            "MondayToSaturday",
-            "MondayToSunday",
-            "Weekend",
-            "NotMonday",
-            "NotTuesday",
-            "NotWednesday",
-            "NotThursday",
-            "NotFriday",
-            "NotSunday",
-        ]
-    ):
-        formatted_days_of_week["Saturday"] = None
-
-    if any(
-        key in days_of_week
-        for key in [
-            "Sunday",
-            "MondayToSunday",
-            "Weekend",
-            "NotMonday",
-            "NotTuesday",
-            "NotWednesday",
-            "NotThursday",
-            "NotFriday",
-            "NotSaturday",
-        ]
-    ):
-        formatted_days_of_week["Sunday"] = None
-
-    return formatted_days_of_week
-
-
-# Check if a vehicle service is operational_for_today
-def is_service_operational(
-    vehicle_journey,
+def collect_vehicle_journey(
+    vehicle,
     bank_holidays,
     service_operating_profile,
     service_operating_period,
     today=None,
+    horizon_days=None,
 ):
     if today is None:
         today = datetime.date.today()
-
-    # Check the OperatingPeriod of the service
-    service_start_date = datetime.datetime.strptime(
-        service_operating_period["StartDate"], "%Y-%m-%d"
-    ).date()
-    service_end_date = (
-        datetime.datetime.strptime(
-            service_operating_period["EndDate"], "%Y-%m-%d"
-        ).date()
-        if "EndDate" in service_operating_period
-        else None
-    )
-    if (service_end_date and service_end_date < today) or (service_start_date > today):
-        return False
-
-    # Fallback default operating profile
-    default_operating_profile = {
-        "RegularDayType": {
-            "DaysOfWeek": {
-                "Monday": "",
-                "Tuesday": "",
-                "Wednesday": "",
-                "Thursday": "",
-                "Friday": "",
-                "Saturday": "",
-                "Sunday": "",
-            }
-        }
-    }
-
-    # Use the vehicle journey's operating profile or fallback to the service's operating profile or default
-    operating_profile = (
-        vehicle_journey.get("OperatingProfile")
-        or service_operating_profile
-        or default_operating_profile
-    )
-
-    # Check if today is a special non-operation day
-    special_days_operation = operating_profile.get("SpecialDaysOperation", {})
-
-    special_days_non_operation = (
-        special_days_operation.get("DaysOfNonOperation", [])
-        if special_days_operation
-        else []
-    )
-
-    if is_date_within_ranges(today, special_days_non_operation):
-        return False
-
-    # Check if today is a special operation day
-    days_of_special_operation = (
-        special_days_operation.get("DaysOfOperation", [])
-        if special_days_operation
-        else []
-    )
-
-    if is_date_within_ranges(today, days_of_special_operation):
-        return True
-
-    # Check if today is a bank holiday, if so check whether the service is operational
-    todays_bank_holidays = [
-        holiday
-        for holiday in bank_holidays
-        if holiday["date"] == today.strftime("%Y-%m-%d")
-    ]
-
-    if todays_bank_holidays:
-        bank_holiday_operation = operating_profile.get("BankHolidayOperation", [])
-
-        days_of_bank_holiday_operation = (
-            (bank_holiday_operation.get("DaysOfOperation", []) or [])
-            if bank_holiday_operation
-            else []
-        )
-        bank_holiday_non_operation = (
-            (bank_holiday_operation.get("DaysOfNonOperation", []) or [])
-            if bank_holiday_operation
-            else []
-        )
-
-        if "AllBankHolidays" in bank_holiday_operation:
-            return True
-
-        if "AllBankHolidays" in bank_holiday_non_operation:
-            return False
-
-        for holiday in todays_bank_holidays:
-            txc_holiday_name = bank_holiday_txc_mapping.get(holiday["title"], None)
-            if txc_holiday_name:
-                if txc_holiday_name in days_of_bank_holiday_operation:
-                    return True
-                if txc_holiday_name in bank_holiday_non_operation:
-                    return False
-
-    # Check if today is a regular operating day
-    days_of_week = calculate_days_of_operation(
-        operating_profile.get("RegularDayType", {}).get("DaysOfWeek", {})
-    )
-
-    if today.strftime("%A") not in days_of_week:
-        return False
-
-    return True
-
-
-def collect_vehicle_journey(
-    vehicle, bank_holidays, service_operating_profile, service_operating_period
-):
-    vehicle_journey_info = {
-        "vehicle_journey_code": (
-            vehicle["VehicleJourneyCode"] if "VehicleJourneyCode" in vehicle else None
-        ),
-        "service_ref": vehicle["ServiceRef"] if "ServiceRef" in vehicle else None,
-        "line_ref": vehicle["LineRef"] if "LineRef" in vehicle else None,
-        "journey_pattern_ref": (
-            vehicle["JourneyPatternRef"] if "JourneyPatternRef" in vehicle else None
-        ),
-        "departure_time": (
-            vehicle["DepartureTime"] if "DepartureTime" in vehicle else None
-        ),
-        "journey_code": (
-            safeget(vehicle, "Operational", "TicketMachine", "JourneyCode")
-        ),
-        "operational_for_today": is_service_operational(
-            vehicle, bank_holidays, service_operating_profile, service_operating_period
-        ),
-    }
-
-    return vehicle_journey_info
-
-
-def process_journey_pattern_sections(
-    journey_pattern_section_refs: list, raw_journey_pattern_sections: list
-):
-    journey_pattern_sections = []
-    for journey_pattern_section_ref in journey_pattern_section_refs:
-        for raw_journey_pattern_section in raw_journey_pattern_sections:
-            selected_raw_journey_pattern_section = {}
-
-            if raw_journey_pattern_section["@id"] == journey_pattern_section_ref:
-                selected_raw_journey_pattern_section = raw_journey_pattern_section
-
-            if len(selected_raw_journey_pattern_section) > 0:
-                raw_journey_pattern_timing_links = make_list(
-                    selected_raw_journey_pattern_section.get("JourneyPatternTimingLink")
-                )
-                journey_pattern_timing_links = []
-                for raw_journey_pattern_timing_link in raw_journey_pattern_timing_links:
-                    if raw_journey_pattern_timing_link:
-                        link_from = raw_journey_pattern_timing_link.get("From")
-                        link_to = raw_journey_pattern_timing_link.get("To")
-                        journey_pattern_timing_link = {
-                            "from_atco_code": link_from["StopPointRef"],
-                            "from_timing_status": link_from.get("TimingStatus", None),
-                            "from_sequence_number": link_from.get("@SequenceNumber"),
-                            "to_atco_code": link_to["StopPointRef"],
-                            "to_timing_status": link_to.get("TimingStatus", None),
-                            "run_time": raw_journey_pattern_timing_link.get(
-                                "RunTime", None
-                            ),
-                            "to_sequence_number": link_to.get("@SequenceNumber"),
-                            "route_link_ref": raw_journey_pattern_timing_link.get(
-                                "RouteLinkRef", None
-                            ),
-                        }
-                        journey_pattern_timing_links.append(journey_pattern_timing_link)
-
-                journey_pattern_sections.append(journey_pattern_timing_links)
-
-    return journey_pattern_sections
-
-
-def collect_journey_patterns(data: dict, service: dict):
-    raw_journey_patterns = make_list(service["StandardService"]["JourneyPattern"])
-    raw_journey_pattern_sections = make_list(
-        data["TransXChange"]["JourneyPatternSections"]["JourneyPatternSection"]
+    if horizon_days is None:
+        horizon_days = get_operating_calendar_horizon_days()
+
+    operating_calendar = get_operating_calendar(
+        vehicle,
+        bank_holidays,
+        service_operating_profile,
+        service_operating_period,
+        today,
+        horizon_days,
     )
 
-    journey_patterns_section_refs_and_info = (
-        collect_journey_pattern_section_refs_and_info(raw_journey_patterns)
+    return VehicleJourney(
+        intern_string(vehicle.get("VehicleJourneyCode")),
+        intern_string(vehicle.get("ServiceRef")),
+        intern_string(vehicle.get("LineRef")),
+        intern_string(vehicle.get("JourneyPatternRef")),
+        intern_string(vehicle.get("DepartureTime")),
+        safeget(vehicle, "Operational", "TicketMachine", "JourneyCode"),
+        runs_on(operating_calendar, today, today),
+        operating_calendar,
+        today,
     )
 
-    journey_patterns = []
-    for journey_pattern in journey_patterns_section_refs_and_info:
-        journey_pattern_section_refs = make_list(
-            journey_pattern["journey_pattern_section_refs"]
-        )
-        processed_journey_pattern = {
-            "journey_pattern_sections": process_journey_pattern_sections(
-                journey_pattern_section_refs, raw_journey_pattern_sections
-            ),
-            "journey_pattern_info": journey_pattern["journey_pattern_info"],
-            "journey_pattern_section_refs": journey_pattern_section_refs,
-        }
-        journey_patterns.append(processed_journey_pattern)
-
-    return journey_patterns
-
 
 def iterate_through_journey_patterns_and_run_insert_queries(
     cursor,
-    data: dict,
+    document: TxcDocument,
     operator_service_id: str,
     service: dict,
-    vehicle_journeys: list,
+    journey_pattern_refs,
     journey_pattern_to_use_for_tracks: str,
     logger,
+    stop_resolver: Optional[StopResolver] = None,
 ):
-    journey_patterns = collect_journey_patterns(data, service)
+    if stop_resolver is None:
+        stop_resolver = StopResolver.load(cursor, document.stop_codes)
+
+    journey_patterns = [
+        journey_pattern
+        for journey_pattern in document.collect_journey_patterns(service)
+        if journey_pattern["journey_pattern_info"]["journey_pattern_ref"]
+        in journey_pattern_refs
+    ]
     admin_area_codes = set()
     route_ref_for_tracks = None
     link_refs_for_tracks = None
     centre_stop = None
 
-    vehicle_journey_journey_pattern_refs = [
-        vehicle_journey["journey_pattern_ref"] for vehicle_journey in vehicle_journeys
-    ]
+    journey_pattern_ids = reserve_journey_pattern_ids(cursor, len(journey_patterns))
+    inserted_journey_pattern_ids = insert_into_txc_journey_pattern_table(
+        cursor,
+        [
+            get_journey_pattern_row(
+                journey_pattern_id, operator_service_id, journey_pattern
+            )
+            for journey_pattern_id, journey_pattern in zip(
+                journey_pattern_ids, journey_patterns
+            )
+        ],
+    )
 
-    for journey_pattern in journey_patterns:
+    link_rows = []
+    for journey_pattern_id, journey_pattern in zip(
+        journey_pattern_ids, journey_patterns
+    ):
         journey_pattern_info = journey_pattern["journey_pattern_info"]
 
-        if (
-            journey_pattern_info["journey_pattern_ref"]
-            not in vehicle_journey_journey_pattern_refs
-        ):
-            continue
-
-        journey_pattern_section_refs: list = journey_pattern[
-            "journey_pattern_section_refs"
-        ]
-        sorted_journey_pattern_section_refs = sorted(journey_pattern_section_refs)
-
-        joined_section_refs = "".join(sorted_journey_pattern_section_refs)
-
-        journey_pattern_id = insert_into_txc_journey_pattern_table(
-            cursor, operator_service_id, journey_pattern_info, joined_section_refs
-        )
-
-        if not journey_pattern_id:
+        if journey_pattern_id not in inserted_journey_pattern_ids:
             logger.info(
-                f"Existing journey pattern found - '{operator_service_id}' - '{journey_pattern_info['destination_display']}' - '{journey_pattern_info['direction']}' - '{journey_pattern_info['route_ref']}' - '{joined_section_refs}'"
+                f"Existing journey pattern found - '{operator_service_id}' - '{journey_pattern_info['destination_display']}' - '{journey_pattern_info['direction']}' - '{journey_pattern_info['route_ref']}' - '{join_section_refs(journey_pattern)}'"
             )
             continue
 
@@ -573,13 +205,13 @@ def iterate_through_journey_patterns_and_run_insert_queries(
         stop_codes = set()
         for journey_pattern_section in journey_pattern["journey_pattern_sections"]:
             for journey_pattern_timing_link in journey_pattern_section:
-                stop_codes.add(journey_pattern_timing_link["from_atco_code"])
-                stop_codes.add(journey_pattern_timing_link["to_atco_code"])
+                stop_codes.add(journey_pattern_timing_link.from_atco_code)
+                stop_codes.add(journey_pattern_timing_link.to_atco_code)
                 links.append(journey_pattern_timing_link)
 
-        insert_into_txc_journey_pattern_link_table(cursor, links, journey_pattern_id)
+        link_rows.extend(get_journey_pattern_link_rows(links, journey_pattern_id))
 
-        admin_area_codes.update(get_admin_area_codes(cursor, stop_codes))
+        admin_area_codes.update(stop_resolver.get_admin_area_codes(stop_codes))
 
         if (
             journey_pattern_to_use_for_tracks is not None
@@ -587,19 +219,19 @@ def iterate_through_journey_patterns_and_run_insert_queries(
             == journey_pattern_info["journey_pattern_ref"]
         ):
             route_ref_for_tracks = journey_pattern_info["route_ref"]
-            link_refs_for_tracks = list(
-                map(lambda link: link.get("route_link_ref", None), links)
-            )
+            link_refs_for_tracks = [link.route_link_ref for link in links]
 
             centre_stop = (
-                links[len(links) // 2]["from_atco_code"] if len(links) > 0 else None
+                links[len(links) // 2].from_atco_code if len(links) > 0 else None
             )
 
+    insert_into_txc_journey_pattern_link_table(cursor, link_rows)
+
     if admin_area_codes:
         insert_admin_area_codes(cursor, admin_area_codes, operator_service_id)
 
     if centre_stop:
-        stop_location = get_stop_location_by_atco_code(cursor, centre_stop)
+        stop_location = stop_resolver.get_stop_location(centre_stop)
 
         if stop_location:
             insert_centre_point(cursor, stop_location, operator_service_id)
@@ -607,18 +239,6 @@ def iterate_through_journey_patterns_and_run_insert_queries(
     return route_ref_for_tracks, link_refs_for_tracks
 
 
-def get_stop_location_by_atco_code(cursor: Cursor, centre_stop):
-    query = (
-        "SELECT longitude, latitude FROM stops_new WHERE atco_code = %(centre_stop)s"
-    )
-    cursor.execute(
-        query,
-        {"centre_stop": centre_stop},
-    )
-
-    return cursor.fetchone()
-
-
 def insert_centre_point(cursor: Cursor, centre_point, service_id):
     query = "UPDATE services_new SET centre_point_lon = %(centre_point_lon)s, centre_point_lat = %(centre_point_lat)s WHERE id = %(service_id)s"
     cursor.execute(
@@ -637,118 +257,161 @@ def insert_admin_area_codes(cursor: Cursor, area_codes, service_id):
     cursor.executemany(query, [(service_id, code) for code in area_codes])
 
 
-def get_admin_area_codes(cursor: Cursor, stop_codes: set):
-    query = "SELECT DISTINCT localities.administrative_area_code from localities_new as localities INNER JOIN stops_new AS stops ON localities.nptg_locality_code = stops.nptg_locality_code WHERE stops.atco_code = ANY(%s)"
+JOURNEY_PATTERN_COLUMNS = (
+    "id",
+    "operator_service_id",
+    "destination_display",
+    "direction",
+    "route_ref",
+    "journey_pattern_ref",
+    "section_refs",
+)
 
-    cursor.execute(query, [list(stop_codes)])
 
-    result = cursor.fetchall()
-    admin_area_codes = list(sum(result, ())) if result and len(result) > 0 else list()
+def join_section_refs(journey_pattern: dict) -> str:
+    return "".join(sorted(journey_pattern["journey_pattern_section_refs"]))
 
-    return admin_area_codes
 
+def get_journey_pattern_row(
+    journey_pattern_id, operator_service_id, journey_pattern: dict
+) -> tuple:
+    journey_pattern_info = journey_pattern["journey_pattern_info"]
+
+    return (
+        journey_pattern_id,
+        operator_service_id,
+        journey_pattern_info["destination_display"],
+        journey_pattern_info["direction"],
+        journey_pattern_info["route_ref"],
+        journey_pattern_info["journey_pattern_ref"],
+        join_section_refs(journey_pattern),
+    )
 
-def insert_into_txc_journey_pattern_table(
-    cursor: Cursor,
-    operator_service_id,
-    journey_pattern_info,
-    joined_section_refs,
-):
-    query = """
-        INSERT INTO service_journey_patterns_new (operator_service_id, destination_display, direction, route_ref, journey_pattern_ref, section_refs)
-        VALUES (
-            %(op_service_id)s,
-            %(destination_display)s,
-            %(direction)s,
-            %(route_ref)s,
-            %(journey_pattern_ref)s,
-            %(section_refs)s
-        )
-        ON CONFLICT DO NOTHING
-        RETURNING id
-    """
+
+def reserve_journey_pattern_ids(cursor: Cursor, count: int) -> list:
+    """Take a block of ids from the identity sequence of the journey patterns
+    table, so that link rows can be built before their patterns are written."""
+    if count == 0:
+        return []
 
     cursor.execute(
-        query,
-        {
-            "op_service_id": operator_service_id,
-            "destination_display": journey_pattern_info["destination_display"],
-            "direction": journey_pattern_info["direction"],
-            "route_ref": journey_pattern_info["route_ref"],
-            "journey_pattern_ref": journey_pattern_info["journey_pattern_ref"],
-            "section_refs": joined_section_refs,
-        },
+        "SELECT nextval(pg_get_serial_sequence('service_journey_patterns_new', 'id')) FROM generate_series(1, %(count)s)",
+        {"count": count},
+    )
+
+    return [row[0] for row in cursor.fetchall()]
+
+
+def insert_into_txc_journey_pattern_table(cursor: Cursor, rows: list) -> set:
+    """Write journey patterns with reserved ids in one statement and return
+    the ids that were inserted. Patterns already present are skipped and
+    their reserved ids go unused."""
+    if not rows:
+        return set()
+
+    inserted_rows = insert_rows(
+        cursor,
+        "service_journey_patterns_new",
+        JOURNEY_PATTERN_COLUMNS,
+        rows,
+        returning="id",
+        on_conflict="DO NOTHING",
     )
 
-    row = cursor.fetchone()
+    return {row[0] for row in inserted_rows}
+
+
+VEHICLE_JOURNEY_COLUMNS = (
+    "operator_service_id",
+    "vehicle_journey_code",
+    "service_ref",
+    "line_ref",
+    "journey_pattern_ref",
+    "departure_time",
+    "journey_code",
+    "operational_for_today",
+    "operating_calendar",
+    "operating_calendar_start_date",
+)
 
-    return row[0] if row else None
+JOURNEY_PATTERN_LINK_COLUMNS = (
+    "journey_pattern_id",
+    "from_atco_code",
+    "from_timing_status",
+    "from_sequence_number",
+    "to_atco_code",
+    "to_timing_status",
+    "to_sequence_number",
+    "runtime",
+    "order_in_sequence",
+)
+
+# Leading JourneyPatternTimingLink fields written as link columns
+LINK_COLUMN_FIELDS = JourneyPatternTimingLink._fields.index("route_link_ref")
+
+SERVICE_TRACK_COLUMNS = ("operator_service_id", "geometry_hash")
+
+TRACK_GEOMETRY_COLUMNS = ("geometry_hash", "polyline", "point_count")
+
+
+def get_vehicle_journey_row(
+    vehicle_journey: VehicleJourney, operator_service_id
+) -> tuple:
+    return (operator_service_id, *vehicle_journey)
 
 
 def insert_into_txc_vehicle_journey_table(
     cursor: Cursor,
-    vehicle_journeys_info,
+    vehicle_journeys: list,
     operator_service_id,
 ):
-    values = [
-        {
-            "vehicle_journey_code": vehicle_journey_info["vehicle_journey_code"],
-            "service_ref": vehicle_journey_info["service_ref"],
-            "line_ref": vehicle_journey_info["line_ref"],
-            "journey_pattern_ref": vehicle_journey_info["journey_pattern_ref"],
-            "departure_time": vehicle_journey_info["departure_time"],
-            "journey_code": vehicle_journey_info["journey_code"],
-            "operator_service_id": operator_service_id,
-            "operational_for_today": vehicle_journey_info["operational_for_today"],
-        }
-        for vehicle_journey_info in vehicle_journeys_info
+    rows = [
+        get_vehicle_journey_row(vehicle_journey, operator_service_id)
+        for vehicle_journey in vehicle_journeys
     ]
 
-    query = """
-          INSERT INTO vehicle_journeys_new (
-              vehicle_journey_code, service_ref, line_ref, journey_pattern_ref, 
-              departure_time, journey_code, operator_service_id, operational_for_today
-          ) VALUES (
-              %(vehicle_journey_code)s, %(service_ref)s, %(line_ref)s, %(journey_pattern_ref)s, 
-              %(departure_time)s, %(journey_code)s, %(operator_service_id)s, %(operational_for_today)s
-          )
-      """
-    cursor.executemany(query, values)
+    bulk_insert(cursor, "vehicle_journeys_new", VEHICLE_JOURNEY_COLUMNS, rows)
 
 
-def insert_into_txc_journey_pattern_link_table(
-    cursor: Cursor, links, journey_pattern_id
-):
-    values = [
-        {
-            "journey_pattern_id": journey_pattern_id,
-            "from_atco_code": link["from_atco_code"],
-            "from_timing_status": link["from_timing_status"],
-            "from_sequence_number": link["from_sequence_number"],
-            "to_atco_code": link["to_atco_code"],
-            "to_timing_status": link["to_timing_status"],
-            "to_sequence_number": link["to_sequence_number"],
-            "run_time": link["run_time"],
-            "order": order,
-        }
+def get_journey_pattern_link_rows(links, journey_pattern_id) -> list:
+    return [
+        (journey_pattern_id, *link[:LINK_COLUMN_FIELDS], order)
         for order, link in enumerate(links)
     ]
-    query = """INSERT INTO service_journey_pattern_links_new (journey_pattern_id, from_atco_code, from_timing_status, from_sequence_number,
-        to_atco_code, to_timing_status, to_sequence_number, runtime, order_in_sequence) VALUES (%(journey_pattern_id)s, %(from_atco_code)s, %(from_timing_status)s, %(from_sequence_number)s, %(to_atco_code)s, %(to_timing_status)s, %(to_sequence_number)s, %(run_time)s, %(order)s)"""
-    cursor.executemany(query, values)
 
 
-def insert_into_txc_operator_service_table(
-    cursor: Cursor,
-    operator,
-    service,
-    line,
-    region_code,
-    data_source,
-    file_path,
-    cloudwatch,
-    logger,
-):
+def insert_into_txc_journey_pattern_link_table(cursor: Cursor, rows: list):
+    bulk_insert(
+        cursor,
+        "service_journey_pattern_links_new",
+        JOURNEY_PATTERN_LINK_COLUMNS,
+        rows,
+    )
+
+
+OPERATOR_SERVICE_COLUMNS = (
+    "noc_code",
+    "line_name",
+    "line_id",
+    "start_date",
+    "end_date",
+    "operator_short_name",
+    "inbound_direction_description",
+    "outbound_direction_description",
+    "service_description",
+    "service_code",
+    "region_code",
+    "data_source",
+    "origin",
+    "destination",
+    "mode",
+    "file_path",
+)
+
+
+def build_operator_service_row(
+    operator, service, line, region_code, data_source, file_path
+) -> dict:
     (
         noc_code,
         start_date,
@@ -763,112 +426,218 @@ def insert_into_txc_operator_service_table(
         mode,
     ) = extract_data_for_txc_operator_service_table(operator, service, line)
 
-    query = """INSERT INTO services_new (noc_code, line_name, line_id, start_date, end_date, operator_short_name, inbound_direction_description, outbound_direction_description, service_description, service_code, region_code, data_source, origin, destination, mode, file_path)
-        VALUES (%(noc_code)s, %(line_name)s, %(line_id)s, %(start_date)s, %(end_date)s, %(operator_short_name)s, %(inbound_direction_description)s, %(outbound_direction_description)s, %(service_description)s, %(service_code)s, %(region_code)s, %(data_source)s, %(origin)s, %(destination)s, %(mode)s, %(file_path)s) RETURNING id"""
-
     line_id = line.get("@id", "")
     line_name = line.get("LineName", "")
 
     if not line.get("@id") or (mode != "bus" and data_source == "tnds"):
         line_id = create_unique_line_id(noc_code, line_name)
 
-    try:
-        cursor.execute(
-            query,
-            {
-                "noc_code": noc_code,
-                "line_name": line_name,
-                "line_id": line_id,
-                "start_date": start_date,
-                "end_date": end_date,
-                "operator_short_name": operator_short_name,
-                "inbound_direction_description": inbound_direction_description,
-                "outbound_direction_description": outbound_direction_description,
-                "service_description": service_description,
-                "service_code": service_code,
-                "region_code": region_code,
-                "data_source": data_source,
-                "origin": origin,
-                "destination": destination,
-                "mode": mode,
-                "file_path": file_path,
-            },
-        )
+    return {
+        "noc_code": noc_code,
+        "line_name": line_name,
+        "line_id": line_id,
+        "start_date": start_date,
+        "end_date": end_date,
+        "operator_short_name": operator_short_name,
+        "inbound_direction_description": inbound_direction_description,
+        "outbound_direction_description": outbound_direction_description,
+        "service_description": service_description,
+        "service_code": service_code,
+        "region_code": region_code,
+        "data_source": data_source,
+        "origin": origin,
+        "destination": destination,
+        "mode": mode,
+        "file_path": file_path,
+    }
 
-        return cursor.fetchone()[0]
-    except IntegrityError as e:
-        if e.args[1] == NOC_INTEGRITY_ERROR_MSG:
-            logger.info(
-                f"NOC not found in database - '{noc_code}' - '{operator_short_name}'"
-            )
-            put_metric_data_by_data_source(cloudwatch, data_source, "InvalidNoc", 1)
-            return None
-        raise e
 
+OPERATOR_SERVICE_KEY_COLUMNS = (
+    "noc_code",
+    "line_name",
+    "service_code",
+    "start_date",
+    "end_date",
+    "data_source",
+)
 
-def check_txc_line_exists(
-    cursor: Cursor,
-    operator,
-    service,
-    line,
-    data_source,
-    cloudwatch,
-    logger,
-):
-    (
+
+def get_operator_service_key(row: dict) -> tuple:
+    return tuple(row[column] for column in OPERATOR_SERVICE_KEY_COLUMNS)
+
+
+def parse_service_date(value):
+    if isinstance(value, str):
+        try:
+            # xs:date may carry a timezone after the date
+            return datetime.date.fromisoformat(value[:10])
+        except ValueError:
+            return value
+
+    return value
+
+
+def get_comparable_operator_service_key(key: tuple) -> tuple:
+    """Compare keys of a file with keys returned by services_new, which
+    holds its dates as dates rather than TXC strings."""
+    noc_code, line_name, service_code, start_date, end_date, data_source = key
+
+    return (
         noc_code,
-        start_date,
-        end_date,
-        operator_short_name,
-        inbound_direction_description,
-        outbound_direction_description,
-        service_description,
+        line_name,
         service_code,
-        origin,
-        destination,
-        mode,
-    ) = extract_data_for_txc_operator_service_table(operator, service, line)
+        parse_service_date(start_date),
+        parse_service_date(end_date),
+        data_source,
+    )
+
+
+def insert_into_txc_operator_service_table(cursor: Cursor, rows: list) -> dict:
+    if not rows:
+        return {}
+
+    inserted_rows = insert_rows(
+        cursor,
+        "services_new",
+        OPERATOR_SERVICE_COLUMNS,
+        [tuple(row[column] for column in OPERATOR_SERVICE_COLUMNS) for row in rows],
+        returning=f"id, {', '.join(OPERATOR_SERVICE_KEY_COLUMNS)}",
+    )
+
+    # RETURNING rows are not guaranteed to follow the VALUES order, so each
+    # id is matched to its line by the key returned with it
+    ids_by_key = {
+        get_comparable_operator_service_key(tuple(key)): operator_service_id
+        for operator_service_id, *key in inserted_rows
+    }
+
+    operator_service_ids = {}
+    for row in rows:
+        key = get_operator_service_key(row)
+        operator_service_id = ids_by_key.get(get_comparable_operator_service_key(key))
+
+        if operator_service_id is not None:
+            operator_service_ids[key] = operator_service_id
 
-    query = """
-        SELECT id FROM services_new
-        WHERE noc_code IS NOT DISTINCT FROM %(noc_code)s AND line_name IS NOT DISTINCT FROM %(line_name)s AND service_code IS NOT DISTINCT FROM %(service_code)s AND start_date IS NOT DISTINCT FROM %(start_date)s AND end_date IS NOT DISTINCT FROM %(end_date)s AND data_source IS NOT DISTINCT FROM %(data_source)s
-        LIMIT 1
+    return operator_service_ids
+
+
+def check_txc_lines_exist(cursor: Cursor, rows: list, logger) -> dict:
+    if not rows:
+        return {}
+
+    query = f"""
+        SELECT candidate.ordinal, (
+            SELECT id FROM services_new
+            WHERE noc_code IS NOT DISTINCT FROM candidate.noc_code AND line_name IS NOT DISTINCT FROM candidate.line_name AND service_code IS NOT DISTINCT FROM candidate.service_code AND start_date IS NOT DISTINCT FROM candidate.start_date::date AND end_date IS NOT DISTINCT FROM candidate.end_date::date AND data_source IS NOT DISTINCT FROM candidate.data_source
+            LIMIT 1
+        )
+        FROM (VALUES {", ".join(["(%s, %s, %s, %s, %s, %s, %s)"] * len(rows))})
+            AS candidate (ordinal, noc_code, line_name, service_code, start_date, end_date, data_source)
     """
 
-    line_name = line.get("LineName", "")
     cursor.execute(
         query,
-        {
-            "noc_code": noc_code,
-            "line_name": line_name,
-            "service_code": service_code,
-            "start_date": start_date,
-            "end_date": end_date,
-            "data_source": data_source,
-        },
+        [
+            value
+            for ordinal, row in enumerate(rows)
+            for value in (ordinal, *get_operator_service_key(row))
+        ],
     )
-    result = cursor.fetchone()
 
-    operator_service_id = result[0] if result and len(result) > 0 else None
-    if operator_service_id:
+    existing_ids = {}
+    for ordinal, operator_service_id in cursor.fetchall():
+        if not operator_service_id:
+            continue
+
+        row = rows[ordinal]
         logger.info(
-            f"Existing line found - '{noc_code}' - '{line_name}' - '{service_code}' - '{start_date}' - '{data_source}'"
+            f"Existing line found - '{row['noc_code']}' - '{row['line_name']}' - '{row['service_code']}' - '{row['start_date']}' - '{row['data_source']}'"
+        )
+        existing_ids[get_operator_service_key(row)] = operator_service_id
+
+    return existing_ids
+
+
+def resolve_operator_service_ids(
+    cursor: Cursor,
+    operator_service_lines: list,
+    noc_codes: frozenset,
+    region_code,
+    data_source,
+    file_path,
+    metrics,
+    logger,
+) -> dict:
+    """Find or create the services_new row of every line in a file.
+
+    All lines are looked up in one query and the missing ones are inserted
+    in a second, so the number of round trips does not grow with the
+    number of lines. Lines sharing a key resolve to the same row.
+
+    Lines of operators whose NOC is not in noc_codes are left unresolved
+    without any query being sent for them.
+    """
+    rows_by_key = {}
+    unknown_operators = {}
+    for operator, service, line in operator_service_lines:
+        row = build_operator_service_row(
+            operator, service, line, region_code, data_source, file_path
+        )
+        if row["noc_code"] not in noc_codes:
+            unknown_operators.setdefault(row["noc_code"], row["operator_short_name"])
+            continue
+        rows_by_key.setdefault(get_operator_service_key(row), row)
+
+    if unknown_operators:
+        for noc_code, operator_short_name in unknown_operators.items():
+            logger.info(
+                f"NOC not found in database - '{noc_code}' - '{operator_short_name}'"
+            )
+        put_metric_data(metrics, "InvalidNoc", 1)
+
+    operator_service_ids = check_txc_lines_exist(
+        cursor, list(rows_by_key.values()), logger
+    )
+
+    operator_service_ids.update(
+        insert_into_txc_operator_service_table(
+            cursor,
+            [
+                row
+                for line_key, row in rows_by_key.items()
+                if line_key not in operator_service_ids
+            ],
         )
-    return operator_service_id
+    )
 
+    return operator_service_ids
 
-def check_file_has_usable_data(data: dict, service: dict) -> bool:
+
+def collect_operator_service_lines(document: TxcDocument, operators: list) -> list:
+    if not document.has_vehicle_journeys:
+        return []
+
+    return [
+        (operator, service, line)
+        for operator in operators
+        if "NationalOperatorCode" in operator
+        for service in document.get_services_for_operator(operator)
+        for line in get_lines_for_service(service)
+    ]
+
+
+def check_file_has_usable_data(document: TxcDocument, service: dict) -> bool:
     def service_has_journey_patterns(service: dict) -> bool:
         return "JourneyPattern" in service.get("StandardService")  # type: ignore
 
-    def data_has_journey_pattern_sections(data: dict) -> bool:
-        return "JourneyPatternSections" in data.get("TransXChange")  # type: ignore
-
-    def journey_pattern_sections_has_journey_pattern_section(data: dict) -> bool:
-        return "JourneyPatternSection" in data.get("TransXChange", {}).get("JourneyPatternSections")  # type: ignore
+    def document_has_journey_pattern_sections(document: TxcDocument) -> bool:
+        return len(document.journey_pattern_sections_by_id) > 0
 
-    def all_journey_pattern_sections_are_not_empty(data: dict, service: dict) -> bool:
-        journey_patterns = collect_journey_patterns(data, service)
+    def all_journey_pattern_sections_are_not_empty(
+        document: TxcDocument, service: dict
+    ) -> bool:
+        journey_patterns = document.collect_journey_patterns(service)
         for jp in journey_patterns:
             for jps in jp.get("journey_pattern_sections"):
                 # if the journey_pattern_section is empty
@@ -878,125 +647,105 @@ def check_file_has_usable_data(data: dict, service: dict) -> bool:
 
     return (
         service_has_journey_patterns(service)
-        and data_has_journey_pattern_sections(data)
-        and journey_pattern_sections_has_journey_pattern_section(data)
-        and all_journey_pattern_sections_are_not_empty(data, service)
+        and document_has_journey_pattern_sections(document)
+        and all_journey_pattern_sections_are_not_empty(document, service)
     )
 
 
-def insert_into_txc_tracks_table(cursor: Cursor, tracks, operator_service_id):
-    batched_tracks = [tracks[i : i + 200] for i in range(0, len(tracks), 200)]
-
-    for batch in batched_tracks:
-
-        values = [
-            {
-                "operator_service_id": operator_service_id,
-                "longitude": track["longitude"],
-                "latitude": track["latitude"],
-            }
-            for track in batch
-        ]
-
-        query = """INSERT INTO tracks_new (operator_service_id, longitude, latitude) VALUES (%(operator_service_id)s, %(longitude)s, %(latitude)s)"""
-        cursor.executemany(query, values)
+def collect_service_track(service_tracks: dict, tracks, operator_service_id):
+    """Add the encoded track of a service to the tracks of its file. A
+    service keeps the first track collected for it."""
+    polyline, point_count = encode_polyline(tracks)
 
+    if point_count:
+        service_tracks.setdefault(
+            operator_service_id, (get_geometry_hash(polyline), polyline, point_count)
+        )
 
-def extract_coordinates(location):
-    """Extract longitude and latitude from a location or translation."""
-    translation = location.get("Translation", None)
-    if translation is None:
-        longitude = location.get("Longitude", None)
-        latitude = location.get("Latitude", None)
-    else:
-        longitude = translation.get("Longitude", None)
-        latitude = translation.get("Latitude", None)
-    return longitude, latitude
 
+def insert_into_txc_tracks_table(cursor: Cursor, service_tracks: dict):
+    """Write the geometries of a file that no file of the load has written
+    yet, then point each service at its geometry.
 
-def collect_track_data(route_sections, route_section_refs, link_refs):
-    routes = []
+    Other containers may write the same geometries in the same load, and
+    wait on each other's uncommitted rows until commit. Each table gets one
+    insert sorted by its unique key, so two files always take those locks in
+    the same order and cannot deadlock.
+    """
+    geometries = {
+        geometry_hash: (polyline, point_count)
+        for geometry_hash, polyline, point_count in service_tracks.values()
+    }
+    new_geometry_hashes = sorted(
+        geometry_hash
+        for geometry_hash in geometries
+        if not track_geometry_cache.contains(geometry_hash)
+    )
 
-    for ref in route_section_refs:
-        route_section = next(
-            (item for item in route_sections if item["@id"] == ref), None
+    if new_geometry_hashes:
+        insert_rows(
+            cursor,
+            "track_geometries_new",
+            TRACK_GEOMETRY_COLUMNS,
+            [
+                (geometry_hash, *geometries[geometry_hash])
+                for geometry_hash in new_geometry_hashes
+            ],
+            on_conflict="(geometry_hash) DO NOTHING",
         )
+        for geometry_hash in new_geometry_hashes:
+            track_geometry_cache.add(geometry_hash)
 
-        if route_section is not None:
-            route_links = route_section.get("RouteLink", None)
+    track_geometry_cache.file_stats["written"] += len(new_geometry_hashes)
+    track_geometry_cache.file_stats["reused"] += len(service_tracks) - len(
+        new_geometry_hashes
+    )
 
-            if route_links is not None:
-                route_links_list = make_list(route_links)
+    if service_tracks:
+        insert_rows(
+            cursor,
+            "service_tracks_new",
+            SERVICE_TRACK_COLUMNS,
+            [
+                (operator_service_id, service_tracks[operator_service_id][0])
+                for operator_service_id in sorted(service_tracks)
+            ],
+            on_conflict="(operator_service_id) DO NOTHING",
+        )
 
-                for link_ref in link_refs:
-                    route_link = next(
-                        (item for item in route_links_list if item["@id"] == link_ref),
-                        None,
-                    )
 
-                    if route_link is not None:
-                        trackData = route_link.get("Track", None)
+def select_route_and_collect_track(
+    service_tracks: dict,
+    document: TxcDocument,
+    operator_service_id: str,
+    route_ref: str,
+    link_refs: list,
+    tolerance_metres: float = 0.0,
+) -> tuple:
+    """Collect the track of a route, simplified to within tolerance_metres of
+    the original line when it is above 0.
+
+    Returns the number of points collected and the number kept.
+    """
+    route_section_refs = document.get_route_section_refs(route_ref)
 
-                        if trackData is not None:
-                            tracks = (
-                                trackData
-                                if isinstance(trackData, list)
-                                else [trackData]
-                            )
-                            for track in tracks:
-                                mapping = track["Mapping"]
-                                if mapping is not None:
-                                    locations = make_list(mapping["Location"])
-                                    if locations is not None:
-                                        for location in locations:
-                                            longitude, latitude = extract_coordinates(
-                                                location
-                                            )
-                                            if (
-                                                longitude is not None
-                                                and latitude is not None
-                                            ):
-                                                routes.append(
-                                                    {
-                                                        "longitude": longitude,
-                                                        "latitude": latitude,
-                                                    }
-                                                )
-
-    clean_routes = [k for k, g in itertools.groupby(routes)]
-
-    return clean_routes
-
-
-def select_route_and_run_insert_query(
-    cursor, data: dict, operator_service_id: str, route_ref: str, link_refs: list
-):
-    routes = (
-        None
-        if data["TransXChange"].get("Routes", None) is None
-        else make_list(data["TransXChange"]["Routes"]["Route"])
-    )
-    route_sections = (
-        None
-        if data["TransXChange"].get("RouteSections", None) is None
-        else make_list(data["TransXChange"]["RouteSections"]["RouteSection"])
-    )
+    if route_section_refs is None:
+        return 0, 0
 
-    if routes is not None:
-        route_section_refs = next(
-            (item for item in routes if item["@id"] == route_ref), None
-        ).get("RouteSectionRef", None)
+    tracks = document.collect_track_data(route_section_refs, link_refs)
+    simplified_tracks = simplify_track(tracks, tolerance_metres)
+    if simplified_tracks:
+        collect_service_track(service_tracks, simplified_tracks, operator_service_id)
 
-        if route_section_refs is not None:
-            tracks = collect_track_data(
-                route_sections, make_list(route_section_refs), link_refs
-            )
-            if tracks:
-                insert_into_txc_tracks_table(cursor, tracks, operator_service_id)
+    return len(tracks), len(simplified_tracks)
 
 
 def format_vehicle_journeys(
-    vehicle_journeys: list, line_id: str, bank_holidays, service
+    vehicle_journeys: list,
+    line_id: str,
+    bank_holidays,
+    service,
+    vehicle_journeys_by_line: Optional[dict] = None,
 ):
     service_operating_profile = (
         service["OperatingProfile"] if "OperatingProfile" in service else None
@@ -1004,42 +753,19 @@ def format_vehicle_journeys(
     service_operating_period = (
         service["OperatingPeriod"] if "OperatingPeriod" in service else None
     )
-    vehicle_journey_refs = [
-        journey["VehicleJourneyRef"]
-        for journey in vehicle_journeys
-        if journey["LineRef"] == line_id
-        and "JourneyPatternRef" not in journey
-        and "VehicleJourneyRef" in journey
-        and "LineRef" in journey
-    ]
-    vehicle_journeys_for_line = [
-        journey
-        for journey in vehicle_journeys
-        if "JourneyPatternRef" in journey
-        and (
-            ("LineRef" in journey and journey["LineRef"] == line_id)
-            or (
-                "VehicleJourneyCode" in journey
-                and journey["VehicleJourneyCode"] in vehicle_journey_refs
-            )
+    if vehicle_journeys_by_line is None:
+        vehicle_journeys_by_line = partition_vehicle_journeys_by_line(
+            vehicle_journeys
         )
-    ]
+    vehicle_journeys_for_line = vehicle_journeys_by_line.get(line_id, [])
 
     vehicle_journeys_data = []
     journey_pattern_count = {}
+    today = datetime.date.today()
+    horizon_days = get_operating_calendar_horizon_days()
 
     for vehicle_journey in vehicle_journeys_for_line:
-        journey_pattern_ref = (
-            vehicle_journey["JourneyPatternRef"]
-            if "JourneyPatternRef" in vehicle_journey
-            else None
-        )
-
-        if journey_pattern_ref not in journey_pattern_count:
-            if journey_pattern_ref is not None:
-                journey_pattern_count[journey_pattern_ref] = 1
-        else:
-            journey_pattern_count[journey_pattern_ref] += 1
+        count_journey_pattern(journey_pattern_count, vehicle_journey)
 
         vehicle_journeys_data.append(
             collect_vehicle_journey(
@@ -1047,14 +773,124 @@ def format_vehicle_journeys(
                 bank_holidays,
                 service_operating_profile,
                 service_operating_period,
+                today,
+                horizon_days,
             )
         )
 
-    journey_pattern_to_use = (
-        max(journey_pattern_count) if journey_pattern_count else None
+    return vehicle_journeys_data, get_journey_pattern_to_use(journey_pattern_count)
+
+
+def count_journey_pattern(journey_pattern_count: dict, vehicle_journey: dict):
+    journey_pattern_ref = (
+        vehicle_journey["JourneyPatternRef"]
+        if "JourneyPatternRef" in vehicle_journey
+        else None
     )
 
-    return vehicle_journeys_data, journey_pattern_to_use
+    if journey_pattern_ref not in journey_pattern_count:
+        if journey_pattern_ref is not None:
+            journey_pattern_count[journey_pattern_ref] = 1
+    else:
+        journey_pattern_count[journey_pattern_ref] += 1
+
+
+def get_journey_pattern_to_use(journey_pattern_count: dict):
+    return max(journey_pattern_count) if journey_pattern_count else None
+
+
+def collect_line_targets(
+    document: TxcDocument,
+    operator_service_lines: list,
+    operator_service_ids: dict,
+    region_code,
+    data_source,
+    file_path,
+) -> dict:
+    """Map each usable line id to the services_new rows its journeys belong to."""
+    line_targets = {}
+    for operator, service, line in operator_service_lines:
+        operator_service_id = operator_service_ids.get(
+            get_operator_service_key(
+                build_operator_service_row(
+                    operator, service, line, region_code, data_source, file_path
+                )
+            )
+        )
+
+        if operator_service_id and check_file_has_usable_data(document, service):
+            line_targets.setdefault(line["@id"], []).append(
+                (operator_service_id, service)
+            )
+
+    return line_targets
+
+
+def insert_streamed_vehicle_journeys(
+    cursor: Cursor,
+    document: TxcDocument,
+    vehicle_journey_stream: VehicleJourneyStream,
+    line_targets: dict,
+    bank_holidays,
+    batch_size: int = VEHICLE_JOURNEY_BATCH_SIZE,
+    timer: Optional[StageTimer] = None,
+) -> dict:
+    """Write vehicle journeys as they are read from the file.
+
+    Rows are flushed every batch_size journeys so that only one batch is
+    held in memory. Returns the journey pattern counts of each line, which
+    the journey pattern and track inserts need once streaming has finished.
+    """
+    referencing_lines = get_referencing_lines(document.vehicle_journeys)
+    today = datetime.date.today()
+    horizon_days = get_operating_calendar_horizon_days()
+    journey_pattern_counts = {}
+    rows = []
+
+    def handle_vehicle_journey(vehicle_journey):
+        nonlocal rows
+
+        if "JourneyPatternRef" not in vehicle_journey:
+            return
+
+        for line_id in get_vehicle_journey_lines(vehicle_journey, referencing_lines):
+            if line_id not in line_targets:
+                continue
+
+            count_journey_pattern(
+                journey_pattern_counts.setdefault(line_id, {}), vehicle_journey
+            )
+
+            for operator_service_id, service in line_targets[line_id]:
+                rows.append(
+                    get_vehicle_journey_row(
+                        collect_vehicle_journey(
+                            vehicle_journey,
+                            bank_holidays,
+                            service.get("OperatingProfile"),
+                            service.get("OperatingPeriod"),
+                            today,
+                            horizon_days,
+                        ),
+                        operator_service_id,
+                    )
+                )
+
+        if len(rows) >= batch_size:
+            flush()
+
+    def flush():
+        nonlocal rows
+
+        bulk_insert(cursor, "vehicle_journeys_new", VEHICLE_JOURNEY_COLUMNS, rows)
+        if timer is not None:
+            timer.count("VehicleJourneys", rows=len(rows))
+        rows = []
+
+    vehicle_journey_stream.for_each(handle_vehicle_journey)
+    flush()
+
+    return journey_pattern_counts
 
 
 def write_to_database(
@@ -1064,182 +900,275 @@ def write_to_database(
     key: str,
     db_connection: Connection,
     logger,
-    cloudwatch,
+    metrics,
     bank_holiday_json,
+    vehicle_journey_stream: Optional[VehicleJourneyStream] = None,
+    timer: Optional[StageTimer] = None,
 ):
+    timer = timer or StageTimer()
+    track_tolerance_metres = get_track_simplify_tolerance_metres()
+
     try:
-        operators = get_operators(data, data_source, cloudwatch)
+        document = TxcDocument(
+            data, vehicle_journey_stream.count if vehicle_journey_stream else None
+        )
+        operators = document.get_operators()
 
         if not operators:
             logger.info(f"No operator data found in TXC file: '{key}'")
-            put_metric_data_by_data_source(cloudwatch, data_source, "NoOperatorData", 1)
+            put_metric_data(metrics, "NoOperatorData", 1)
 
             return False
 
-        with db_connection.cursor() as cursor:
+        with open_cursor(db_connection, logger, key) as cursor:
             file_has_nocs: bool = False
             file_has_services: bool = False
             file_has_lines: bool = False
             file_has_useable_data: bool = False
             file_has_vehicle_journeys: bool = False
+            # Written together once the file is known to be useable
+            service_tracks = {}
 
-            for operator in operators:
-                if "NationalOperatorCode" not in operator:
-                    logger.info(
-                        f"No NOC found for operator: '{operator.get('OperatorShortName', '')}', in TXC file: '{key}'"
-                    )
-                    continue
-                file_has_nocs = True
-                valid_noc = True
-
-                services = get_services_for_operator(data, operator)
-                vehicle_journeys = get_vehicle_journeys(data)
-                noc = operator.get("NationalOperatorCode", "")
-                if not services:
-                    logger.info(
-                        f"No service data found for operator: '{noc}', in TXC file: '{key}'"
-                    )
-                    continue
-                file_has_services = True
+            with timer.span("Stops"):
+                stop_resolver = StopResolver.load(cursor, document.stop_codes)
 
-                if not vehicle_journeys:
-                    logger.info(
-                        f"No vehicle journey data found for operator: '{noc}', in TXC file: '{key}'"
-                    )
-                    continue
-
-                file_has_vehicle_journeys = True
+            with timer.span("Tracks"):
+                track_geometry_cache.start_file(cursor)
 
-                for service in services:
-                    route_ref_for_tracks = None
-                    link_refs_for_tracks = None
-                    if not valid_noc:
-                        break
+            with timer.span("OperatorServices"):
+                operator_service_lines = collect_operator_service_lines(
+                    document, operators
+                )
+                operator_service_ids = resolve_operator_service_ids(
+                    cursor,
+                    operator_service_lines,
+                    noc_cache.get_noc_codes(cursor),
+                    region_code,
+                    data_source,
+                    key,
+                    metrics,
+                    logger,
+                )
+            timer.count("OperatorServices", rows=len(operator_service_lines))
+
+            if vehicle_journey_stream is not None:
+                with timer.span("VehicleJourneys"):
+                    streamed_journey_pattern_counts = insert_streamed_vehicle_journeys(
+                        cursor,
+                        document,
+                        vehicle_journey_stream,
+                        collect_line_targets(
+                            document,
+                            operator_service_lines,
+                            operator_service_ids,
+                            region_code,
+                            data_source,
+                            key,
+                        ),
+                        bank_holiday_json,
+                        timer=timer,
+                    )
 
-                    lines = get_lines_for_service(service)
-                    if not lines:
+            with timer.span("ServiceLoop"):
+                for operator in operators:
+                    if "NationalOperatorCode" not in operator:
                         logger.info(
-                            f"No line data found for service: '{service.get('ServiceCode', '')}', for operator: '{noc}', in TXC file: '{key}'"
+                            f"No NOC found for operator: '{operator.get('OperatorShortName', '')}', in TXC file: '{key}'"
                         )
                         continue
-                    file_has_lines = True
+                    file_has_nocs = True
+                    valid_noc = True
 
-                    operator_service_id = None
-
-                    for line in lines:
-                        operator_service_id = check_txc_line_exists(
-                            cursor,
-                            operator,
-                            service,
-                            line,
-                            data_source,
-                            cloudwatch,
-                            logger,
+                    services = document.get_services_for_operator(operator)
+                    noc = operator.get("NationalOperatorCode", "")
+                    if not services:
+                        logger.info(
+                            f"No service data found for operator: '{noc}', in TXC file: '{key}'"
                         )
-                        if not operator_service_id:
-                            operator_service_id = (
-                                insert_into_txc_operator_service_table(
-                                    cursor,
-                                    operator,
-                                    service,
-                                    line,
-                                    region_code,
-                                    data_source,
-                                    key,
-                                    cloudwatch,
-                                    logger,
-                                )
-                            )
-                        if not operator_service_id:
-                            valid_noc = False
-                            break
-
-                        line_id = line["@id"]
+                        continue
+                    file_has_services = True
 
-                        (
-                            vehicle_journeys_for_line,
-                            journey_pattern_to_use_for_tracks,
-                        ) = format_vehicle_journeys(
-                            vehicle_journeys, line_id, bank_holiday_json, service
+                    if not document.has_vehicle_journeys:
+                        logger.info(
+                            f"No vehicle journey data found for operator: '{noc}', in TXC file: '{key}'"
                         )
+                        continue
 
-                        file_has_useable_data = check_file_has_usable_data(
-                            data, service
-                        )
+                    file_has_vehicle_journeys = True
 
-                        if file_has_useable_data:
-                            (
-                                route_ref_for_tracks,
-                                link_refs_for_tracks,
-                            ) = iterate_through_journey_patterns_and_run_insert_queries(
-                                cursor,
-                                data,
-                                operator_service_id,
-                                service,
-                                vehicle_journeys_for_line,
-                                journey_pattern_to_use_for_tracks,
-                                logger,
+                    for service in services:
+                        route_ref_for_tracks = None
+                        link_refs_for_tracks = None
+                        if not valid_noc:
+                            break
+
+                        lines = get_lines_for_service(service)
+                        if not lines:
+                            logger.info(
+                                f"No line data found for service: '{service.get('ServiceCode', '')}', for operator: '{noc}', in TXC file: '{key}'"
+                            )
+                            continue
+                        file_has_lines = True
+
+                        operator_service_id = None
+
+                        for line in lines:
+                            operator_service_id = operator_service_ids.get(
+                                get_operator_service_key(
+                                    build_operator_service_row(
+                                        operator,
+                                        service,
+                                        line,
+                                        region_code,
+                                        data_source,
+                                        key,
+                                    )
+                                )
                             )
+                            if not operator_service_id:
+                                valid_noc = False
+                                break
+
+                            line_id = line["@id"]
+
+                            if vehicle_journey_stream is None:
+                                with timer.span("VehicleJourneys"):
+                                    (
+                                        vehicle_journeys_for_line,
+                                        journey_pattern_to_use_for_tracks,
+                                    ) = format_vehicle_journeys(
+                                        document.vehicle_journeys,
+                                        line_id,
+                                        bank_holiday_json,
+                                        service,
+                                        document.vehicle_journeys_by_line,
+                                    )
+                                journey_pattern_refs = {
+                                    vehicle_journey.journey_pattern_ref
+                                    for vehicle_journey in vehicle_journeys_for_line
+                                }
+                            else:
+                                # Streamed journeys are already written, only
+                                # their journey patterns are needed here
+                                journey_pattern_count = (
+                                    streamed_journey_pattern_counts.get(line_id, {})
+                                )
+                                journey_pattern_refs = journey_pattern_count.keys()
+                                journey_pattern_to_use_for_tracks = (
+                                    get_journey_pattern_to_use(journey_pattern_count)
+                                )
 
-                            insert_into_txc_vehicle_journey_table(
-                                cursor, vehicle_journeys_for_line, operator_service_id
+                            file_has_useable_data = check_file_has_usable_data(
+                                document, service
                             )
 
-                    if route_ref_for_tracks and link_refs_for_tracks:
-                        select_route_and_run_insert_query(
-                            cursor,
-                            data,
-                            operator_service_id,
-                            route_ref_for_tracks,
-                            link_refs_for_tracks,
-                        )
+                            if file_has_useable_data:
+                                with timer.span("JourneyPatterns"):
+                                    (
+                                        route_ref_for_tracks,
+                                        link_refs_for_tracks,
+                                    ) = iterate_through_journey_patterns_and_run_insert_queries(
+                                        cursor,
+                                        document,
+                                        operator_service_id,
+                                        service,
+                                        journey_pattern_refs,
+                                        journey_pattern_to_use_for_tracks,
+                                        logger,
+                                        stop_resolver,
+                                    )
+                                timer.count(
+                                    "JourneyPatterns", rows=len(journey_pattern_refs)
+                                )
+
+                                if vehicle_journey_stream is None:
+                                    with timer.span("VehicleJourneys"):
+                                        insert_into_txc_vehicle_journey_table(
+                                            cursor,
+                                            vehicle_journeys_for_line,
+                                            operator_service_id,
+                                        )
+                                    timer.count(
+                                        "VehicleJourneys",
+                                        rows=len(vehicle_journeys_for_line),
+                                    )
+
+                        if route_ref_for_tracks and link_refs_for_tracks:
+                            with timer.span("Tracks"):
+                                (
+                                    collected_track_count,
+                                    track_count,
+                                ) = select_route_and_collect_track(
+                                    service_tracks,
+                                    document,
+                                    operator_service_id,
+                                    route_ref_for_tracks,
+                                    link_refs_for_tracks,
+                                    track_tolerance_metres,
+                                )
+                            timer.count("Tracks", rows=track_count)
+
+                            if track_tolerance_metres and collected_track_count:
+                                # One value per service, so CloudWatch statistics
+                                # show the spread of points before and after
+                                put_metric_data(
+                                    metrics,
+                                    "TrackPointsBeforeSimplification",
+                                    collected_track_count,
+                                )
+                                put_metric_data(
+                                    metrics,
+                                    "TrackPointsAfterSimplification",
+                                    track_count,
+                                )
 
+            logger.info(
+                f"Journey pattern transforms for TXC file: '{key}' - {document.journey_pattern_stats}"
+            )
             if not file_has_nocs:
                 logger.info(f"No NOCs found in TXC file: '{key}'")
 
                 db_connection.rollback()
-                put_metric_data_by_data_source(
-                    cloudwatch, data_source, "NoNOCsInFile", 1
-                )
+                put_metric_data(metrics, "NoNOCsInFile", 1)
                 return False
 
             if not file_has_services:
                 logger.info(f"No service data found in TXC file: '{key}'")
 
                 db_connection.rollback()
-                put_metric_data_by_data_source(
-                    cloudwatch, data_source, "NoServiceDataInFile", 1
-                )
+                put_metric_data(metrics, "NoServiceDataInFile", 1)
                 return False
 
             if not file_has_vehicle_journeys:
                 logger.info(f"No vehicle journeys data found in TXC file: '{key}'")
 
                 db_connection.rollback()
-                put_metric_data_by_data_source(
-                    cloudwatch, data_source, "NoVehicleJourneysDataInFile", 1
-                )
+                put_metric_data(metrics, "NoVehicleJourneysDataInFile", 1)
                 return False
 
             if not file_has_lines:
                 logger.info(f"No line data found in TXC file: '{key}'")
 
                 db_connection.rollback()
-                put_metric_data_by_data_source(
-                    cloudwatch, data_source, "NoLineDataInFile", 1
-                )
+                put_metric_data(metrics, "NoLineDataInFile", 1)
                 return False
 
             if not file_has_useable_data:
                 logger.info(f"No useable data found in TXC file: '{key}'")
 
                 db_connection.rollback()
-                put_metric_data_by_data_source(
-                    cloudwatch, data_source, "NoUseableDataInFile", 1
-                )
+                put_metric_data(metrics, "NoUseableDataInFile", 1)
                 return False
 
-            db_connection.commit()
+            with timer.span("Tracks"):
+                insert_into_txc_tracks_table(cursor, service_tracks)
+            logger.info(
+                f"Track geometries for TXC file: '{key}' - {track_geometry_cache.file_stats}"
+            )
+
+            with timer.span("Commit"):
+                db_connection.commit()
+            track_geometry_cache.commit()
             return True
 
     except Exception as e:
@@ -1250,42 +1179,134 @@ def write_to_database(
         raise e
 
 
-def download_from_s3_and_write_to_db(
-    s3,
-    cloudwatch,
-    bucket,
-    key,
+def log_stage_timings(timer: StageTimer, key: str, metrics: Metrics, logger):
+    """Log where the time went for one file and add the stages to the
+    invocation's metrics, tagged with the file for Logs Insights queries."""
+    logger.info(
+        f"Stage timings for TXC file: '{key}' - {json.dumps(timer.summary())}"
+    )
+    timer.put_metrics(metrics)
+    metrics.add_metadata(key="file", value=key)
+
+
+def get_data_source_and_region_code(key: str) -> tuple:
+    """Read the data source, and the region of TNDS files, from an object key
+    of the form <prefix>/<data source>/<region>/<file>."""
+    data_source = key.split("/")[1]
+    region_code = key.split("/")[2] if data_source == "tnds" else None
+
+    return data_source, region_code
+
+
+def parse_txc_source(source):
+    if get_txc_parser_engine() == "lxml":
+        return extract_txc(source)
+
+    return parse_txc(source)
+
+
+def write_txc_file_to_db(
     file_path,
+    size: int,
+    key: str,
     db_connection: Connection,
     logger,
+    metrics,
     bank_holiday_json,
-):
-    s3.download_file(bucket, key, file_path)
-    logger.info(f"Downloaded S3 file, '{key}' to '{file_path}'")
-
-    tree = eT.parse(file_path)
-    xml_data = tree.getroot()
-    xml_string = eT.tostring(xml_data, encoding="utf-8", method="xml")
-    xmltodict_namespaces = {"http://www.transxchange.org.uk/": None}
-    data_dict = xmltodict.parse(
-        xml_string, process_namespaces=True, namespaces=xmltodict_namespaces
-    )
+    timer: StageTimer,
+) -> bool:
+    """Parse a TXC file on local disk and write it to the database.
 
-    data_source = key.split("/")[1]
-    region_code = key.split("/")[2] if data_source == "tnds" else None
+    Vehicle journeys of files above the streaming threshold are read from
+    the file in batches while they are written instead of being parsed up
+    front.
+    """
+    data_source, region_code = get_data_source_and_region_code(key)
+    add_data_source_dimension(metrics, data_source)
+
+    if size > get_streaming_threshold_bytes():
+        logger.info(f"Streaming vehicle journeys of large TXC file: '{key}'")
+        with timer.span("Parse"):
+            data_dict, vehicle_journey_stream = parse_txc_for_streaming(file_path)
+    else:
+        with timer.span("Parse"):
+            data_dict = parse_txc_source(file_path)
+        vehicle_journey_stream = None
+    timer.count("Parse", bytes=size)
 
     logger.info("Starting write to database...")
-    written_success = write_to_database(
+    return write_to_database(
         data_dict,
         region_code,
         data_source,
         key,
         db_connection,
         logger,
-        cloudwatch,
+        metrics,
         bank_holiday_json,
+        vehicle_journey_stream,
+        timer=timer,
     )
 
+
+def download_from_s3_and_write_to_db(
+    s3,
+    metrics,
+    bucket,
+    key,
+    file_path,
+    db_connection: Connection,
+    logger,
+    bank_holiday_json,
+):
+    data_source, region_code = get_data_source_and_region_code(key)
+    add_data_source_dimension(metrics, data_source)
+
+    timer = StageTimer()
+
+    try:
+        size = s3.head_object(Bucket=bucket, Key=key)["ContentLength"]
+
+        if size > get_streaming_threshold_bytes():
+            # Vehicle journeys are read in a second pass, so large files are kept on disk
+            with timer.span("Download"):
+                s3.download_file(bucket, key, file_path)
+            timer.count("Download", bytes=size)
+            logger.info(f"Downloaded S3 file, '{key}' to '{file_path}'")
+
+            written_success = write_txc_file_to_db(
+                file_path,
+                size,
+                key,
+                db_connection,
+                logger,
+                metrics,
+                bank_holiday_json,
+                timer,
+            )
+        else:
+            # The parser consumes the object while later ranges are still
+            # arriving, so the download is timed as part of the parse
+            with timer.span("Parse"), open_s3_object(s3, bucket, key, size) as source:
+                data_dict = parse_txc_source(source)
+            timer.count("Parse", bytes=size)
+            logger.info(f"Read S3 file, '{key}' into memory")
+
+            logger.info("Starting write to database...")
+            written_success = write_to_database(
+                data_dict,
+                region_code,
+                data_source,
+                key,
+                db_connection,
+                logger,
+                metrics,
+                bank_holiday_json,
+                timer=timer,
+            )
+    finally:
+        log_stage_timings(timer, key, metrics, logger)
+
     if written_success:
         logger.info(
             f"SUCCESS! Successfully wrote contents of '{key}' from '{bucket}' bucket to database."
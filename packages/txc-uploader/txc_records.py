@@ -0,0 +1,39 @@
+import datetime
+import sys
+from typing import NamedTuple, Optional
+
+
+def intern_string(value):
+    """Intern refs and codes that repeat across a file so that each distinct
+    value is stored once, however many records point at it."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class JourneyPatternTimingLink(NamedTuple):
+    # Fields up to run_time are in the column order of service_journey_pattern_links
+    from_atco_code: str
+    from_timing_status: Optional[str]
+    from_sequence_number: Optional[str]
+    to_atco_code: str
+    to_timing_status: Optional[str]
+    to_sequence_number: Optional[str]
+    run_time: Optional[str]
+    route_link_ref: Optional[str]
+
+
+class VehicleJourney(NamedTuple):
+    # Fields are in the column order of vehicle_journeys after operator_service_id
+    vehicle_journey_code: Optional[str]
+    service_ref: Optional[str]
+    line_ref: Optional[str]
+    journey_pattern_ref: Optional[str]
+    departure_time: Optional[str]
+    journey_code: Optional[str]
+    operational_for_today: bool
+    operating_calendar: int
+    operating_calendar_start_date: datetime.date
+
+
+class TrackPoint(NamedTuple):
+    longitude: str
+    latitude: str
@@ -0,0 +1,23 @@
+import { Kysely } from "kysely";
+
+/**
+ * @param db {Kysely<any>}
+ */
+export async function up(db) {
+    await db.schema
+        .alterTable("vehicle_journeys")
+        .addColumn("operating_calendar", "bigint")
+        .addColumn("operating_calendar_start_date", "date")
+        .execute();
+}
+
+/**
+ * @param db {Kysely<any>}
+ */
+export async function down(db) {
+    await db.schema
+        .alterTable("vehicle_journeys")
+        .dropColumn("operating_calendar")
+        .dropColumn("operating_calendar_start_date")
+        .execute();
+}
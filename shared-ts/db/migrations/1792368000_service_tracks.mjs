@@ -0,0 +1,43 @@
+import { Kysely } from "kysely";
+
+/**
+ * @param db {Kysely<any>}
+ */
+export async function up(db) {
+    await db.schema
+        .createTable("track_geometries")
+        .addColumn("id", "integer", (col) => col.primaryKey().generatedByDefaultAsIdentity())
+        .addColumn("geometry_hash", "text", (col) => col.notNull())
+        .addColumn("polyline", "text", (col) => col.notNull())
+        .addColumn("point_count", "integer", (col) => col.notNull())
+        .execute();
+
+    await db.schema
+        .createIndex("idx_track_geometries_geometry_hash")
+        .unique()
+        .on("track_geometries")
+        .column("geometry_hash")
+        .execute();
+
+    await db.schema
+        .createTable("service_tracks")
+        .addColumn("id", "integer", (col) => col.primaryKey().generatedByDefaultAsIdentity())
+        .addColumn("operator_service_id", "integer", (col) => col.notNull())
+        .addColumn("geometry_hash", "text", (col) => col.notNull())
+        .execute();
+
+    await db.schema
+        .createIndex("idx_service_tracks_operator_service_id")
+        .unique()
+        .on("service_tracks")
+        .column("operator_service_id")
+        .execute();
+}
+
+/**
+ * @param db {Kysely<any>}
+ */
+export async function down(db) {
+    await db.schema.dropTable("service_tracks").execute();
+    await db.schema.dropTable("track_geometries").execute();
+}
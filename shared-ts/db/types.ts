@@ -42,6 +42,12 @@ export interface Database {
     tracks: TracksTable;
     tracksNew?: TracksTable;
     tracksOld?: TracksTable;
+    serviceTracks: ServiceTracksTable;
+    serviceTracksNew?: ServiceTracksTable;
+    serviceTracksOld?: ServiceTracksTable;
+    trackGeometries: TrackGeometriesTable;
+    trackGeometriesNew?: TrackGeometriesTable;
+    trackGeometriesOld?: TrackGeometriesTable;
     nptgAdminAreas: NptgAdminAreasTable;
     nptgAdminAreasNew?: NptgAdminAreasTable;
     nptgAdminAreasOld?: NptgAdminAreasTable;
@@ -326,6 +332,8 @@ export interface VehicleJourneysTable {
     journeyCode: string | null;
     operatorServiceId: number | null;
     operationalForToday: boolean;
+    operatingCalendar: string | null;
+    operatingCalendarStartDate: string | null;
 }
 
 export type VehicleJourneyDB = Selectable<VehicleJourneysTable>;
@@ -372,6 +380,27 @@ export type TrackDB = Selectable<TracksTable>;
 export type NewTrackDB = Insertable<TracksTable>;
 export type TrackUpdateDB = Updateable<TracksTable>;
 
+export interface ServiceTracksTable {
+    id: Generated<number>;
+    operatorServiceId: number;
+    geometryHash: string;
+}
+
+export type ServiceTrackDB = Selectable<ServiceTracksTable>;
+export type NewServiceTrackDB = Insertable<ServiceTracksTable>;
+export type ServiceTrackUpdateDB = Updateable<ServiceTracksTable>;
+
+export interface TrackGeometriesTable {
+    id: Generated<number>;
+    geometryHash: string;
+    polyline: string;
+    pointCount: number;
+}
+
+export type TrackGeometryDB = Selectable<TrackGeometriesTable>;
+export type NewTrackGeometryDB = Insertable<TrackGeometriesTable>;
+export type TrackGeometryUpdateDB = Updateable<TrackGeometriesTable>;
+
 export interface NptgAdminAreasTable {
     id: Generated<number>;
     administrativeAreaCode: string;
@@ -381,6 +381,11 @@ export const RefDataStepFunctionStack = ({ stack }: StackContext) => {
                 DATABASE_PORT_PARAM: `/sst/create-disruptions-data/${stack.stage}/Secret/DB_PORT/value`,
                 DATABASE_PASSWORD_PARAM: `/sst/create-disruptions-data/${stack.stage}/Secret/DB_PASSWORD/value`,
                 BANK_HOLIDAYS_BUCKET_NAME: bankHolidaysBucket.bucketName,
+                OPERATING_CALENDAR_HORIZON_DAYS: "60",
+                TXC_STREAMING_THRESHOLD_BYTES: "52428800",
+                TXC_PARSER_ENGINE: "xmltodict",
+                TXC_DB_PROFILE: "false",
+                TXC_TRACK_SIMPLIFY_TOLERANCE_METRES: "0",
             },
             permissions: [
                 new PolicyStatement({